@@ -0,0 +1,137 @@
+# anten_cekirdek.py
+"""
+Anten Tasarım Çekirdeği (arayüzsüz)
+Monopol, dipol ve Yagi-Uda boyut hesapları ile amatör bant tablosu. Yalnızca
+standart kütüphaneye bağlıdır; tkinter, matplotlib veya numpy içe aktarmaz.
+Arayüz (anten_tasarim.py) ve toplu işlem aracı (toplu_tasarim.py) bu modülü kullanır.
+"""
+import math
+import re
+
+C = 299792458.0 # Işık hızı (m/s)
+
+BANTLAR = {
+    "160m (1.8-2.0 MHz)": 1.9,
+    "80m (3.5-4.0 MHz)": 3.75,
+    "40m (7.0-7.3 MHz)": 7.15,
+    "30m (10.1-10.15 MHz)": 10.125,
+    "20m (14.0-14.35 MHz)": 14.175,
+    "17m (18.068-18.168 MHz)": 18.118,
+    "15m (21.0-21.45 MHz)": 21.225,
+    "12m (24.89-24.99 MHz)": 24.94,
+    "10m (28-29.7 MHz)": 28.85,
+    "6m (50-54 MHz)": 52.0,
+    "2m (144-146 MHz)": 145.0,
+    "70cm (430-440 MHz)": 435.0,
+    "23cm (1240-1300 MHz)": 1270.0
+}
+
+
+# "2m (144-146 MHz)" biçimindeki bant adlarından sınırlar
+_BAND_RE = re.compile(r"\(([\d.]+)-([\d.]+)\s*MHz\)")
+
+
+def band_edges(band_name):
+    """Bant adından (f_min, f_max) MHz; bulunamazsa None."""
+    m = _BAND_RE.search(band_name)
+    if not m:
+        return None
+    return float(m.group(1)), float(m.group(2))
+
+
+def bant_frekansi(bant):
+    """
+    Bant adından merkez frekans (MHz). Tam ad ("2m (144-146 MHz)"), kısa ad ("2m")
+    veya doğrudan sayı kabul edilir; bulunamazsa ValueError.
+    """
+    if isinstance(bant, (int, float)):
+        return float(bant)
+    bant = str(bant).strip()
+    if bant in BANTLAR:
+        return BANTLAR[bant]
+    for ad, frekans in BANTLAR.items():
+        if ad.split(" ")[0].lower() == bant.lower():
+            return frekans
+    try:
+        return float(bant)
+    except ValueError:
+        raise ValueError(f"Bilinmeyen bant: {bant}") from None
+
+
+# cap_m parametresi eklendi, kısaltma faktörü (k) çapa göre ayarlandı.
+def monopol_hesapla(frekans_mhz, cap_m):
+    f = frekans_mhz*1e6
+    lam = C/f
+
+    # Basit Kısaltma Faktörü Modeli: Kalınlık kısaltma ihtiyacını artırır
+    ratio = lam / cap_m
+    k = 0.985 - 0.005 * math.log10(ratio) # Çap etkisini içeren heuristik
+
+    uzun = (lam/4.0) * k
+    return {"tip":"Monopol","frekans":frekans_mhz,"dalga_boyu":lam,"uzunluk":uzun,"empedans":36.5,
+            "kazanc":5.0,"cap_m":cap_m,"aciklama":f"1/4 dalga monopol (k={k:.3f}, Çap: {cap_m*1000:.1f}mm)"}
+
+# cap_m parametresi eklendi, kısaltma faktörü (k) çapa göre ayarlandı.
+def dipol_hesapla(frekans_mhz, cap_m):
+    f = frekans_mhz*1e6
+    lam = C/f
+
+    # Basit Kısaltma Faktörü Modeli:
+    ratio = lam / cap_m
+    k = 0.985 - 0.005 * math.log10(ratio)
+
+    efek = (lam/2.0) * k
+    return {"tip":"Dipol","frekans":frekans_mhz,"dalga_boyu":lam,"uzunluk":efek,"empedans":73,
+            "kazanc":2.15,"cap_m":cap_m,"aciklama":f"Yarım dalga dipol (k={k:.3f}, Çap: {cap_m*1000:.1f}mm)"}
+
+# cap_m parametresi eklendi ve hesaplamada kullanıldı
+def yagi_uda_hesapla(frekans_mhz, eleman_sayisi,
+                     aktif_factor=0.48, reflektor_factor=1.03,
+                     direktor_base_factor=0.46,
+                     ref_aktif_factor=0.20, aktif_dir_factor=0.18,
+                     cap_m=0.004, # cap_m varsayılan değerle eklendi
+                     direktor_uzunluklari=None, direktor_mesafeleri=None,
+                     aktif_uzunluk=None, reflektor_uzunluk=None):
+    # direktor_uzunluklari / direktor_mesafeleri (metre) verilirse her direktör
+    # için doğrudan kullanılır (ör. optimize_yagi_de sonucu); mesafeler
+    # aktif-D1, D1-D2, ... sırasıyladır. aktif_uzunluk / reflektor_uzunluk da
+    # fiziksel boydur: verilen uzunluklara kısaltma faktörü (k) uygulanmaz.
+    f = frekans_mhz*1e6
+    lam = C/f
+
+    # Kısaltma faktörünü hesapla (basitleştirilmiş)
+    ratio = lam / cap_m
+    k = 0.985 - 0.005 * math.log10(ratio)
+
+    # Aktif eleman ve Reflektör uzunlukları (kısaltma faktörü ile)
+    aktif = (aktif_factor * lam) * k if aktif_uzunluk is None else aktif_uzunluk
+    reflektor = reflektor_factor * aktif if reflektor_uzunluk is None else reflektor_uzunluk
+
+    # Direktör uzunlukları
+    direktor_base = (direktor_base_factor * lam) * k
+    direktor_sayisi = max(0, eleman_sayisi-2)
+    direktorler = []
+    if direktor_uzunluklari is not None:
+        direktorler = list(direktor_uzunluklari)
+        direktor_sayisi = len(direktorler)
+        eleman_sayisi = direktor_sayisi + 2
+    else:
+        for i in range(direktor_sayisi):
+            fakt = 1.0 - 0.015*(i+1)
+            direktorler.append(direktor_base * fakt)
+
+    # Aralıklar aynı kaldı (çapa bağlı değil)
+    ref_aktif_mesafe = ref_aktif_factor * lam
+    aktif_dir_mesafe = aktif_dir_factor * lam
+    mesafeler = {"ref_aktif":ref_aktif_mesafe,"aktif_dir":aktif_dir_mesafe}
+    if direktor_mesafeleri:
+        mesafeler["direktörler"] = list(direktor_mesafeleri)
+        mesafeler["aktif_dir"] = mesafeler["direktörler"][0]
+
+    elemanlar = {"reflektör":reflektor,"aktif":aktif,"direktörler":direktorler}
+    kazanc = 7.0 + 0.8 * direktor_sayisi
+    emp = 50
+    return {"tip":"Yagi-Uda","frekans":frekans_mhz,"dalga_boyu":lam,"eleman_sayisi":eleman_sayisi,
+            "elemanlar":elemanlar,"mesafeler":mesafeler,
+            "empedans":emp,"kazanc":kazanc,"cap_m":cap_m,
+            "aciklama":f"{eleman_sayisi} elemanlı Yagi-Uda (yaklaşık, Çap: {cap_m*1000:.1f}mm)"}
@@ -0,0 +1,207 @@
+# anten_cizim.py
+"""
+Anten Görselleştirme
+Tek bir kalıcı figür ve tuval üzerinde çalışır. Her hesaplamada yeni figür kurmak
+yerine çizgi ve yazı nesneleri bir havuzdan alınır ve set_data/set_text ile
+güncellenir; kullanılmayanlar gizlenir. Eksen sınırları, başlık ve tuval boyutu
+değişmediyse yalnızca anten nesneleri yeniden çizilir (blitting); değiştiyse tuval
+tam çizilir ve arka plan yeniden yakalanır. Yerleşim görünümünün yanında, tasarımda
+ışıma deseni ('desen') varsa E ve H düzlemi kesitleri kutupsal olarak çizilir.
+"""
+import numpy as np
+
+# Kutupsal desen ölçeği: tepeye göre normalize dB, bu değerin altı merkezde
+DESEN_TABANI_DB = -30.0
+
+# Havuzdan alınan nesnelerin varsayılan stilleri (önceki çizimden stil kalmasın diye)
+_CIZGI_STILI = {"color": "tab:blue", "linewidth": 2, "linestyle": "-", "zorder": 2}
+_YAZI_STILI = {"ha": "center", "fontsize": 10, "rotation": 0, "color": "black"}
+
+
+class AntenCizimi:
+    """
+    fig: matplotlib Figure, canvas: figürün tuvali (TkAgg veya Agg).
+    guncelle(sonuclar) tasarım sözlüğünü çizer; tam_cizim ve blit_cizim sayaçları
+    kaç güncellemenin tam çizim, kaçının blitting ile yapıldığını gösterir.
+    """
+
+    def __init__(self, fig, canvas):
+        self.fig = fig
+        self.canvas = canvas
+        gs = fig.add_gridspec(2, 2, width_ratios=(2.2, 1))
+        self.ax = fig.add_subplot(gs[:, 0])
+        self._desen_cizgileri = []
+        for i, baslik in enumerate(("E düzlemi (x-z)", "H düzlemi (x-y)")):
+            pax = fig.add_subplot(gs[i, 1], projection="polar")
+            pax.set_title(baslik, fontsize=9)
+            pax.set_rlim(0, -DESEN_TABANI_DB)
+            pax.set_rticks([10, 20, 30])
+            pax.set_yticklabels(["-20", "-10", "0 dB"], fontsize=7)
+            pax.tick_params(axis="x", labelsize=7)
+            cizgi, = pax.plot([], [], color="tab:blue", linewidth=1.5, animated=True)
+            self._desen_cizgileri.append(cizgi)
+        self.ax.set_xlabel("Uzunluk (cm)")
+        self.ax.set_ylabel("Yükseklik (cm) (gösterim sıkıştırıldı)")
+        self.ax.grid(True, alpha=0.35)
+        self._cizgiler = []
+        self._yazilar = []
+        self._cizgi_sayisi = 0
+        self._yazi_sayisi = 0
+        # Besleme noktası
+        self._besleme, = self.ax.plot([], [], "o", color="red", markersize=7, zorder=5, animated=True)
+        self._arka_plan = None
+        self._son_gorunum = None
+        self.tam_cizim = 0
+        self.blit_cizim = 0
+        canvas.mpl_connect("draw_event", self._cizildi)
+
+    # --- nesne havuzu ---
+    def _cizgi(self, xs, ys, **stil):
+        if self._cizgi_sayisi == len(self._cizgiler):
+            cizgi, = self.ax.plot([], [], animated=True)
+            self._cizgiler.append(cizgi)
+        cizgi = self._cizgiler[self._cizgi_sayisi]
+        self._cizgi_sayisi += 1
+        cizgi.set_data(xs, ys)
+        cizgi.set(visible=True, **{**_CIZGI_STILI, **stil})
+
+    def _yazi(self, x, y, metin, **stil):
+        if self._yazi_sayisi == len(self._yazilar):
+            self._yazilar.append(self.ax.text(0, 0, "", animated=True))
+        yazi = self._yazilar[self._yazi_sayisi]
+        self._yazi_sayisi += 1
+        yazi.set_position((x, y))
+        yazi.set_text(metin)
+        yazi.set(visible=True, **{**_YAZI_STILI, **stil})
+
+    def _hareketliler(self):
+        yield from self._cizgiler[:self._cizgi_sayisi]
+        yield from self._yazilar[:self._yazi_sayisi]
+        yield self._besleme
+        yield from self._desen_cizgileri
+
+    # --- çizim ---
+    def guncelle(self, sonuclar):
+        self._cizgi_sayisi = 0
+        self._yazi_sayisi = 0
+        tip = sonuclar['tip']
+        if tip == "Monopol":
+            self._monopol_gorsel(sonuclar)
+        elif tip == "Dipol":
+            self._dipol_gorsel(sonuclar)
+        elif tip == "Yagi-Uda":
+            self._yagi_gorsel(sonuclar)
+        for nesne in self._cizgiler[self._cizgi_sayisi:] + self._yazilar[self._yazi_sayisi:]:
+            nesne.set_visible(False)
+        self._desen_gorsel(sonuclar.get('desen'))
+        baslik = f"{sonuclar['tip']} Anten Tasarımı - {sonuclar['frekans']} MHz"
+        self.ax.set_title(baslik)
+
+        gorunum = (self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_aspect(),
+                   baslik, tuple(self.fig.bbox.bounds))
+        if self._arka_plan is not None and gorunum == self._son_gorunum:
+            self._blit()
+        else:
+            # Tam çizim; arka plan draw_event içinde yeniden yakalanır
+            self._son_gorunum = gorunum
+            self._arka_plan = None
+            self.tam_cizim += 1
+            self.canvas.draw_idle()
+
+    def _cizildi(self, event):
+        self._arka_plan = self.canvas.copy_from_bbox(self.fig.bbox)
+        for nesne in self._hareketliler():
+            self.fig.draw_artist(nesne)
+
+    def _blit(self):
+        self.blit_cizim += 1
+        self.canvas.restore_region(self._arka_plan)
+        for nesne in self._hareketliler():
+            self.fig.draw_artist(nesne)
+        self.canvas.blit(self.fig.bbox)
+
+    def _desen_gorsel(self, desen):
+        # Kutupsal eksen sınırları sabit; yalnızca veri değişir (blitting bozulmaz)
+        for cizgi, kesit in zip(self._desen_cizgileri, ("e_plane", "h_plane")):
+            if not desen:
+                cizgi.set_visible(False)
+                continue
+            aci = np.radians(desen[kesit]["angle_deg"])
+            r = np.maximum(desen[kesit]["gain_dbi"] - desen["peak_gain"], DESEN_TABANI_DB) - DESEN_TABANI_DB
+            cizgi.set_data(np.append(aci, aci[0]), np.append(r, r[0]))
+            cizgi.set_visible(True)
+
+    def _monopol_gorsel(self, sonuclar):
+        ax = self.ax
+        uzun_cm = sonuclar['uzunluk']*100
+        self._cizgi([0,0],[0,uzun_cm],linewidth=5)
+        self._cizgi([-40,40],[0,0],linewidth=2, color='tab:gray', linestyle='--') # Zemin/Karşı ağırlık
+        self._besleme.set(data=([0],[0]), markersize=7) # Besleme noktası
+        ax.set_xlim(-60,60)
+        ax.set_ylim(-20, max(uzun_cm+20,50))
+        ax.set_aspect('equal', adjustable='box')
+        self._yazi(0, uzun_cm+5, f"L={uzun_cm:.2f} cm")
+
+    def _dipol_gorsel(self, sonuclar):
+        ax = self.ax
+        toplam_cm = sonuclar['uzunluk']*100
+        yari = toplam_cm/2.0
+        self._cizgi([-yari,0],[0,0],linewidth=5, color='tab:blue')
+        self._cizgi([0,yari],[0,0],linewidth=5, color='tab:blue')
+        self._besleme.set(data=([0],[0]), markersize=7) # Besleme noktası
+        ax.set_xlim(-yari*1.3,yari*1.3)
+        ax.set_ylim(-max(10,yari*0.2), max(10,yari*0.2))
+        ax.set_aspect('equal', adjustable='box')
+        self._yazi(0, max(10,yari*0.2)*0.8, f"Toplam L={toplam_cm:.2f} cm")
+
+    def _yagi_gorsel(self, sonuclar):
+        ax = self.ax
+        ele = sonuclar['elemanlar']
+        ref_aktif = sonuclar['mesafeler']['ref_aktif']*100
+        aktif_dir = sonuclar['mesafeler']['aktif_dir']*100
+
+        pozisyon = []
+        poz_ref = 0.0
+        poz_aktif = poz_ref + ref_aktif
+
+        pozisyon.append(("Reflektör", poz_ref, ele['reflektör']*100))
+        pozisyon.append(("Aktif", poz_aktif, ele['aktif']*100))
+
+        # Direktör başına aralık listesi varsa onu, yoksa sabit aralığı kullan
+        aralar = [m*100 for m in sonuclar['mesafeler'].get('direktörler', [])]
+        current_pos = poz_aktif
+        for i,dlen in enumerate(ele['direktörler']):
+            current_pos += aralar[i] if i < len(aralar) else aktif_dir
+            pozisyon.append((f"Direktör {i+1}", current_pos, dlen*100))
+
+        xs = [p[1] for p in pozisyon]
+        lengths = [p[2] for p in pozisyon]
+        minx, maxx = min(xs)-20, max(xs)+20
+
+        max_x_range = maxx - minx if (maxx - minx) > 0 else 1.0
+        max_len = max(lengths)
+
+        desired_vspan_fraction = 0.25
+        scale_factor = 1.0
+        if max_len > max_x_range * desired_vspan_fraction:
+            scale_factor = max_len / (max_x_range * desired_vspan_fraction)
+
+        # çizim: boom
+        self._cizgi([min(xs)-5, max(xs)+5], [0,0], color='gray', linewidth=2, zorder=1)
+
+        colors = {'Reflektör':'tab:red','Aktif':'tab:blue'}
+        vpad = 0.0
+        for label, xpos, length in pozisyon:
+            hy = (length/2.0) / scale_factor
+            vpad = max(vpad, hy)
+            color = colors.get(label.split()[0],'tab:green')
+            self._cizgi([xpos,xpos], [-hy, hy], linewidth=4, color=color, zorder=2)
+            self._yazi(xpos, hy + 0.05*vpad*scale_factor, f"{label}\n({length:.1f} cm)", fontsize=9, rotation=45, color=color)
+
+        self._besleme.set(data=([poz_aktif],[0]), markersize=7.7)
+        ax.set_xlim(minx-10, maxx+10)
+        ax.set_ylim(-vpad*1.8, vpad*1.8)
+
+        self._yazi(minx+5, -vpad*1.5, "(DİKKAT: Dikey gösterim sıkıştırıldı; etiketler gerçek uzunlukları gösterir)",
+                   ha='left', fontsize=8, color='gray')
+        ax.set_aspect('auto')
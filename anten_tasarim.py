@@ -1,13 +1,18 @@
 # anten_tasarim.py
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import math
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
+import contextlib
+import os
+import queue
+import sys
+import threading
+import time
 
-# Optimize modülünü içe aktar
-from yagi_optimizasyon_modulu import optimize_yagi
+from anten_cekirdek import BANTLAR, C, band_edges, monopol_hesapla, dipol_hesapla, yagi_uda_hesapla
+from onbellek import ResultCache, default_directory, source_version
+
+# matplotlib, numpy, optimizasyon ve MoM modülleri açılışı yavaşlatmamak için ilk
+# kullanımda (veya ilk boyamadan sonra arka planda, bkz. _arka_planda_isit) yüklenir.
 
 
 class AntenTasarimUygulamasi:
@@ -17,23 +22,9 @@ class AntenTasarimUygulamasi:
         self.root.geometry("1150x800")
         self.root.minsize(900, 650)
 
-        self.c = 299792458.0 # Işık hızı (m/s)
-
-        self.bantlar = {
-            "160m (1.8-2.0 MHz)": 1.9,
-            "80m (3.5-4.0 MHz)": 3.75,
-            "40m (7.0-7.3 MHz)": 7.15,
-            "30m (10.1-10.15 MHz)": 10.125,
-            "20m (14.0-14.35 MHz)": 14.175,
-            "17m (18.068-18.168 MHz)": 18.118,
-            "15m (21.0-21.45 MHz)": 21.225,
-            "12m (24.89-24.99 MHz)": 24.94,
-            "10m (28-29.7 MHz)": 28.85,
-            "6m (50-54 MHz)": 52.0,
-            "2m (144-146 MHz)": 145.0,
-            "70cm (430-440 MHz)": 435.0,
-            "23cm (1240-1300 MHz)": 1270.0
-        }
+        self.c = C # Işık hızı (m/s)
+
+        self.bantlar = dict(BANTLAR)
 
         self.anten_tipi = tk.StringVar(value="Dipol")
         self.bant_sec = tk.StringVar(value=list(self.bantlar.keys())[10])
@@ -41,8 +32,54 @@ class AntenTasarimUygulamasi:
         self.vswr = tk.StringVar(value="1.5")
         self.eleman_sayisi = tk.StringVar(value="3")
         self.cap_mm = tk.StringVar(value="4.0") # YENİ: Eleman Çapı (mm)
+        self.son_sonuclar = None # Son gösterilen tasarım (bant taraması için)
+        self._opt_thread = None # Arka planda çalışan optimizasyon
+        # Tasarım/optimizasyon önbelleği; hesap kodu değişince anahtar sürümü de değişir
+        self.onbellek = ResultCache(default_directory(),
+                                    version=source_version(sys.modules[__name__], "anten_cekirdek",
+                                                           "yagi_optimizasyon_modulu", "mom_cozucu",
+                                                           "isima_deseni"))
+        self._cizim = None # Kalıcı figür/tuval (anten_cizim.AntenCizimi), ilk çizimde kurulur
+        self.otomatik = tk.BooleanVar(value=False) # Yazarken otomatik hesapla
+        self.izleme = tk.BooleanVar(value=False) # Optimizasyon izleme (sayaç/süre izi)
+        self._gecikme = None # Bekleyen otomatik hesap (after kimliği)
+        self._agir_is = None # Bekleyen MoM + çizim aşaması (after kimliği)
+        self._canli_girdi = None # Son otomatik hesaplanan girdiler
 
         self._create_widgets()
+        for degisken in (self.anten_tipi, self.frekans, self.cap_mm, self.eleman_sayisi):
+            degisken.trace_add("write", self._girdi_degisti)
+        # Pencere ilk kez çizildikten sonra ağır modülleri ısıt
+        self.root.after(150, self._arka_planda_isit)
+
+    def _arka_planda_isit(self):
+        # İçe aktarmalar ayrı iş parçacığında; tuval Tk nesnesi olduğundan ana iş parçacığında kurulur
+        def isit():
+            import numpy  # noqa: F401
+            import matplotlib.figure  # noqa: F401
+            import matplotlib.backends.backend_tkagg  # noqa: F401
+            import anten_cizim  # noqa: F401
+            import yagi_optimizasyon_modulu  # noqa: F401
+            import mom_cozucu  # noqa: F401
+            import isima_deseni  # noqa: F401
+        t = threading.Thread(target=isit, daemon=True)
+        t.start()
+        self.root.after(50, self._tuvali_hazirla, t)
+
+    def _tuvali_hazirla(self, t):
+        # İçe aktarma bitince tuvali ana iş parçacığında (Tk) oluştur
+        if t.is_alive():
+            self.root.after(50, self._tuvali_hazirla, t)
+            return
+        if self._cizim is None:
+            self._cizim = self._cizim_olustur()
+
+    def _cizim_olustur(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from anten_cizim import AntenCizimi
+        fig = Figure(figsize=(8,5), constrained_layout=True)
+        return AntenCizimi(fig, FigureCanvasTkAgg(fig, self.gorsel_frame))
 
     def _create_widgets(self):
         top = ttk.Frame(self.root, padding=(12,10))
@@ -60,6 +97,9 @@ class AntenTasarimUygulamasi:
         bant_combo = ttk.Combobox(top, textvariable=self.bant_sec, values=list(self.bantlar.keys()), state="readonly", width=30)
         bant_combo.grid(row=1, column=3, sticky="w", padx=(6,12))
         bant_combo.bind('<<ComboboxSelected>>', lambda e: self._bant_degisti())
+        ttk.Checkbutton(top, text="Otomatik Hesapla", variable=self.otomatik,
+                        command=self._girdi_degisti).grid(row=1, column=4, columnspan=2, sticky="w", padx=(12,0))
+        ttk.Checkbutton(top, text="İzleme", variable=self.izleme).grid(row=1, column=6, sticky="w", padx=(12,0))
 
         ttk.Label(top, text="Frekans (MHz):").grid(row=2, column=0, sticky="w", pady=(8,0))
         vcmd_float = (self.root.register(self._validate_float), '%P')
@@ -95,8 +135,28 @@ class AntenTasarimUygulamasi:
         sifirla_btn.grid(row=0, column=1, sticky="e", padx=6)
         about_btn = ttk.Button(btn_frame, text="Hakkında", command=self._hakkinda)
         about_btn.grid(row=0, column=2, sticky="e", padx=6)
-        optimize_btn = ttk.Button(btn_frame, text="Yagi Optimize Et", command=self.yagi_optimize_dialog)
-        optimize_btn.grid(row=0, column=3, sticky="e", padx=6)
+        self.optimize_btn = ttk.Button(btn_frame, text="Yagi Optimize Et", command=self.yagi_optimize_dialog)
+        self.optimize_btn.grid(row=0, column=3, sticky="e", padx=6)
+        self.de_btn = ttk.Button(btn_frame, text="Eleman Bazlı Optimize", command=self.yagi_de_optimize_dialog)
+        self.de_btn.grid(row=0, column=4, sticky="e", padx=6)
+        self.iptal_btn = ttk.Button(btn_frame, text="İptal", command=self.optimizasyonu_iptal, state="disabled")
+        self.iptal_btn.grid(row=0, column=5, sticky="e", padx=6)
+
+        # Analiz işlemleri ayrı satırda (tek satırda pencereyi taşırıyordu)
+        analiz_frame = ttk.LabelFrame(top, text="Analiz", padding=(8,6))
+        analiz_frame.grid(row=4, column=0, columnspan=8, sticky="we", pady=(10,0))
+        tarama_btn = ttk.Button(analiz_frame, text="Bant Taraması", command=self.bant_taramasi)
+        tarama_btn.grid(row=0, column=0, sticky="w", padx=6)
+        desen_btn = ttk.Button(analiz_frame, text="3B Desen", command=self.desen_3b)
+        desen_btn.grid(row=0, column=1, sticky="w", padx=6)
+        self.pareto_btn = ttk.Button(analiz_frame, text="Pareto Cephesi", command=self.yagi_pareto_dialog)
+        self.pareto_btn.grid(row=0, column=2, sticky="w", padx=6)
+        tolerans_btn = ttk.Button(analiz_frame, text="Tolerans Analizi", command=self.tolerans_analizi)
+        tolerans_btn.grid(row=0, column=3, sticky="w", padx=6)
+        istif_btn = ttk.Button(analiz_frame, text="İstifleme", command=self.istifleme)
+        istif_btn.grid(row=0, column=4, sticky="w", padx=6)
+        uyum_btn = ttk.Button(analiz_frame, text="Uyumlama", command=self.empedans_uyumlama)
+        uyum_btn.grid(row=0, column=5, sticky="w", padx=6)
 
 
         main_pane = ttk.Panedwindow(self.root, orient=tk.HORIZONTAL)
@@ -106,7 +166,13 @@ class AntenTasarimUygulamasi:
         left_frame.columnconfigure(0, weight=1)
         main_pane.add(left_frame, weight=1)
         self.sonuc_frame = ttk.LabelFrame(left_frame, text="Tasarım Sonuçları", padding=(8,8))
-        self.sonuc_frame.pack(fill="both", expand=False)
+        self.sonuc_frame.pack(fill="both", expand=True)
+        # Sabit satırlı sonuç tablosu; her hesapta satırlar yerinde güncellenir
+        self.sonuc_agaci = ttk.Treeview(self.sonuc_frame, columns=("deger",), show="tree", selectmode="none")
+        self.sonuc_agaci.column("#0", width=190, stretch=False)
+        self.sonuc_agaci.column("deger", width=220, stretch=True)
+        self.sonuc_agaci.tag_configure("baslik", font=("Segoe UI",10,"bold"))
+        self.sonuc_agaci.pack(fill="both", expand=True)
 
         right_frame = ttk.Frame(main_pane, padding=(8,8))
         right_frame.columnconfigure(0, weight=1)
@@ -124,8 +190,11 @@ class AntenTasarimUygulamasi:
     # ... diğer metotlar (Hakkında, bant_degisti, tipi_degisti, validasyonlar) aynı ...
     
     def _hakkinda(self):
+        ist = self.onbellek.stats()
         messagebox.showinfo("Hakkında",
-            "Anten Tasarım Uygulaması\nBasit hesaplar ve görselleştirme sağlar.\nOptimizasyon: küçük parametrik tarama (heuristik).")
+            "Anten Tasarım Uygulaması\nBasit hesaplar ve görselleştirme sağlar.\nOptimizasyon: kaba-ince parametrik tarama (heuristik).\n\n"
+            f"Önbellek: {ist['memory_hits']} bellek + {ist['disk_hits']} disk isabeti, {ist['misses']} ıska "
+            f"(isabet oranı %{ist['hit_rate']*100:.0f}), disk {ist['disk_bytes']/1024:.0f} KB")
 
     def _bant_degisti(self):
         secili = self.bant_sec.get()
@@ -163,239 +232,235 @@ class AntenTasarimUygulamasi:
         self.eleman_sayisi.set("3")
         self.cap_mm.set("4.0") # YENİ: Çapı sıfırla
         
-        for w in self.sonuc_frame.winfo_children():
-            w.destroy()
-        for w in self.gorsel_frame.winfo_children():
-            w.destroy()
+        self.sonuc_agaci.delete(*self.sonuc_agaci.get_children())
+        # Kalıcı tuval silinmez, yalnızca gizlenir (sonraki çizimde yeniden yerleşir)
+        if self._cizim is not None:
+            self._cizim.canvas.get_tk_widget().pack_forget()
+        self.son_sonuclar = None
+        self._canli_girdi = None
         self.status_var.set("Sıfırlandı")
 
-    def hesapla(self):
-        # 1. Frekans Kontrolü
+    def _girdileri_oku(self):
+        """(tip, frekans_mhz, cap_m, eleman_sayisi) döndürür; geçersiz girişte ValueError(mesaj)."""
         try:
             frekans_mhz = float(self.frekans.get())
-            if frekans_mhz <= 0:
-                raise ValueError
-        except Exception:
-            messagebox.showerror("Hata", "Geçersiz frekans. Lütfen MHz olarak pozitif sayı girin.")
-            return
-
-        # 2. Çap Kontrolü (YENİ)
+        except ValueError:
+            frekans_mhz = 0.0
+        if frekans_mhz <= 0:
+            raise ValueError("Geçersiz frekans. Lütfen MHz olarak pozitif sayı girin.")
         try:
             cap_m = float(self.cap_mm.get()) / 1000.0 # mm'yi metreye çevir
-            if cap_m <= 0:
-                raise ValueError
-        except Exception:
-            messagebox.showerror("Hata", "Geçersiz eleman çapı. Lütfen mm olarak pozitif sayı girin.")
+        except ValueError:
+            cap_m = 0.0
+        if cap_m <= 0:
+            raise ValueError("Geçersiz eleman çapı. Lütfen mm olarak pozitif sayı girin.")
+        tip = self.anten_tipi.get()
+        eleman_sayisi = None
+        if tip == "Yagi-Uda":
+            try:
+                eleman_sayisi = int(self.eleman_sayisi.get())
+            except ValueError:
+                eleman_sayisi = 0
+            if eleman_sayisi < 2:
+                raise ValueError("Yagi-Uda için en az 2 eleman girin.")
+        elif tip not in ("Monopol", "Dipol"):
+            raise ValueError("Bilinmeyen anten tipi.")
+        return tip, frekans_mhz, cap_m, eleman_sayisi
+
+    def _tasarim_anahtari(self, tip, frekans_mhz, cap_m, eleman_sayisi):
+        anahtar_param = {"tip": tip, "frekans": frekans_mhz, "cap_m": cap_m}
+        if tip == "Yagi-Uda":
+            anahtar_param["eleman_sayisi"] = eleman_sayisi
+        return self.onbellek.key("tasarim", anahtar_param)
+
+    def _tasarla(self, tip, frekans_mhz, cap_m, eleman_sayisi):
+        # Kapalı form boyut hesabı (MoM analizi hariç)
+        if tip == "Monopol":
+            return self.monopol_hesapla(frekans_mhz, cap_m)
+        if tip == "Dipol":
+            return self.dipol_hesapla(frekans_mhz, cap_m)
+        return self.yagi_uda_hesapla(frekans_mhz, eleman_sayisi, cap_m=cap_m)
+
+    def hesapla(self):
+        try:
+            girdi = self._girdileri_oku()
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
+            return
+
+        anahtar = self._tasarim_anahtari(*girdi)
+        sonuclar = self.onbellek.get(anahtar)
+        if sonuclar is not None:
+            self.sonuclari_goster(sonuclar)
+            self.anten_gorsel_olustur(sonuclar)
+            self.status_var.set("Hesaplama tamamlandı (önbellekten).")
             return
 
-        tip = self.anten_tipi.get()
         try:
-            if tip == "Monopol":
-                sonuclar = self.monopol_hesapla(frekans_mhz, cap_m) # cap_m'i geçir
-            elif tip == "Dipol":
-                sonuclar = self.dipol_hesapla(frekans_mhz, cap_m) # cap_m'i geçir
-            elif tip == "Yagi-Uda":
-                eleman_sayisi = int(self.eleman_sayisi.get())
-                if eleman_sayisi < 2:
-                    messagebox.showerror("Hata","Yagi-Uda için en az 2 eleman girin.")
-                    return
-                # cap_m'i yagi_uda_hesapla'ya geçir
-                sonuclar = self.yagi_uda_hesapla(frekans_mhz, eleman_sayisi, cap_m=cap_m) 
-            else:
-                messagebox.showerror("Hata","Bilinmeyen anten tipi.")
-                return
+            sonuclar = self._tasarla(*girdi)
         except Exception as e:
             messagebox.showerror("Hesaplama Hatası", str(e))
             return
 
+        self._mom_analizi(sonuclar)
+        self.onbellek.put(anahtar, sonuclar)
         self.sonuclari_goster(sonuclar)
         self.anten_gorsel_olustur(sonuclar)
 
-    # cap_m parametresi eklendi, kısaltma faktörü (k) çapa göre ayarlandı.
-    def monopol_hesapla(self, frekans_mhz, cap_m): 
-        f = frekans_mhz*1e6
-        lam = self.c/f
-        
-        # Basit Kısaltma Faktörü Modeli: Kalınlık kısaltma ihtiyacını artırır
-        ratio = lam / cap_m
-        k = 0.985 - 0.005 * math.log10(ratio) # Çap etkisini içeren heuristik
-        
-        uzun = (lam/4.0) * k
-        return {"tip":"Monopol","frekans":frekans_mhz,"dalga_boyu":lam,"uzunluk":uzun,"empedans":36.5,
-                "kazanc":5.0,"aciklama":f"1/4 dalga monopol (k={k:.3f}, Çap: {cap_m*1000:.1f}mm)"}
-
-    # cap_m parametresi eklendi, kısaltma faktörü (k) çapa göre ayarlandı.
-    def dipol_hesapla(self, frekans_mhz, cap_m): 
-        f = frekans_mhz*1e6
-        lam = self.c/f
-        
-        # Basit Kısaltma Faktörü Modeli:
-        ratio = lam / cap_m
-        k = 0.985 - 0.005 * math.log10(ratio)
-        
-        efek = (lam/2.0) * k
-        return {"tip":"Dipol","frekans":frekans_mhz,"dalga_boyu":lam,"uzunluk":efek,"empedans":73,
-                "kazanc":2.15,"aciklama":f"Yarım dalga dipol (k={k:.3f}, Çap: {cap_m*1000:.1f}mm)"}
-
-    # cap_m parametresi eklendi ve hesaplamada kullanıldı
-    def yagi_uda_hesapla(self, frekans_mhz, eleman_sayisi,
-                          aktif_factor=0.48, reflektor_factor=1.03,
-                          direktor_base_factor=0.46,
-                          ref_aktif_factor=0.20, aktif_dir_factor=0.18,
-                          cap_m=0.004): # cap_m varsayılan değerle eklendi
-        f = frekans_mhz*1e6
-        lam = self.c/f
-        
-        # Kısaltma faktörünü hesapla (basitleştirilmiş)
-        ratio = lam / cap_m
-        k = 0.985 - 0.005 * math.log10(ratio)
-        
-        # Aktif eleman ve Reflektör uzunlukları (kısaltma faktörü ile)
-        aktif = (aktif_factor * lam) * k
-        reflektor = reflektor_factor * aktif
-        
-        # Direktör uzunlukları
-        direktor_base = (direktor_base_factor * lam) * k
-        direktor_sayisi = max(0, eleman_sayisi-2)
-        direktorler = []
-        for i in range(direktor_sayisi):
-            fakt = 1.0 - 0.015*(i+1)
-            direktorler.append(direktor_base * fakt)
-            
-        # Aralıklar aynı kaldı (çapa bağlı değil)
-        ref_aktif_mesafe = ref_aktif_factor * lam
-        aktif_dir_mesafe = aktif_dir_factor * lam
-        
-        elemanlar = {"reflektör":reflektor,"aktif":aktif,"direktörler":direktorler}
-        kazanc = 7.0 + 0.8 * direktor_sayisi
-        emp = 50
-        return {"tip":"Yagi-Uda","frekans":frekans_mhz,"dalga_boyu":lam,"eleman_sayisi":eleman_sayisi,
-                "elemanlar":elemanlar,"mesafeler":{"ref_aktif":ref_aktif_mesafe,"aktif_dir":aktif_dir_mesafe},
-                "empedans":emp,"kazanc":kazanc,
-                "aciklama":f"{eleman_sayisi} elemanlı Yagi-Uda (yaklaşık, Çap: {cap_m*1000:.1f}mm)"}
+    # Otomatik hesap: girdiler değiştikçe GECIKME_MS bekler (debounce). Kapalı form sonuçlar
+    # ve tablo hemen güncellenir; MoM analizi ile çizim AGIR_GECIKME_MS sonra yapılır.
+    GECIKME_MS = 80
+    AGIR_GECIKME_MS = 400
+
+    def _girdi_degisti(self, *_):
+        for is_kimligi in (self._gecikme, self._agir_is):
+            if is_kimligi is not None:
+                self.root.after_cancel(is_kimligi)
+        self._gecikme = self._agir_is = None
+        if self.otomatik.get():
+            self._gecikme = self.root.after(self.GECIKME_MS, self._canli_hesapla)
+
+    def _canli_hesapla(self):
+        self._gecikme = None
+        t0 = time.perf_counter()
+        try:
+            girdi = self._girdileri_oku()
+        except ValueError as e:
+            self.status_var.set(f"Otomatik: {e}")
+            return
+        if girdi == self._canli_girdi:
+            return # Değişen bir şey yok
+        self._canli_girdi = girdi
+        anahtar = self._tasarim_anahtari(*girdi)
+        sonuclar = self.onbellek.get(anahtar)
+        hazir = sonuclar is not None
+        if not hazir:
+            try:
+                sonuclar = self._tasarla(*girdi)
+            except (ValueError, ArithmeticError) as e:
+                self.status_var.set(f"Otomatik: {e}")
+                return
+        self.sonuclari_goster(sonuclar)
+        sure_ms = (time.perf_counter() - t0) * 1000
+        if hazir:
+            self.anten_gorsel_olustur(sonuclar)
+            self.status_var.set(f"Otomatik hesaplandı (önbellekten, {sure_ms:.1f} ms).")
+        else:
+            self._agir_is = self.root.after(self.AGIR_GECIKME_MS, self._canli_tamamla, anahtar, sonuclar)
+            self.status_var.set(f"Otomatik hesaplandı ({sure_ms:.1f} ms), MoM analizi bekleniyor...")
+
+    def _canli_tamamla(self, anahtar, sonuclar):
+        self._agir_is = None
+        self._mom_analizi(sonuclar)
+        self.onbellek.put(anahtar, sonuclar)
+        self.sonuclari_goster(sonuclar)
+        self.anten_gorsel_olustur(sonuclar)
+        self.status_var.set("Otomatik hesaplandı (MoM dahil).")
+
+    # Boyut hesapları anten_cekirdek modülündedir (arayüzsüz kullanım için)
+    def monopol_hesapla(self, frekans_mhz, cap_m):
+        return monopol_hesapla(frekans_mhz, cap_m)
+
+    def dipol_hesapla(self, frekans_mhz, cap_m):
+        return dipol_hesapla(frekans_mhz, cap_m)
+
+    def yagi_uda_hesapla(self, frekans_mhz, eleman_sayisi, **kwargs):
+        return yagi_uda_hesapla(frekans_mhz, eleman_sayisi, **kwargs)
     
-    # ... sonuclari_goster, anten_gorsel_olustur ve yardımcı görsel metotları aynı ...
+    # Tasarımı MoM tel çözücüsüyle analiz et; sonuç 'mom' anahtarına, MoM akımlarından
+    # bulunan ışıma deseni (kesitler ve hüzme ölçüleri) 'desen' anahtarına eklenir
+    def _mom_analizi(self, sonuclar):
+        import numpy as np
+        from mom_cozucu import solve_design
+        from isima_deseni import design_pattern
+        try:
+            sonuclar['mom'] = solve_design(sonuclar)
+            sonuclar['desen'] = design_pattern(sonuclar)
+        except (ValueError, np.linalg.LinAlgError):
+            sonuclar['mom'] = None
+            sonuclar['desen'] = None
+
+    def _satir(self, iid, etiket, deger="", ust="", baslik=False):
+        # Satır yoksa eklenir, varsa yalnızca değişen metin güncellenir ve sıraya taşınır
+        agac = self.sonuc_agaci
+        if not agac.exists(iid):
+            agac.insert(ust, "end", iid=iid, text=etiket, values=(deger,), open=True,
+                        tags=("baslik",) if baslik else ())
+        elif agac.item(iid, "text") != etiket or agac.set(iid, "deger") != deger:
+            agac.item(iid, text=etiket, values=(deger,))
+        sira = self._satir_sirasi.get(ust, 0)
+        agac.move(iid, ust, sira)
+        self._satir_sirasi[ust] = sira + 1
+        self._gorunen_satirlar.add(iid)
+
     def sonuclari_goster(self, sonuclar):
-        for w in self.sonuc_frame.winfo_children():
-            w.destroy()
-        row=0
-        ttk.Label(self.sonuc_frame, text=f"Anten Tipi: {sonuclar['tip']}", font=("Segoe UI",11,"bold")).grid(row=row,column=0,sticky="w",pady=2); row+=1
-        ttk.Label(self.sonuc_frame, text=f"Frekans: {sonuclar['frekans']} MHz").grid(row=row,column=0,sticky="w"); row+=1
-        ttk.Label(self.sonuc_frame, text=f"Dalga Boyu: {sonuclar['dalga_boyu']:.3f} m").grid(row=row,column=0,sticky="w"); row+=1
+        self._satir_sirasi = {}
+        self._gorunen_satirlar = set()
+        satir = self._satir
+        satir("tip", "Anten Tipi:", sonuclar['tip'], baslik=True)
+        satir("frekans", "Frekans:", f"{sonuclar['frekans']} MHz")
+        satir("dalga_boyu", "Dalga Boyu:", f"{sonuclar['dalga_boyu']:.3f} m")
         if sonuclar['tip'] in ("Monopol","Dipol"):
-            ttk.Label(self.sonuc_frame, text=f"Anten Uzunluğu: {sonuclar['uzunluk']*100:.2f} cm").grid(row=row,column=0,sticky="w"); row+=1
+            satir("uzunluk", "Anten Uzunluğu:", f"{sonuclar['uzunluk']*100:.2f} cm")
         if sonuclar['tip']=="Yagi-Uda":
-            ttk.Label(self.sonuc_frame, text=f"Eleman Sayısı: {sonuclar['eleman_sayisi']}").grid(row=row,column=0,sticky="w"); row+=1
-            ttk.Label(self.sonuc_frame, text="Eleman Uzunlukları (cm):",font=("Segoe UI",10,"bold")).grid(row=row,column=0,sticky="w",pady=(6,2)); row+=1
+            satir("eleman_sayisi", "Eleman Sayısı:", str(sonuclar['eleman_sayisi']))
+            satir("elemanlar", "Eleman Uzunlukları (cm):", baslik=True)
             ele=sonuclar['elemanlar']
-            ttk.Label(self.sonuc_frame, text=f"  Reflektör: {ele['reflektör']*100:.2f} cm").grid(row=row,column=0,sticky="w"); row+=1
-            ttk.Label(self.sonuc_frame, text=f"  Aktif: {ele['aktif']*100:.2f} cm").grid(row=row,column=0,sticky="w"); row+=1
+            satir("e_ref", "Reflektör:", f"{ele['reflektör']*100:.2f} cm", ust="elemanlar")
+            satir("e_aktif", "Aktif:", f"{ele['aktif']*100:.2f} cm", ust="elemanlar")
             for idx,dlen in enumerate(ele['direktörler'],start=1):
-                ttk.Label(self.sonuc_frame, text=f"  Direktör {idx}: {dlen*100:.2f} cm").grid(row=row,column=0,sticky="w"); row+=1
-            ttk.Label(self.sonuc_frame, text="Mesafeler (cm):",font=("Segoe UI",10,"bold")).grid(row=row,column=0,sticky="w",pady=(6,2)); row+=1
-            ttk.Label(self.sonuc_frame, text=f"  Ref-Aktif: {sonuclar['mesafeler']['ref_aktif']*100:.2f} cm").grid(row=row,column=0,sticky="w"); row+=1
-            ttk.Label(self.sonuc_frame, text=f"  Aktif-Direktör aralığı: {sonuclar['mesafeler']['aktif_dir']*100:.2f} cm").grid(row=row,column=0,sticky="w"); row+=1
-        ttk.Label(self.sonuc_frame, text=f"Empedans (yaklaşık): {sonuclar['empedans']} Ω").grid(row=row,column=0,sticky="w",pady=(6,2)); row+=1
-        ttk.Label(self.sonuc_frame, text=f"Kazanç (yaklaşık): {sonuclar['kazanc']:.2f} dBi").grid(row=row,column=0,sticky="w"); row+=1
-        ttk.Label(self.sonuc_frame, text=f"Açıklama: {sonuclar.get('aciklama','')}").grid(row=row,column=0,sticky="w",pady=(6,2)); row+=1
+                satir(f"e_d{idx}", f"Direktör {idx}:", f"{dlen*100:.2f} cm", ust="elemanlar")
+            satir("mesafeler", "Mesafeler (cm):", baslik=True)
+            satir("m_ref", "Ref-Aktif:", f"{sonuclar['mesafeler']['ref_aktif']*100:.2f} cm", ust="mesafeler")
+            if 'direktörler' in sonuclar['mesafeler']:
+                for idx,mes in enumerate(sonuclar['mesafeler']['direktörler'],start=1):
+                    onceki = "Aktif" if idx == 1 else f"D{idx-1}"
+                    satir(f"m_d{idx}", f"{onceki}-D{idx}:", f"{mes*100:.2f} cm", ust="mesafeler")
+            else:
+                satir("m_aktif_dir", "Aktif-Direktör aralığı:", f"{sonuclar['mesafeler']['aktif_dir']*100:.2f} cm", ust="mesafeler")
+        satir("empedans", "Empedans (yaklaşık):", f"{sonuclar['empedans']} Ω")
+        satir("kazanc", "Kazanç (yaklaşık):", f"{sonuclar['kazanc']:.2f} dBi")
+        if 'mom' not in sonuclar:
+            satir("mom", "MoM Analizi:", "hesaplanıyor...", baslik=True) # otomatik modda sonradan gelir
+        elif sonuclar['mom']:
+            mom = sonuclar['mom']
+            z = mom['impedance']
+            satir("mom", "MoM Analizi:", "", baslik=True)
+            satir("mom_z", "Empedans:", f"{z.real:.1f} {'+' if z.imag >= 0 else '-'} j{abs(z.imag):.1f} Ω", ust="mom")
+            satir("mom_kazanc", "Kazanç:", f"{mom['gain']:.2f} dBi", ust="mom")
+            satir("mom_swr", "VSWR (50 Ω):", f"{mom['swr']:.2f}", ust="mom")
+            if sonuclar['tip']=="Yagi-Uda":
+                satir("mom_fb", "Ön/Arka (F/B):", f"{mom['fb']:.1f} dB", ust="mom")
+        desen = sonuclar.get('desen')
+        if desen:
+            genislik = lambda bw: "yönsüz" if bw is None else f"{bw:.1f}°"
+            satir("desen", "Işıma Deseni:", "", baslik=True)
+            satir("desen_tepe", "Tepe Kazanç:",
+                  f"{desen['peak_gain']:.2f} dBi (θ={desen['peak_theta']:.0f}°, φ={desen['peak_phi']:.0f}°)", ust="desen")
+            satir("desen_e", "E düzlemi -3 dB:", genislik(desen['beamwidth_e']), ust="desen")
+            satir("desen_h", "H düzlemi -3 dB:", genislik(desen['beamwidth_h']), ust="desen")
+            if sonuclar['tip']=="Yagi-Uda":
+                satir("desen_fr", "Ön/Arka Oranı (F/R):", f"{desen['fr']:.1f} dB", ust="desen")
+        satir("aciklama", "Açıklama:", sonuclar.get('aciklama',''))
+        # Bu tasarımda olmayan satırlar gizlenir (silinmez, sonra yeniden kullanılır)
+        agac = self.sonuc_agaci
+        for ust in ("", "elemanlar", "mesafeler", "mom", "desen"):
+            if not agac.exists(ust) and ust:
+                continue
+            for iid in agac.get_children(ust):
+                if iid not in self._gorunen_satirlar:
+                    agac.detach(iid)
+        self.son_sonuclar = sonuclar
         self.status_var.set("Hesaplama tamamlandı.")
         
     def anten_gorsel_olustur(self, sonuclar):
-        for w in self.gorsel_frame.winfo_children():
-            w.destroy()
-        fig, ax = plt.subplots(figsize=(8,5), constrained_layout=True)
-        tip=sonuclar['tip']
-        if tip=="Monopol":
-            self._monopol_gorsel(ax,sonuclar)
-        elif tip=="Dipol":
-            self._dipol_gorsel(ax,sonuclar)
-        elif tip=="Yagi-Uda":
-            self._yagi_gorsel(ax,sonuclar)
-        ax.set_xlabel("Uzunluk (cm)")
-        ax.set_ylabel("Yükseklik (cm) (gösterim sıkıştırıldı)")
-        ax.grid(True, alpha=0.35)
-        ax.set_title(f"{sonuclar['tip']} Anten Tasarımı - {sonuclar['frekans']} MHz")
-        canvas = FigureCanvasTkAgg(fig, self.gorsel_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
-
-    def _monopol_gorsel(self, ax, sonuclar):
-        uzun_cm = sonuclar['uzunluk']*100
-        ax.plot([0,0],[0,uzun_cm],linewidth=5)
-        ax.plot([-40,40],[0,0],linewidth=2, color='tab:gray', linestyle='--') # Zemin/Karşı ağırlık
-        ax.scatter([0],[0],s=50,c='red',zorder=5) # Besleme noktası
-        ax.set_xlim(-60,60)
-        ax.set_ylim(-20, max(uzun_cm+20,50))
-        ax.set_aspect('equal', adjustable='box') 
-        ax.text(0, uzun_cm+5, f"L={uzun_cm:.2f} cm", ha='center')
-
-    def _dipol_gorsel(self, ax, sonuclar):
-        toplam_cm = sonuclar['uzunluk']*100
-        yari = toplam_cm/2.0
-        ax.plot([-yari,0],[0,0],linewidth=5, color='tab:blue')
-        ax.plot([0,yari],[0,0],linewidth=5, color='tab:blue')
-        ax.scatter([0],[0],s=50,c='red',zorder=5) # Besleme noktası
-        ax.set_xlim(-yari*1.3,yari*1.3)
-        ax.set_ylim(-max(10,yari*0.2), max(10,yari*0.2))
-        ax.set_aspect('equal', adjustable='box') 
-        ax.text(0, max(10,yari*0.2)*0.8, f"Toplam L={toplam_cm:.2f} cm", ha='center')
-
-    def _yagi_gorsel(self, ax, sonuclar):
-        ele = sonuclar['elemanlar']
-        ref_aktif = sonuclar['mesafeler']['ref_aktif']*100
-        aktif_dir = sonuclar['mesafeler']['aktif_dir']*100
-        
-        pozisyon = []
-        poz_ref = 0.0
-        poz_aktif = poz_ref + ref_aktif
-        
-        pozisyon.append(("Reflektör", poz_ref, ele['reflektör']*100))
-        pozisyon.append(("Aktif", poz_aktif, ele['aktif']*100))
-        
-        current_pos = poz_aktif
-        for i,dlen in enumerate(ele['direktörler']):
-            current_pos += aktif_dir 
-            pozisyon.append((f"Direktör {i+1}", current_pos, dlen*100))
-
-        xs = [p[1] for p in pozisyon]
-        lengths = [p[2] for p in pozisyon]
-        
-        if not xs:
-             minx, maxx = -10, 10
-        else:
-            minx, maxx = min(xs)-20, max(xs)+20
-        
-        max_x_range = maxx - minx if (maxx - minx) > 0 else 1.0
-        max_len = max(lengths) if lengths else 1.0
-        
-        desired_vspan_fraction = 0.25 
-        scale_factor = 1.0
-        if max_len > max_x_range * desired_vspan_fraction:
-            scale_factor = max_len / (max_x_range * desired_vspan_fraction)
-            
-        # çizim: boom
-        ax.plot([min(xs)-5, max(xs)+5], [0,0], color='gray', linewidth=2, zorder=1)
-        
-        colors = {'Reflektör':'tab:red','Aktif':'tab:blue'}
-        vpad = 0.0 
-        for label, xpos, length in pozisyon:
-            hy = (length/2.0) / scale_factor
-            vpad = max(vpad, hy)
-            color = colors.get(label.split()[0],'tab:green')
-            ax.plot([xpos,xpos], [-hy, hy], linewidth=4, color=color, zorder=2)
-            ax.text(xpos, hy + 0.05*vpad*scale_factor, f"{label}\n({length:.1f} cm)", ha='center', fontsize=9, rotation=45, color=color)
-            
-        ax.scatter([poz_aktif],[0],s=60,c='red',zorder=5)
-        ax.set_xlim(minx-10, maxx+10)
-        
-        if lengths:
-            ax.set_ylim(-vpad*1.8, vpad*1.8)
-        else:
-            ax.set_ylim(-10, 10) 
-            
-        ax.text(minx+5, -vpad*1.5, f"(DİKKAT: Dikey gösterim sıkıştırıldı; etiketler gerçek uzunlukları gösterir)",
-                  fontsize=8, color='gray')
-        ax.set_aspect('auto')
+        # Tek figür/tuval; her çağrıda yalnızca çizgi ve yazı nesneleri güncellenir
+        if self._cizim is None:
+            self._cizim = self._cizim_olustur()
+        widget = self._cizim.canvas.get_tk_widget()
+        if not widget.winfo_manager():
+            widget.pack(fill="both", expand=True)
+        self._cizim.guncelle(sonuclar)
 
 
     # Basit Yagi optimizasyon dialog + grid-search
@@ -426,55 +491,679 @@ class AntenTasarimUygulamasi:
         if d_max is None: return
         
         s_step = simpledialog.askfloat("Optimize - Grid Adımı",
-                                       "Parametrik grid adımı (örn. 0.005):", 
+                                       "Hedef çözünürlük (en ince grid adımı, örn. 0.005):", 
                                        initialvalue=0.005, minvalue=0.001, maxvalue=0.1)
         if s_step is None: return
         
-        # Optimize fonksiyonunu çağır
+        # Kaba-ince arama: direktör aralığı kullanıcıdan, son adım s_step
+        from yagi_optimizasyon_modulu import optimize_yagi_adaptive_iter
+        izleyici = self._izleyici()
+        uretec = optimize_yagi_adaptive_iter(
+            target_freq_mhz=frekans,
+            element_count=eleman_sayisi,
+            element_cap_m=cap_m,
+            dir_range=(d_min, d_max),
+            final_step=s_step,
+            tracer=izleyici
+        )
+
+        # Sonuçları göstermek için yagi_uda_hesapla'yı çağır (cap_m'i de geç)
+        def tasarim(best_cfg):
+            return self.yagi_uda_hesapla(frekans, eleman_sayisi,
+                                         aktif_factor=best_cfg['active'] / (best_cfg['wavelength']), 
+                                         direktor_base_factor=best_cfg['director'] / (best_cfg['wavelength']),
+                                         ref_aktif_factor=best_cfg['spacing'] / best_cfg['wavelength'],
+                                         aktif_dir_factor=best_cfg['spacing'] / best_cfg['wavelength'],
+                                         cap_m=cap_m) # cap_m'i geçir!
+
+        def mesaj(best_cfg):
+            return (f"En iyi parametreler (Grid Search, Çap: {cap_m*1000:.1f}mm):\n" # Çap bilgisini ekle
+                    f"Reflektör Uzunluğu: {best_cfg['reflector']*100:.2f} cm\n"
+                    f"Aktif Uzunluğu: {best_cfg['active']*100:.2f} cm\n"
+                    f"Direktör Uzunluğu (Base): {best_cfg['director']*100:.2f} cm\n"
+                    f"Aralık (Ref-Aktif ve Aktif-Dir): {best_cfg['spacing']*100:.2f} cm\n\n"
+                    f"Tahmini Kazanç: {best_cfg['gain']:.2f} dBi\n"
+                    f"Tahmini VSWR: {best_cfg['swr']:.2f}\n"
+                    f"Değerlendirilen nokta: {best_cfg['evaluations']}\n\n"
+                    "Bulunan parametrelerle son anten tasarımını görüntülemek ister misiniz?")
+
+        anahtar = self.onbellek.key("optimize_adaptive", {
+            "frekans": frekans, "eleman_sayisi": eleman_sayisi, "cap_m": cap_m,
+            "dir_range": (d_min, d_max), "final_step": s_step})
+        self._optimizasyonu_baslat(uretec, tasarim, mesaj, anahtar, izleyici)
+
+    # Eleman bazlı (her direktör ayrı) optimizasyon - diferansiyel evrim
+    def yagi_de_optimize_dialog(self):
+        """
+        Her direktörün uzunluğunu ve aralığını ayrı ayrı optimize eder (optimize_yagi_de).
+        """
+        try:
+            frekans = float(self.frekans.get())
+            eleman_sayisi = int(self.eleman_sayisi.get())
+            cap_m = float(self.cap_mm.get()) / 1000.0
+            if eleman_sayisi < 3:
+                messagebox.showerror("Hata","Yagi-Uda için eleman sayısı en az 3 olmalıdır (R, A, D1).")
+                return
+        except ValueError:
+            messagebox.showerror("Hata","Geçersiz frekans, eleman sayısı veya çap.")
+            return
+
+        nesil = simpledialog.askinteger("Optimize - Nesil Sayısı",
+                                        "En fazla nesil sayısı (örn. 300):",
+                                        initialvalue=300, minvalue=10, maxvalue=5000)
+        if nesil is None: return
+
+        from yagi_optimizasyon_modulu import de_design_args, optimize_yagi_de_iter
+        izleyici = self._izleyici()
+        uretec = optimize_yagi_de_iter(
+            target_freq_mhz=frekans,
+            element_count=eleman_sayisi,
+            element_cap_m=cap_m,
+            generations=nesil,
+            tracer=izleyici
+        )
+
+        def tasarim(best_cfg):
+            # DE boyları fizikseldir; tüm elemanlar kısaltma faktörü uygulanmadan aktarılır
+            return self.yagi_uda_hesapla(frekans, eleman_sayisi, cap_m=cap_m, **de_design_args(best_cfg))
+
+        def mesaj(best_cfg):
+            return (f"En iyi parametreler (Diferansiyel Evrim, Çap: {cap_m*1000:.1f}mm):\n"
+                    f"Reflektör Uzunluğu: {best_cfg['reflector']*100:.2f} cm\n"
+                    f"Aktif Uzunluğu: {best_cfg['active']*100:.2f} cm\n"
+                    f"Ref-Aktif Aralığı: {best_cfg['ref_spacing']*100:.2f} cm\n"
+                    f"Direktörler: {', '.join(f'{d*100:.1f}' for d in best_cfg['directors'])} cm\n"
+                    f"Aralıklar: {', '.join(f'{d*100:.1f}' for d in best_cfg['director_spacings'])} cm\n\n"
+                    f"Tahmini Kazanç: {best_cfg['gain']:.2f} dBi\n"
+                    f"Tahmini VSWR: {best_cfg['swr']:.2f}\n"
+                    f"Değerlendirme: {best_cfg['evaluations']}\n\n"
+                    "Bulunan parametrelerle son anten tasarımını görüntülemek ister misiniz?")
+
+        anahtar = self.onbellek.key("optimize_de", {
+            "frekans": frekans, "eleman_sayisi": eleman_sayisi, "cap_m": cap_m, "nesil": nesil})
+        self._optimizasyonu_baslat(uretec, tasarim, mesaj, anahtar, izleyici)
+
+    # Çok amaçlı arama: kazanç / VSWR / boom uzunluğu Pareto cephesi
+    def yagi_pareto_dialog(self):
+        """
+        Tüm Pareto cephesini hesaplar; bittiğinde cephe penceresinden herhangi bir nokta
+        yeniden hesaplama yapılmadan seçilebilir.
+        """
+        try:
+            frekans = float(self.frekans.get())
+            eleman_sayisi = int(self.eleman_sayisi.get())
+            cap_m = float(self.cap_mm.get()) / 1000.0
+            if eleman_sayisi < 3:
+                messagebox.showerror("Hata","Yagi-Uda için eleman sayısı en az 3 olmalıdır (R, A, D1).")
+                return
+        except ValueError:
+            messagebox.showerror("Hata","Geçersiz frekans, eleman sayısı veya çap.")
+            return
+
+        s_step = simpledialog.askfloat("Pareto - Grid Adımı",
+                                       "Grid adımı (lambda çarpanı, örn. 0.005; 0.001 ≈ 75 milyon nokta):",
+                                       initialvalue=0.005, minvalue=0.001, maxvalue=0.1)
+        if s_step is None: return
+
+        from yagi_optimizasyon_modulu import optimize_yagi_pareto_iter
+        izleyici = self._izleyici()
+        uretec = optimize_yagi_pareto_iter(
+            target_freq_mhz=frekans,
+            element_count=eleman_sayisi,
+            element_cap_m=cap_m,
+            step=s_step,
+            tracer=izleyici
+        )
+
+        def tasarim(best_cfg):
+            return self.yagi_uda_hesapla(frekans, eleman_sayisi,
+                                         aktif_factor=best_cfg['active'] / best_cfg['wavelength'],
+                                         direktor_base_factor=best_cfg['director'] / best_cfg['wavelength'],
+                                         ref_aktif_factor=best_cfg['spacing'] / best_cfg['wavelength'],
+                                         aktif_dir_factor=best_cfg['spacing'] / best_cfg['wavelength'],
+                                         cap_m=cap_m)
+
+        anahtar = self.onbellek.key("optimize_pareto", {
+            "frekans": frekans, "eleman_sayisi": eleman_sayisi, "cap_m": cap_m, "step": s_step})
+        self._optimizasyonu_baslat(uretec, tasarim, None, anahtar, izleyici)
+
+    # --- Arka plan optimizasyonu ---
+    # Üreteç bir işçi iş parçacığında çalışır; ilerleme kayıtları kuyruğa yazılır ve
+    # ana iş parçacığı kuyruğu root.after ile yoklar (Tk yalnızca ana iş parçacığından çağrılır).
+    # İzleme açıksa yeni bir izleyici (izleme.Tracer), değilse None
+    def _izleyici(self):
+        if not self.izleme.get():
+            return None
+        from izleme import Tracer
+        return Tracer()
+
+    def _optimizasyonu_baslat(self, uretec, tasarim, mesaj, anahtar=None, izleyici=None):
+        if self._opt_thread is not None:
+            self.status_var.set("Bir optimizasyon zaten çalışıyor.")
+            uretec.close()
+            return
+
+        # Aynı ayarlarla daha önce tamamlanmış optimizasyon: hemen göster
+        if anahtar is not None:
+            best_cfg = self.onbellek.get(anahtar)
+            if best_cfg is not None:
+                uretec.close()
+                self._optimizasyonu_bitir("bitti", {"best": best_cfg, "done": best_cfg.get('evaluations', 0)},
+                                          tasarim, mesaj)
+                return
+
+        kuyruk = queue.Queue()
+        iptal = threading.Event()
+
+        def calis():
+            son = None
+            try:
+                with izleyici or contextlib.nullcontext():
+                    for son in uretec:
+                        kuyruk.put(("ilerleme", son))
+                        if iptal.is_set():
+                            uretec.close()
+                            kuyruk.put(("iptal", son))
+                            return
+                kuyruk.put(("bitti", son))
+            except Exception as e:
+                kuyruk.put(("hata", e))
+
+        self._opt_kuyruk = kuyruk
+        self._opt_iptal = iptal
+        self._opt_baslangic = time.perf_counter()
+        self._opt_son_cizim = 0.0
+        self._opt_son_skor = None
+        self._opt_izleyici = izleyici
+        self._opt_thread = threading.Thread(target=calis, daemon=True)
+        self._opt_thread.start()
+
+        self.optimize_btn.state(["disabled"])
+        self.de_btn.state(["disabled"])
+        self.pareto_btn.state(["disabled"])
+        self.iptal_btn.state(["!disabled"])
+        self.status_var.set("Optimizasyon başladı...")
+        self.root.after(100, self._optimizasyonu_izle, tasarim, mesaj, anahtar)
+
+    def optimizasyonu_iptal(self):
+        if self._opt_thread is not None:
+            self._opt_iptal.set()
+            self.status_var.set("Optimizasyon iptal ediliyor...")
+
+    def _optimizasyonu_izle(self, tasarim, mesaj, anahtar=None):
+        ilerleme = None
+        son_olay = None
+        try:
+            while True:
+                olay, veri = self._opt_kuyruk.get_nowait()
+                if olay == "ilerleme":
+                    ilerleme = veri
+                else:
+                    son_olay = (olay, veri)
+        except queue.Empty:
+            pass
+
+        if ilerleme is not None:
+            gecen = time.perf_counter() - self._opt_baslangic
+            oran = ilerleme['done'] / gecen if gecen > 0 else 0.0
+            kalan = (ilerleme['total'] - ilerleme['done']) / oran if oran > 0 else 0.0
+            best_cfg = ilerleme['best']
+            self.status_var.set(f"Optimizasyon: %{100.0 * ilerleme['done'] / ilerleme['total']:.0f} | "
+                                f"{oran:,.0f} değ/s | kalan ~{kalan:.1f} s | "
+                                f"en iyi skor {best_cfg['score']:.3f}, VSWR {best_cfg['swr']:.2f}")
+            # Canlı görselleştirme: en iyi değiştiğinde, en fazla saniyede iki kez
+            simdi = time.perf_counter()
+            if best_cfg['score'] != self._opt_son_skor and simdi - self._opt_son_cizim >= 0.5:
+                self._opt_son_skor = best_cfg['score']
+                self._opt_son_cizim = simdi
+                self.anten_gorsel_olustur(tasarim(best_cfg))
+
+        if son_olay is None:
+            self.root.after(100, self._optimizasyonu_izle, tasarim, mesaj, anahtar)
+            return
+
+        self._opt_thread = None
+        self.optimize_btn.state(["!disabled"])
+        self.de_btn.state(["!disabled"])
+        self.pareto_btn.state(["!disabled"])
+        self.iptal_btn.state(["disabled"])
+
+        olay, veri = son_olay
+        if olay == "bitti" and anahtar is not None and veri is not None and veri['best'] is not None:
+            self.onbellek.put(anahtar, veri['best'])
+        self._optimizasyonu_bitir(olay, veri, tasarim, mesaj)
+        if self._opt_izleyici is not None:
+            self._izi_kaydet(self._opt_izleyici)
+
+    # İz JSON olarak önbellek dizinindeki izler/ klasörüne yazılır ve durum çubuğunda özetlenir
+    def _izi_kaydet(self, izleyici):
+        dizin = os.path.join(default_directory(), "izler")
+        yol = os.path.join(dizin, time.strftime("%Y%m%d-%H%M%S") + ".json")
+        try:
+            os.makedirs(dizin, exist_ok=True)
+            izleyici.to_json(yol)
+        except OSError:
+            yol = None
+        ozet = izleyici.summary()
+        self.status_var.set(f"{self.status_var.get()} | İz: {ozet}" + (f" ({yol})" if yol else ""))
+
+    def _optimizasyonu_bitir(self, olay, veri, tasarim, mesaj):
+        if olay == "hata":
+            messagebox.showerror("Hata", f"Optimizasyon sırasında sorun oluştu:\n{veri}")
+            self.status_var.set("Optimizasyon hatası.")
+            return
+        if veri is None or veri['best'] is None:
+            messagebox.showinfo("Sonuç", "Optimizasyon sonuç üretmedi.")
+            self.status_var.set("Optimizasyon tamamlandı, sonuç bulunamadı.")
+            return
+
+        best_cfg = veri['best']
+        res = tasarim(best_cfg)
+        if olay == "iptal":
+            self._mom_analizi(res)
+            self.sonuclari_goster(res)
+            self.anten_gorsel_olustur(res)
+            self.status_var.set(f"Optimizasyon iptal edildi; o ana kadarki en iyi tasarım gösteriliyor "
+                                f"({veri['done']} değerlendirme).")
+            return
+
+        if 'front' in best_cfg:
+            self._pareto_penceresi(best_cfg, tasarim)
+            self.status_var.set(f"Pareto cephesi: {len(best_cfg['front'])} nokta "
+                                f"({best_cfg['evaluations']:,} değerlendirme).")
+            return
+
+        if messagebox.askyesno("Optimizasyon Sonucu", mesaj(best_cfg)):
+            self._mom_analizi(res)
+            self.sonuclari_goster(res)
+            self.anten_gorsel_olustur(res)
+            self.status_var.set("Optimizasyon tamamlandı ve sonuç gösterildi.")
+        else:
+            self.status_var.set("Optimizasyon tamamlandı.")
+
+    # Pareto cephesi penceresi: tablo + kazanç/VSWR saçılımı (renk: boom). Satır ya da nokta
+    # seçildiğinde o tasarım ana pencerede gösterilir; cephe zaten hesaplı olduğundan arama tekrarlanmaz.
+    def _pareto_penceresi(self, sonuc, tasarim):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        cephe = sonuc['front']
+        pencere = tk.Toplevel(self.root)
+        pencere.title(f"Pareto Cephesi - {len(cephe)} nokta")
+
+        fig = Figure(figsize=(5,4), constrained_layout=True)
+        ax = fig.add_subplot()
+        kazanc = [p['gain'] for p in cephe]
+        vswr = [p['swr'] for p in cephe]
+        boom = [p['boom'] * 100 for p in cephe]
+        nokta = ax.scatter(vswr, kazanc, c=boom, cmap="viridis", s=18, picker=5)
+        fig.colorbar(nokta, ax=ax, label="Boom (cm)")
+        secili, = ax.plot([], [], "o", mfc="none", mec="red", ms=12, mew=2)
+        ax.set_xlabel("VSWR")
+        ax.set_ylabel("Kazanç (dBi)")
+        ax.grid(True, alpha=0.3)
+        canvas = FigureCanvasTkAgg(fig, pencere)
+        canvas.get_tk_widget().pack(side="left", fill="both", expand=True)
+
+        sutunlar = {"kazanc": "Kazanç (dBi)", "vswr": "VSWR", "boom": "Boom (cm)", "skor": "Skor"}
+        agac = ttk.Treeview(pencere, columns=list(sutunlar), show="headings", height=20, selectmode="browse")
+        for sutun, baslik in sutunlar.items():
+            agac.heading(sutun, text=baslik)
+            agac.column(sutun, width=90, anchor="e")
+        for i, p in enumerate(cephe):
+            agac.insert("", "end", iid=str(i),
+                        values=(f"{p['gain']:.2f}", f"{p['swr']:.3f}", f"{p['boom']*100:.1f}", f"{p['score']:.3f}"))
+        kaydirma = ttk.Scrollbar(pencere, orient="vertical", command=agac.yview)
+        agac.configure(yscrollcommand=kaydirma.set)
+        kaydirma.pack(side="right", fill="y")
+        agac.pack(side="right", fill="y")
+
+        def sec(_):
+            secim = agac.selection()
+            if not secim:
+                return
+            p = cephe[int(secim[0])]
+            secili.set_data([p['swr']], [p['gain']])
+            canvas.draw_idle()
+            res = tasarim(p)
+            self._mom_analizi(res)
+            self.sonuclari_goster(res)
+            self.anten_gorsel_olustur(res)
+            self.status_var.set(f"Pareto noktası: {p['gain']:.2f} dBi, VSWR {p['swr']:.3f}, "
+                                f"boom {p['boom']*100:.1f} cm")
+
+        def tikla(olay):
+            i = str(olay.ind[0])
+            agac.selection_set(i)
+            agac.see(i)
+
+        agac.bind("<<TreeviewSelect>>", sec)
+        canvas.mpl_connect("pick_event", tikla)
+        # Başlangıçta en yüksek skorlu nokta seçili
+        ilk = str(next(i for i, p in enumerate(cephe) if p['score'] == sonuc['score']))
+        agac.selection_set(ilk)
+        agac.see(ilk)
+
+    # Tam küre (1°×1°) ışıma deseni, 3B yüzey olarak ayrı pencerede; tasarım başına önbelleklenir
+    def desen_3b(self):
+        import numpy as np
+        from matplotlib import colormaps
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from isima_deseni import design_pattern
+
+        if self.son_sonuclar is None:
+            self.hesapla()
+            if self.son_sonuclar is None:
+                return
+        sonuclar = self.son_sonuclar
+        tasarim = {k: v for k, v in sonuclar.items() if k not in ('mom', 'desen')}
+        try:
+            desen = self.onbellek.get_or_compute("desen3b", tasarim,
+                                                 lambda: design_pattern(sonuclar, sphere=True))
+        except (ValueError, np.linalg.LinAlgError) as e:
+            messagebox.showerror("Hata", f"Işıma deseni hesaplanamadı:\n{e}")
+            return
+
+        # Yarıçap: tepeye göre normalize dB, -30 dB taban
+        g = np.clip(desen['gain_dbi'] - desen['peak_gain'], -30.0, 0.0) + 30.0
+        th = np.radians(desen['theta_deg'])[:, None]
+        ph = np.radians(np.append(desen['phi_deg'], 360.0))[None, :]
+        g = np.concatenate([g, g[:, :1]], axis=1) # φ=360° ile yüzeyi kapat
+        x, y, z = g*np.sin(th)*np.cos(ph), g*np.sin(th)*np.sin(ph), g*np.cos(th)
+
+        pencere = tk.Toplevel(self.root)
+        pencere.title(f"3B Işıma Deseni - {sonuclar['tip']} {sonuclar['frekans']} MHz")
+        fig = Figure(figsize=(6,6), constrained_layout=True)
+        ax = fig.add_subplot(projection="3d")
+        ax.plot_surface(x, y, z, facecolors=colormaps["viridis"](g / 30.0), rstride=2, cstride=2,
+                        linewidth=0, antialiased=False, shade=False)
+        ax.set(xlim=(-30, 30), ylim=(-30, 30), zlim=(-30, 30))
+        ax.set_box_aspect((1, 1, 1))
+        ax.set_xlabel("x (boom, ileri)")
+        ax.set_ylabel("y")
+        ax.set_zlabel("z (eleman)")
+        ax.set_title(f"Tepe {desen['peak_gain']:.2f} dBi, ölçek: 0..-30 dB")
+        canvas = FigureCanvasTkAgg(fig, pencere)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True)
+
+    # Seçili bant boyunca SWR/empedans taraması (MoM çapaları + rasyonel interpolasyon)
+    def bant_taramasi(self):
+        import numpy as np
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from frekans_taramasi import sweep_design
+
+        if self.son_sonuclar is None:
+            self.hesapla()
+            if self.son_sonuclar is None:
+                return
+        sonuclar = self.son_sonuclar
+        f0 = sonuclar['frekans']
+        kenarlar = band_edges(self.bant_sec.get())
+        if kenarlar is None or not (kenarlar[0] <= f0 <= kenarlar[1]):
+            kenarlar = (f0 * 0.99, f0 * 1.01) # Bant dışı frekans: ±%1
+        f_min, f_max = kenarlar
+        try:
+            hedef_vswr = float(self.vswr.get())
+        except ValueError:
+            hedef_vswr = 1.5 # Geçersiz/boş hedef: yalnızca referans çizgisi, varsayılanla çiz
+
         try:
-            self.status_var.set("Optimizasyon başladı... Lütfen bekleyin.")
+            self.status_var.set("Bant taraması yapılıyor...")
             self.root.update_idletasks()
-            
-            # element_cap_m parametresi eklendi
-            best_cfg = optimize_yagi(
-                target_freq_mhz=frekans,
-                element_count=eleman_sayisi,
-                step=s_step,
-                element_cap_m=cap_m 
-            )
-
-            if best_cfg is None:
-                messagebox.showinfo("Sonuç", "Optimizasyon sonuç üretmedi.")
-                self.status_var.set("Optimizasyon tamamlandı, sonuç bulunamadı.")
+            adim_khz = max(1.0, (f_max - f_min) * 1000.0 / 5000) # en fazla ~5000 nokta
+            tarama = sweep_design(sonuclar, f_min, f_max, step_khz=adim_khz)
+        except (ValueError, np.linalg.LinAlgError) as e:
+            messagebox.showerror("Hata", f"Bant taraması başarısız:\n{e}")
+            self.status_var.set("Bant taraması hatası.")
+            return
+
+        pencere = tk.Toplevel(self.root)
+        pencere.title(f"Bant Taraması - {sonuclar['tip']} {f_min}-{f_max} MHz")
+        fig = Figure(figsize=(7,5), constrained_layout=True)
+        ax_swr, ax_z = fig.subplots(2, 1, sharex=True)
+        f = tarama['freqs_mhz']
+        ax_swr.plot(f, tarama['swr'], color='tab:blue')
+        ax_swr.axhline(hedef_vswr, color='tab:red', linestyle='--', linewidth=1)
+        ax_swr.set_ylabel("VSWR (50 Ω)")
+        ax_swr.grid(True, alpha=0.35)
+        ax_swr.set_title(f"{sonuclar['tip']} - {sonuclar['frekans']} MHz tasarımı")
+        ax_z.plot(f, tarama['impedance'].real, label="R")
+        ax_z.plot(f, tarama['impedance'].imag, label="X")
+        ax_z.set_xlabel("Frekans (MHz)")
+        ax_z.set_ylabel("Empedans (Ω)")
+        ax_z.grid(True, alpha=0.35)
+        ax_z.legend()
+        canvas = FigureCanvasTkAgg(fig, pencere)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        en_iyi = int(np.argmin(tarama['swr']))
+        self.status_var.set(f"Bant taraması: {f.size} nokta, {tarama['exact_solves']} tam çözüm, "
+                            f"min VSWR {tarama['swr'][en_iyi]:.2f} @ {f[en_iyi]:.3f} MHz "
+                            f"(interpolasyon hatası ≤ {tarama['max_error']:.1e})")
+
+    # Üretim toleransı (kesim hatası, aralık kayması, çap) Monte Carlo analizi;
+    # verim VSWR Hedefi alanına göre hesaplanır
+    def tolerans_analizi(self):
+        import numpy as np
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from tolerans_analizi import tolerance_analysis
+
+        if self.son_sonuclar is None:
+            self.hesapla()
+            if self.son_sonuclar is None:
                 return
+        sonuclar = self.son_sonuclar
+        try:
+            hedef = float(self.vswr.get())
+            if hedef < 1.0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Hata","VSWR hedefi 1'den büyük bir sayı olmalıdır.")
+            return
+
+        kesim = simpledialog.askfloat("Tolerans - Kesim Hatası", "Eleman boyu kesim hatası (± mm):",
+                                      initialvalue=2.0, minvalue=0.0, maxvalue=50.0)
+        if kesim is None: return
+        kayma = simpledialog.askfloat("Tolerans - Aralık Kayması", "Boom üzerindeki konum hatası (± mm):",
+                                      initialvalue=2.0, minvalue=0.0, maxvalue=50.0)
+        if kayma is None: return
+        cap_tol = simpledialog.askfloat("Tolerans - Çap", "Eleman çapı toleransı (± mm):",
+                                        initialvalue=0.2, minvalue=0.0, maxvalue=5.0)
+        if cap_tol is None: return
+
+        try:
+            self.status_var.set("Tolerans analizi yapılıyor...")
+            self.root.update_idletasks()
+            res = tolerance_analysis(sonuclar, samples=20_000, length_tol_m=kesim / 1000.0,
+                                     spacing_tol_m=kayma / 1000.0, diameter_tol_m=cap_tol / 1000.0,
+                                     vswr_target=hedef)
+        except (ValueError, np.linalg.LinAlgError) as e:
+            messagebox.showerror("Hata", f"Tolerans analizi başarısız:\n{e}")
+            self.status_var.set("Tolerans analizi hatası.")
+            return
 
-            # Sonuçları göstermek için yagi_uda_hesapla'yı çağır (cap_m'i de geç)
-            res = self.yagi_uda_hesapla(frekans, eleman_sayisi,
-                                        aktif_factor=best_cfg['active'] / (best_cfg['wavelength']), 
-                                        direktor_base_factor=best_cfg['director'] / (best_cfg['wavelength']),
-                                        ref_aktif_factor=best_cfg['spacing'] / best_cfg['wavelength'],
-                                        aktif_dir_factor=best_cfg['spacing'] / best_cfg['wavelength'],
-                                        cap_m=cap_m) # cap_m'i geçir!
-
-            msg = (f"En iyi parametreler (Grid Search, Çap: {cap_m*1000:.1f}mm):\n" # Çap bilgisini ekle
-                   f"Reflektör Uzunluğu: {best_cfg['reflector']*100:.2f} cm\n"
-                   f"Aktif Uzunluğu: {best_cfg['active']*100:.2f} cm\n"
-                   f"Direktör Uzunluğu (Base): {best_cfg['director']*100:.2f} cm\n"
-                   f"Aralık (Ref-Aktif ve Aktif-Dir): {best_cfg['spacing']*100:.2f} cm\n\n"
-                   f"Tahmini Kazanç: {best_cfg['gain']:.2f} dBi\n"
-                   f"Tahmini VSWR: {best_cfg['swr']:.2f}\n\n"
-                   "Bulunan parametrelerle son anten tasarımını görüntülemek ister misiniz?")
-            
-            if messagebox.askyesno("Optimizasyon Sonucu", msg):
-                self.sonuclari_goster(res)
-                self.anten_gorsel_olustur(res)
-                self.status_var.set("Optimizasyon tamamlandı ve sonuç gösterildi.")
+        pencere = tk.Toplevel(self.root)
+        pencere.title(f"Tolerans Analizi - {sonuclar['tip']} {sonuclar['frekans']} MHz")
+        fig = Figure(figsize=(9,3.6), constrained_layout=True)
+        ax_swr, ax_r, ax_g = fig.subplots(1, 3)
+        for ax, veri, nominal, etiket in ((ax_swr, res['swr'], res['nominal']['swr'], "VSWR"),
+                                          (ax_r, res['impedance'].real, res['nominal']['impedance'].real, "R (Ω)"),
+                                          (ax_g, res['gain'], res['nominal']['gain'], "Kazanç (dBi)")):
+            ax.hist(veri, bins=60, color='tab:blue', alpha=0.8)
+            ax.axvline(nominal, color='black', linewidth=1)
+            ax.set_xlabel(etiket)
+            ax.grid(True, alpha=0.3)
+        ax_swr.axvline(hedef, color='tab:red', linestyle='--', linewidth=1)
+        ax_swr.set_ylabel("Varyant sayısı")
+        fig.suptitle(f"±{kesim:g} mm kesim, ±{kayma:g} mm konum, ±{cap_tol:g} mm çap - "
+                     f"verim %{100 * res['yield']:.1f} (VSWR ≤ {hedef:g})")
+        canvas = FigureCanvasTkAgg(fig, pencere)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        s = res['stats']['swr']
+        self.status_var.set(f"Tolerans analizi: {res['swr'].size:,} varyant, verim %{100 * res['yield']:.1f} "
+                            f"(VSWR ≤ {hedef:g}), VSWR p5-p95 {s['p5']:.2f}-{s['p95']:.2f}, "
+                            f"{res['exact_solves']} MoM çözümü (yüzey hatası ≤ {res['model_error']['swr']:.1e})")
+
+    # Aynı Yagi'nin satır × sütun istiflenmesi; aralık taraması pencere açılırken bir kez
+    # yapılır, sayı/aralık değiştikçe yalnızca dizi deseni yeniden hesaplanır
+    def istifleme(self):
+        import numpy as np
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from istif_dizisi import StackedArray
+
+        if self.son_sonuclar is None:
+            self.hesapla()
+            if self.son_sonuclar is None:
+                return
+        sonuclar = self.son_sonuclar
+        try:
+            self.status_var.set("İstif taraması yapılıyor...")
+            self.root.update_idletasks()
+            dizi = StackedArray(sonuclar)
+            taramalar = {eksen: dizi.sweep(eksen, counts=range(1, 9)) for eksen in ("vertical", "horizontal")}
+        except (ValueError, np.linalg.LinAlgError) as e:
+            messagebox.showerror("Hata", f"İstif hesabı başarısız:\n{e}")
+            self.status_var.set("İstif hesabı hatası.")
+            return
+        lam = dizi.wavelength
+
+        pencere = tk.Toplevel(self.root)
+        pencere.title(f"İstifleme - {sonuclar['tip']} {sonuclar['frekans']} MHz")
+        kontrol = ttk.Frame(pencere, padding=(8, 4))
+        kontrol.pack(fill="x")
+        satir, sutun = tk.IntVar(value=2), tk.IntVar(value=1)
+        en_iyi = {eksen: taramalar[eksen]["optimum"][1]["spacing_wl"] for eksen in taramalar}
+        d_dikey = tk.DoubleVar(value=round(en_iyi["vertical"], 2))
+        d_yatay = tk.DoubleVar(value=round(en_iyi["horizontal"], 2))
+        for i, (etiket, var) in enumerate((("Dikey sayı", satir), ("Yatay sayı", sutun))):
+            ttk.Label(kontrol, text=etiket).grid(row=i, column=0, sticky="w")
+            ttk.Spinbox(kontrol, from_=1, to=8, width=4, textvariable=var, state="readonly",
+                        command=lambda: guncelle()).grid(row=i, column=1, padx=(4, 12))
+        for i, (etiket, var) in enumerate((("Dikey aralık (λ)", d_dikey), ("Yatay aralık (λ)", d_yatay))):
+            ttk.Label(kontrol, text=etiket).grid(row=i, column=2, sticky="w")
+            ttk.Scale(kontrol, from_=0.3, to=3.0, variable=var, length=260,
+                      command=lambda _: guncelle()).grid(row=i, column=3, padx=4)
+        bilgi = tk.StringVar()
+        ttk.Label(kontrol, textvariable=bilgi).grid(row=0, column=4, rowspan=2, sticky="w", padx=(12, 0))
+
+        fig = Figure(figsize=(10, 4), constrained_layout=True)
+        ax_t = fig.add_subplot(1, 2, 1)
+        ax_d = fig.add_subplot(1, 2, 2, projection='polar')
+        canvas = FigureCanvasTkAgg(fig, pencere)
+        canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        def guncelle():
+            n_v, n_h = satir.get(), sutun.get()
+            dv, dh = d_dikey.get(), d_yatay.get()
+            desen = dizi.pattern(n_v, n_h, dv * lam, dh * lam)
+            ax_t.clear()
+            for eksen, n, d, renk, ad in (("vertical", n_v, dv, 'tab:blue', "dikey"),
+                                          ("horizontal", n_h, dh, 'tab:orange', "yatay")):
+                if n < 2:
+                    continue
+                t = taramalar[eksen]
+                c = int(np.flatnonzero(t["counts"] == n)[0])
+                ax_t.plot(t["spacings_wl"], t["stack_gain"][c], color=renk, label=f"{n} anten {ad}")
+                ax_t.axvline(d, color=renk, linestyle='--', linewidth=1)
+            ax_t.set_xlabel("İstif aralığı (λ)")
+            ax_t.set_ylabel("İstif kazancı (dB)")
+            ax_t.grid(True, alpha=0.3)
+            if n_v > 1 or n_h > 1:
+                ax_t.legend(loc="lower right")
+            ax_d.clear()
+            for duzlem, renk, ad in (("e_plane", 'tab:red', "E"), ("h_plane", 'tab:green', "H")):
+                veri = desen[duzlem]
+                ax_d.plot(np.radians(veri["angle_deg"]), veri["gain_dbi"], color=renk, label=f"{ad} düzlemi")
+            ax_d.set_rlim(desen["peak_gain"] - 40, desen["peak_gain"] + 2)
+            ax_d.legend(loc="lower left", fontsize=8)
+            def sayi(v, fmt):
+                return "-" if v is None else format(v, fmt)
+            bilgi.set(f"{n_v}×{n_h}: {desen['peak_gain']:.2f} dBi (+{desen['stack_gain']:.2f} dB)\n"
+                      f"E-BW {sayi(desen['beamwidth_e'], '.1f')}°, H-BW {sayi(desen['beamwidth_h'], '.1f')}°, "
+                      f"F/B {sayi(desen['fb'], '.1f')} dB\n"
+                      f"aralık {dv * lam:.2f} m × {dh * lam:.2f} m")
+            canvas.draw_idle()
+
+        guncelle()
+        ozet = ", ".join(f"{o['count']}: {o['spacing_wl']:.2f}λ +{o['stack_gain']:.2f} dB"
+                         for o in taramalar["vertical"]["optimum"][1:])
+        self.status_var.set(f"İstifleme - dikey en iyi aralıklar {ozet}")
+
+    # Seçili bant boyunca MoM empedansına gamma / hairpin / L / hat transformatörü uyumlama
+    def empedans_uyumlama(self):
+        import numpy as np
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from uyumlama import component_text, match_design
+
+        if self.son_sonuclar is None:
+            self.hesapla()
+            if self.son_sonuclar is None:
+                return
+        sonuclar = self.son_sonuclar
+        f0 = sonuclar['frekans']
+        kenarlar = band_edges(self.bant_sec.get())
+        if kenarlar is None or not (kenarlar[0] <= f0 <= kenarlar[1]):
+            kenarlar = (f0 * 0.99, f0 * 1.01) # Bant dışı frekans: ±%1
+        try:
+            hedef = float(self.vswr.get())
+        except ValueError:
+            hedef = 1.5
+
+        try:
+            self.status_var.set("Uyumlama devreleri hesaplanıyor...")
+            self.root.update_idletasks()
+            res = match_design(sonuclar, *kenarlar, points=81, swr_target=hedef)
+        except (ValueError, np.linalg.LinAlgError) as e:
+            messagebox.showerror("Hata", f"Uyumlama başarısız:\n{e}")
+            self.status_var.set("Uyumlama hatası.")
+            return
+
+        adlar = {"l_network": "L devresi", "quarter_wave": "Hat transformatörü",
+                 "gamma": "Gamma", "hairpin": "Hairpin"}
+        pencere = tk.Toplevel(self.root)
+        pencere.title(f"Empedans Uyumlama - {sonuclar['tip']} {kenarlar[0]}-{kenarlar[1]} MHz")
+        fig = Figure(figsize=(7,4), constrained_layout=True)
+        ax = fig.add_subplot(1, 1, 1)
+        f = res['freqs_mhz']
+        ax.plot(f, res['unmatched_swr'], color='gray', linestyle=':', label="Uyumsuz")
+        for ad, devre in res['networks'].items():
+            if devre is not None:
+                ax.plot(f, devre['swr'], label=adlar[ad], linewidth=2 if ad == res['best'] else 1)
+        ax.axhline(hedef, color='tab:red', linestyle='--', linewidth=1)
+        ax.set_ylim(1.0, max(2.0, min(float(res['unmatched_swr'].max()), 5.0)))
+        ax.set_xlabel("Frekans (MHz)")
+        ax.set_ylabel(f"VSWR ({res['z0']:g} Ω)")
+        ax.grid(True, alpha=0.35)
+        ax.legend()
+        canvas = FigureCanvasTkAgg(fig, pencere)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        z = res['load']
+        satirlar = [f"Besleme empedansı ({f0} MHz): {z.real:.1f} {'+' if z.imag >= 0 else '-'} j{abs(z.imag):.1f} Ω"]
+        for ad, devre in res['networks'].items():
+            if devre is None:
+                satirlar.append(f"{adlar[ad]}: bu empedansta gerçeklenemez")
             else:
-                self.status_var.set("Optimizasyon tamamlandı.")
+                satirlar.append(f"{adlar[ad]}: VSWR ≤ {devre['swr_max']:.2f} "
+                                f"(SWR ≤ {hedef:g} bant genişliği {devre['bandwidth_mhz']:.2f} MHz) - "
+                                f"{component_text(ad, devre['components'])}")
+        ttk.Label(pencere, text="\n".join(satirlar), justify="left", padding=(8,4)).pack(fill="x")
 
-        except Exception as e:
-            messagebox.showerror("Hata", f"Optimizasyon sırasında sorun oluştu:\n{e}")
-            self.status_var.set("Optimizasyon hatası.")
+        if res['best'] is None:
+            self.status_var.set("Uyumlama: hiçbir devre gerçeklenemedi.")
+        else:
+            self.status_var.set(f"Uyumlama: en iyi {adlar[res['best']]}, bant boyunca VSWR ≤ "
+                                f"{res['networks'][res['best']]['swr_max']:.2f} ({res['exact_solves']} MoM çözümü)")
 
 
 def main():
@@ -483,4 +1172,4 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
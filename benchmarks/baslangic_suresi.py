@@ -0,0 +1,114 @@
+# benchmarks/baslangic_suresi.py
+"""
+Açılış Süresi Ölçümü
+`python -X importtime -c "import anten_tasarim"` çıktısını ayrıştırarak toplam içe
+aktarma süresini ve en pahalı modülleri raporlar; açılışta numpy/matplotlib gibi ağır
+modüllerin yüklenmediğini doğrular. Ekran varsa ilk pencerenin görünme süresini de
+ölçer (ekran yoksa bu adım atlanır).
+
+Örnek:
+    python benchmarks/baslangic_suresi.py --threshold-ms 300 --json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Açılışta yüklenmemesi gereken modüller (ilk çizim/optimizasyonda yüklenir)
+YASAK_MODULLER = ("numpy", "matplotlib", "anten_cizim", "yagi_optimizasyon_modulu", "mom_cozucu", "frekans_taramasi", "isima_deseni",
+                  "sonuc_deposu", "tolerans_analizi", "calisma_kaydi", "numba",
+                  "istif_dizisi", "uyumlama")
+
+# İlk pencere: arayüz kurulur, ilk boyama beklenir ve süre yazdırılır
+_ILK_PENCERE = r"""
+import time
+t0 = time.perf_counter()
+import tkinter as tk
+import anten_tasarim
+root = tk.Tk()
+anten_tasarim.AntenTasarimUygulamasi(root)
+root.update()
+print(time.perf_counter() - t0)
+root.destroy()
+"""
+
+
+def _calistir(args):
+    return subprocess.run([sys.executable, *args], cwd=REPO, capture_output=True, text=True)
+
+
+def import_times(module="anten_tasarim"):
+    """
+    -X importtime çıktısından {modül: kümülatif µs} sözlüğü ve üst düzey modülün
+    kümülatif süresini (µs) döndürür.
+    """
+    proc = _calistir(["-X", "importtime", "-c", f"import {module}"])
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if not parts[1].isdigit():  # başlık satırı
+            continue
+        times[parts[2].strip()] = int(parts[1])
+    return times, times.get(module, 0)
+
+
+def first_window_ms():
+    """İlk pencerenin boyanma süresi (ms); ekran yoksa None."""
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        return None
+    proc = _calistir(["-c", _ILK_PENCERE])
+    if proc.returncode != 0:
+        return None
+    return float(proc.stdout.strip().splitlines()[-1]) * 1000.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="anten_tasarim açılış süresi ölçümü")
+    parser.add_argument("--repeat", type=int, default=5, help="Ölçüm tekrarı (en iyisi alınır)")
+    parser.add_argument("--top", type=int, default=10, help="Listelenecek en pahalı modül sayısı")
+    parser.add_argument("--threshold-ms", type=float, help="İçe aktarma süresi bu değeri aşarsa hata kodu")
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yaz")
+    args = parser.parse_args(argv)
+
+    best, times = None, {}
+    for _ in range(max(1, args.repeat)):
+        t, total = import_times()
+        if best is None or total < best:
+            best, times = total, t
+    yuklenen = sorted({m.split(".")[0] for m in times} & set(YASAK_MODULLER))
+    pencere = first_window_ms()
+    sonuc = {
+        "import_ms": best / 1000.0,
+        "first_window_ms": pencere,
+        "heavy_modules_loaded": yuklenen,
+        "top_imports": [{"module": m, "ms": us / 1000.0}
+                        for m, us in sorted(times.items(), key=lambda kv: -kv[1])[:args.top]],
+    }
+
+    if args.json:
+        print(json.dumps(sonuc, indent=2, ensure_ascii=False))
+    else:
+        print(f"import anten_tasarim: {sonuc['import_ms']:.1f} ms")
+        print("ilk pencere: " + (f"{pencere:.1f} ms" if pencere is not None else "ölçülmedi (ekran yok)"))
+        for item in sonuc["top_imports"]:
+            print(f"  {item['ms']:8.1f} ms  {item['module']}")
+
+    hata = False
+    if yuklenen:
+        print("HATA: açılışta ağır modüller yüklendi: " + ", ".join(yuklenen), file=sys.stderr)
+        hata = True
+    if args.threshold_ms is not None and sonuc["import_ms"] > args.threshold_ms:
+        print(f"HATA: içe aktarma {sonuc['import_ms']:.1f} ms > {args.threshold_ms} ms", file=sys.stderr)
+        hata = True
+    return 1 if hata else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
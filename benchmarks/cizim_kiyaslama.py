@@ -0,0 +1,154 @@
+# benchmarks/cizim_kiyaslama.py
+"""
+Çizim Bellek ve Gecikme Ölçümü
+Ekransız (Agg) bir tuval üzerinde ardışık yeniden hesaplamaları çizer; her çizimin
+gecikmesini ve süreç belleğindeki (RSS; --tracemalloc ile Python ayırmaları) artışı
+ölçer. Kalıcı tuvalde bellek, ısınmadan sonra sabit kalmalıdır. --eski ile her çağrıda plt.subplots kuran eski
+yöntem de ölçülür (karşılaştırma için).
+İki dizi ölçülür: "persistent" tip/frekans değiştiği için her seferinde tam çizim yapar;
+"persistent_blit" görünümü (tip, frekans, eksen sınırları) sabit tutup yalnızca eleman
+boylarını değiştirir ve havuzlanmış nesnelerin blitting yolunu ölçer. Bu dizide hiç blit
+yapılmazsa hata kodu döner.
+
+Örnek:
+    python benchmarks/cizim_kiyaslama.py -n 1000 --eski
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from anten_cekirdek import monopol_hesapla, dipol_hesapla, yagi_uda_hesapla
+from anten_cizim import AntenCizimi
+
+
+def tasarimlar(n):
+    """Tip, frekans ve eleman sayısı değişen n tasarım (tekrarlanabilir sıra)."""
+    for i in range(n):
+        frekans = 144.0 + (i % 40) * 0.05
+        if i % 10 < 6:
+            yield yagi_uda_hesapla(frekans, 3 + i % 8)
+        elif i % 10 < 8:
+            yield dipol_hesapla(frekans, 0.004)
+        else:
+            yield monopol_hesapla(frekans, 0.004)
+
+
+def sabit_gorunum(n):
+    """Aynı frekans ve eleman sayısında yalnızca eleman boyları değişen n Yagi (görünüm sabit)."""
+    for i in range(n):
+        oran = 0.0004 * (i % 25)
+        yield yagi_uda_hesapla(145.0, 6, aktif_factor=0.47 + oran, direktor_base_factor=0.45 + oran)
+
+
+def _rss_kb():
+    # Linux'ta anlık RSS; diğer sistemlerde tepe RSS (yaklaşık)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024.0
+    except OSError:
+        import resource
+        return float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def _olc(ciz, n, isinma, izle=False, dizi=tasarimlar):
+    # izle=True: tracemalloc ile Python ayırmaları (çok daha yavaş), aksi halde RSS
+    if izle:
+        tracemalloc.start()
+        bellek = lambda: tracemalloc.get_traced_memory()[0] / 1024.0
+    else:
+        bellek = _rss_kb
+    gecikmeler = []
+    taban = None
+    for i, sonuc in enumerate(dizi(n)):
+        t0 = time.perf_counter()
+        ciz(sonuc)
+        gecikmeler.append((time.perf_counter() - t0) * 1000.0)
+        if i + 1 == isinma:
+            taban = bellek()
+    son = bellek()
+    if izle:
+        tracemalloc.stop()
+    gecikmeler.sort()
+    return {
+        "redraws": n,
+        "memory": "tracemalloc" if izle else "rss",
+        "median_ms": statistics.median(gecikmeler),
+        "p95_ms": gecikmeler[int(0.95 * (len(gecikmeler) - 1))],
+        "growth_kb": son - (taban if taban is not None else son),
+    }
+
+
+def kalici(n, isinma, izle=False, dizi=tasarimlar):
+    fig = Figure(figsize=(8, 5), constrained_layout=True)
+    cizim = AntenCizimi(fig, FigureCanvasAgg(fig))
+    sonuc = _olc(cizim.guncelle, n, isinma, izle, dizi)
+    sonuc["full_draws"] = cizim.tam_cizim
+    sonuc["blit_draws"] = cizim.blit_cizim
+    sonuc["artists"] = len(cizim.ax.lines) + len(cizim.ax.texts)
+    return sonuc
+
+
+def eski(n, isinma, izle=False):
+    # Önceki davranış: her çağrıda yeni pyplot figürü, eskisi kapatılmaz
+    import matplotlib.pyplot as plt
+    plt.rcParams["figure.max_open_warning"] = 0
+
+    def ciz(sonuclar):
+        fig = plt.figure(figsize=(8, 5), constrained_layout=True)
+        AntenCizimi(fig, FigureCanvasAgg(fig)).guncelle(sonuclar)
+
+    try:
+        return _olc(ciz, n, isinma, izle)
+    finally:
+        plt.close("all")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kalıcı tuval çizim bellek/gecikme ölçümü")
+    parser.add_argument("-n", type=int, default=1000, help="Ardışık yeniden hesaplama sayısı")
+    parser.add_argument("--warmup", type=int, default=100, help="Bellek tabanı bu kadar çizimden sonra alınır")
+    parser.add_argument("--max-growth-kb", type=float, default=2048.0, help="Isınma sonrası izin verilen bellek artışı")
+    parser.add_argument("--tracemalloc", action="store_true", help="RSS yerine Python ayırmalarını izle (yavaş)")
+    parser.add_argument("--eski", action="store_true", help="Eski figür-başına-çağrı yöntemini de ölç")
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yaz")
+    args = parser.parse_args(argv)
+
+    sonuc = {"persistent": kalici(args.n, args.warmup, args.tracemalloc),
+             "persistent_blit": kalici(args.n, args.warmup, args.tracemalloc, sabit_gorunum)}
+    if args.eski:
+        sonuc["figure_per_call"] = eski(args.n, args.warmup, args.tracemalloc)
+
+    if args.json:
+        print(json.dumps(sonuc, indent=2))
+    else:
+        for ad, r in sonuc.items():
+            print(f"{ad}: medyan {r['median_ms']:.2f} ms, p95 {r['p95_ms']:.2f} ms, "
+                  f"bellek artışı {r['growth_kb']:.0f} KB ({r['memory']})")
+            if "blit_draws" in r:
+                print(f"  tam çizim {r['full_draws']}, blit {r['blit_draws']}, nesne sayısı {r['artists']}")
+
+    hata = 0
+    for ad in ("persistent", "persistent_blit"):
+        if sonuc[ad]["growth_kb"] > args.max_growth_kb:
+            print(f"HATA: {ad} bellek artışı {sonuc[ad]['growth_kb']:.0f} KB > {args.max_growth_kb} KB",
+                  file=sys.stderr)
+            hata = 1
+    if sonuc["persistent_blit"]["blit_draws"] == 0:
+        print("HATA: sabit görünümde hiç blit yapılmadı (blitting yolu ölçülmedi)", file=sys.stderr)
+        hata = 1
+    return hata
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+# benchmarks/kiyaslama.py
+"""
+Performans Kıyaslama Takımı
+Tahmincileri (estimate_impedance, estimate_gain), optimize_yagi'yi (step × eleman
+sayısı matrisi) ve arayüzsüz boyut hesaplarını (monopol/dipol/yagi_uda_hesapla) ölçer.
+Her ölçüm için çağrı süresi, saniyedeki değerlendirme sayısı ve tracemalloc tepe
+belleği JSON olarak kaydedilir. optimize_yagi ölçümlerinde değerlendirme sayısı izleyicinin
+"points" sayacıdır (gerçekten puanlanan nokta; budama atlananları saymaz), tam grid boyutu
+ayrıca "grid_points" alanındadır; kaydedilmiş bir taban çizgisiyle karşılaştırılıp eşiği
+aşan yavaşlamalarda hata kodu döner. Ekran gerektirmez.
+
+Örnek:
+    python benchmarks/kiyaslama.py --output taban.json
+    python benchmarks/kiyaslama.py --baseline taban.json --threshold 0.15
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import yagi_optimizasyon_modulu as yom
+from izleme import Tracer
+from anten_cekirdek import monopol_hesapla, dipol_hesapla, yagi_uda_hesapla
+from uyumlama import match_batch
+
+# optimize_yagi matrisi (DEFAULT_RANGES üzerinde: step küçüldükçe grid büyür)
+STEPS = (0.02, 0.01, 0.005)
+ELEMENT_COUNTS = (3, 6, 10)
+# Bellek karşılaştırmasında gürültüyü yok saymak için alt sınır (KB)
+MIN_MEMORY_KB = 64.0
+
+
+def _tahminci_girdileri(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lam = 2.0675
+    return [(float(r), float(a), float(d), float(s), lam, 0.002)
+            for r, a, d, s in zip(rng.uniform(0.50, 0.56, n) * lam, rng.uniform(0.46, 0.52, n) * lam,
+                                  rng.uniform(0.42, 0.48, n) * lam, rng.uniform(0.14, 0.22, n) * lam)]
+
+
+def _grid_noktasi(step, ranges=yom.DEFAULT_RANGES):
+    # Aralıklar üzerindeki tam grid boyutu (değerlendirme sayısı)
+    return int(np.prod([yom._range_axis(lo, hi, step).size for lo, hi in ranges.values()]))
+
+
+def cases():
+    """
+    (ad, çağrılabilir, çağrı başına değerlendirme sayısı, izli) listesi. izli ölçümlerde
+    çağrılabilir tracer argümanı alır ve verilen sayı tam grid boyutudur; değerlendirme
+    sayısı izden okunur (bkz. measure).
+    """
+    n = 10_000
+    girdiler = _tahminci_girdileri(n)
+    kazanc = [(3 + i % 12, 0.14 + (i % 9) * 0.01) for i in range(n)]
+    dizi = [np.array(v) for v in list(zip(*girdiler))[:4]] + list(girdiler[0][4:])
+
+    out = [
+        ("estimate_impedance", lambda: [yom.estimate_impedance(*g) for g in girdiler], n, False),
+        ("estimate_gain", lambda: [yom.estimate_gain(e, s) for e, s in kazanc], n, False),
+        ("estimate_impedance_np", lambda: yom.estimate_impedance_np(*dizi), n, False),
+    ]
+    # Varsayılan (ranges=None) arama her step'te ±2 adımlık 5⁴ noktadır; matrisin step
+    # boyutunu ölçmesi için sabit aralıklar verilir
+    for step in STEPS:
+        nokta = _grid_noktasi(step)
+        for count in ELEMENT_COUNTS:
+            out.append((f"optimize_yagi[step={step},n={count}]",
+                        lambda tracer, step=step, count=count: yom.optimize_yagi(
+                            145.0, count, step, 0.004, ranges=yom.DEFAULT_RANGES, tracer=tracer), nokta, True))
+    # Skaler yol ranges desteklemez: her zaman ±2 adımlık varsayılan grid
+    nokta = int(np.prod([f.size for f in yom._search_factors(0.01)]))
+    out.append(("optimize_yagi[step=0.01,n=6,scalar]",
+                lambda tracer: yom.optimize_yagi(145.0, 6, 0.01, 0.004, vectorized=False, tracer=tracer),
+                nokta, True))
+    out.append(("optimize_yagi[step=0.01,n=6,noprune]",
+                lambda tracer: yom.optimize_yagi(145.0, 6, 0.01, 0.004, prune=False, ranges=yom.DEFAULT_RANGES,
+                                                 tracer=tracer),
+                _grid_noktasi(0.01), True))
+    # Skor çekirdekleri (tam grid, budamasız); yalnızca bu ortamda kullanılabilenler
+    nokta = _grid_noktasi(0.005)
+    for backend in yom.available_backends():
+        if backend != "python":
+            out.append((f"optimize_yagi[step=0.005,n=6,noprune,{backend}]",
+                        lambda tracer, backend=backend: yom.optimize_yagi(
+                            145.0, 6, 0.005, 0.004, prune=False, ranges=yom.DEFAULT_RANGES, backend=backend,
+                            tracer=tracer),
+                        nokta, True))
+
+    # Uyumlama sentezi: optimizasyon adaylarının tahmini empedansları, bant başına 41 frekans
+    yukler = np.array([yom.estimate_impedance(*g) for g in girdiler[:100]])
+    bant = np.linspace(144.0, 146.0, 41)
+    out.append(("match_batch[N=100]", lambda: match_batch(yukler, bant, element_diameter_m=0.004), yukler.size,
+                False))
+
+    frekanslar = [144.0 + 0.01 * i for i in range(1000)]
+    out += [
+        ("monopol_hesapla", lambda: [monopol_hesapla(f, 0.004) for f in frekanslar], len(frekanslar), False),
+        ("dipol_hesapla", lambda: [dipol_hesapla(f, 0.004) for f in frekanslar], len(frekanslar), False),
+        ("yagi_uda_hesapla", lambda: [yagi_uda_hesapla(f, 3 + int(f) % 8) for f in frekanslar], len(frekanslar),
+         False),
+    ]
+    return out
+
+
+def measure(fn, evaluations, min_time=0.2, repeat=3, traced=False):
+    """
+    En iyi çağrı süresi (tekrarların en küçüğü), değerlendirme/s ve tepe bellek (KB).
+    traced ise fn(tracer) çağrılır: süre izleme kapalıyken (NULL) ölçülür, değerlendirme
+    sayısı ayrı bir izli çağrının "points" sayacıdır ve evaluations grid_points olarak yazılır.
+    """
+    grid_points = None
+    if traced:
+        tr = Tracer()
+        fn(tr)  # ısınma + puanlanan nokta sayısı
+        grid_points, evaluations = evaluations, tr.counters.get("points", 0)
+        fn = partial(fn, None)
+    else:
+        fn()  # ısınma
+    best = float("inf")
+    for _ in range(repeat):
+        calls, t0 = 0, time.perf_counter()
+        while True:
+            fn()
+            calls += 1
+            elapsed = time.perf_counter() - t0
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+    # Bellek ayrı ölçülür (tracemalloc süreyi bozmasın)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    out = {
+        "seconds_per_call": best,
+        "evaluations": evaluations,
+        "evals_per_sec": evaluations / best,
+        "peak_kb": peak / 1024.0,
+    }
+    if grid_points is not None:
+        out["grid_points"] = grid_points
+    return out
+
+
+def compare(results, baseline, threshold):
+    """Taban çizgisine göre gerilemeler: [(ad, ölçü, eski, yeni)]."""
+    regressions = []
+    for name, r in results.items():
+        b = baseline.get(name)
+        if b is None:
+            continue
+        if r["evals_per_sec"] < b["evals_per_sec"] * (1.0 - threshold):
+            regressions.append((name, "evals_per_sec", b["evals_per_sec"], r["evals_per_sec"]))
+        if r["peak_kb"] > max(b["peak_kb"] * (1.0 + threshold), MIN_MEMORY_KB):
+            regressions.append((name, "peak_kb", b["peak_kb"], r["peak_kb"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tahminci, optimizasyon ve boyut hesabı kıyaslamaları")
+    parser.add_argument("--output", help="Sonuçları bu JSON dosyasına yaz (taban çizgisi olarak da kullanılabilir)")
+    parser.add_argument("--baseline", help="Karşılaştırılacak taban çizgisi JSON dosyası")
+    parser.add_argument("--threshold", type=float, default=0.15, help="İzin verilen göreli gerileme (0.15 = %%15)")
+    parser.add_argument("--filter", default="", help="Yalnızca adında bu metin geçen ölçümler")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Tekrar başına en az süre (s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Tekrar sayısı (en iyisi alınır)")
+    parser.add_argument("--json", action="store_true", help="Sonuçları stdout'a JSON olarak yaz")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, fn, evaluations, traced in cases():
+        if args.filter in name:
+            results[name] = measure(fn, evaluations, args.min_time, args.repeat, traced)
+            if not args.json:
+                r = results[name]
+                grid = f"  {r['evaluations']:,}/{r['grid_points']:,} puanlanan/grid" if "grid_points" in r else ""
+                print(f"{name:42s} {r['seconds_per_call']*1e3:10.3f} ms  {r['evals_per_sec']:14,.0f} değ/s  "
+                      f"{r['peak_kb']:10.1f} KB{grid}", flush=True)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, metric, old, new in regressions:
+            print(f"GERİLEME: {name} {metric}: {old:,.1f} -> {new:,.1f}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"Taban çizgisine göre gerileme yok (eşik %{args.threshold*100:.0f}).", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
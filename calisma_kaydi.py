@@ -0,0 +1,207 @@
+# calisma_kaydi.py
+"""
+Kalıcı (Devam Ettirilebilir) Optimizasyon Çalışmaları
+Uzun bir grid taraması parçalara (shard) bölünür; her parça bittiğinde sonucu diskteki
+bellek eşlemeli (np.memmap) dizilere yazılır ve diske aktarılır. Süreç ölürse ya da
+pencere kapanırsa aynı dizinle yeniden başlatılan çalışma yalnızca bitmemiş parçaları
+tarar. Biten çalışmalar salt okunur açılarak (mmap_mode="r") belleğe yüklenmeden
+incelenebilir.
+
+Dizin içeriği:
+    meta.json    parametreler, parametre anahtarı, durum
+    shards.npy   parça başına: aralık, bitti bayrağı, en iyi skor/indeks, süre
+    records.npy  (isteğe bağlı) parça başına en iyi k aday (sonuc_deposu.RECORD_DTYPE)
+Bir parça önce sonuçları, sonra "done" bayrağı yazılarak işaretlenir; yarıda kalan
+yazma bir sonraki açılışta bitmemiş sayılır.
+"""
+import json
+import os
+import time
+
+import numpy as np
+
+from onbellek import make_key
+from sonuc_deposu import RECORD_DTYPE, TopKStore
+
+SHARD_DTYPE = np.dtype([
+    ("start", np.int64),
+    ("stop", np.int64),
+    ("done", np.uint8),
+    ("score", np.float64),
+    ("flat", np.int64),
+    ("kept", np.int64),      # records.npy satırındaki geçerli kayıt sayısı
+    ("seconds", np.float64),
+])
+
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+
+
+def _write_json(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+class RunStore:
+    """
+    Bir çalışmanın disk kaydı. Doğrudan kurmak yerine open_or_create (yazarak devam)
+    veya open (salt okunur inceleme) kullanılır.
+    """
+
+    def __init__(self, directory, meta, shards, records):
+        self.directory = directory
+        self.meta = meta
+        self.shards = shards
+        self.records = records
+
+    # --- açma ---
+    @classmethod
+    def open(cls, directory, mode="r"):
+        """Var olan çalışmayı açar; mode="r" iken diziler salt okunur bellek eşlemesidir."""
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        shards = np.load(os.path.join(directory, "shards.npy"), mmap_mode=mode)
+        path = os.path.join(directory, "records.npy")
+        records = np.load(path, mmap_mode=mode) if os.path.exists(path) else None
+        return cls(directory, meta, shards, records)
+
+    @classmethod
+    def open_or_create(cls, directory, params, bounds, keep=0):
+        """
+        params ile aynı çalışma dizinde varsa devam etmek üzere açar, yoksa oluşturur.
+        bounds: parça sınırları (n+1 düz indeks), keep: parça başına saklanacak aday sayısı.
+        Dizinde farklı parametreli bir çalışma varsa ValueError.
+        """
+        key = make_key("run", params)
+        if os.path.exists(os.path.join(directory, "meta.json")):
+            run = cls.open(directory, mode="r+")
+            if run.meta["key"] != key:
+                raise ValueError(f"{directory} farklı parametreli bir çalışma içeriyor.")
+            return run
+
+        os.makedirs(directory, exist_ok=True)
+        bounds = np.asarray(bounds, dtype=np.int64)
+        shards = np.lib.format.open_memmap(os.path.join(directory, "shards.npy"), mode="w+",
+                                           dtype=SHARD_DTYPE, shape=(bounds.size - 1,))
+        shards["start"] = bounds[:-1]
+        shards["stop"] = bounds[1:]
+        shards["score"] = np.nan
+        shards["flat"] = -1
+        shards.flush()
+        records = None
+        if keep:
+            records = np.lib.format.open_memmap(os.path.join(directory, "records.npy"), mode="w+",
+                                                dtype=RECORD_DTYPE, shape=(bounds.size - 1, keep))
+            records.flush()
+        # meta en son yazılır: meta.json varsa diziler tamdır
+        meta = {"key": key, "params": params, "status": STATUS_RUNNING, "keep": int(keep),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        _write_json(os.path.join(directory, "meta.json"), meta)
+        return cls(directory, meta, shards, records)
+
+    # --- yazma ---
+    def pending(self):
+        """Bitmemiş parçaların indeksleri."""
+        return np.flatnonzero(self.shards["done"] == 0)
+
+    def record(self, i, score, flat, seconds, records=None):
+        """i. parçanın sonucunu yazar; önce veriler, sonra bitti bayrağı diske aktarılır."""
+        s = self.shards
+        s["score"][i] = np.nan if score is None else score
+        s["flat"][i] = -1 if flat is None else flat
+        s["seconds"][i] = seconds
+        if self.records is not None and records is not None:
+            n = min(records.size, self.records.shape[1])
+            self.records[i, :n] = records[:n]
+            s["kept"][i] = n
+            self.records.flush()
+        s.flush()
+        s["done"][i] = 1
+        s.flush()
+
+    def finish(self):
+        self.meta["status"] = STATUS_DONE
+        self.meta["finished"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        _write_json(os.path.join(self.directory, "meta.json"), self.meta)
+
+    # --- okuma ---
+    @property
+    def complete(self):
+        return bool(np.all(self.shards["done"]))
+
+    def progress(self):
+        """(biten nokta, toplam nokta, biten parça, toplam parça)."""
+        s = self.shards
+        done = s["done"].astype(bool)
+        sizes = s["stop"] - s["start"]
+        return int(sizes[done].sum()), int(sizes.sum()), int(done.sum()), int(s.size)
+
+    def best(self):
+        """Biten parçalar içinde en iyi (skor, düz indeks); eşitlikte küçük indeks. Yoksa None."""
+        s = self.shards
+        ok = np.flatnonzero((s["done"] == 1) & (s["flat"] >= 0))
+        if ok.size == 0:
+            return None
+        order = np.lexsort((s["flat"][ok], -s["score"][ok]))
+        i = ok[order[0]]
+        return float(s["score"][i]), int(s["flat"][i])
+
+    def shard_records(self, i):
+        """i. parçanın saklanan adayları (bellek eşlemesi üzerinde görünüm)."""
+        if self.records is None:
+            return None
+        return self.records[i, :int(self.shards["kept"][i])]
+
+    def top(self, k=None):
+        """Biten parçaların adaylarından en iyi k tanesi (TopKStore); parçalar tek tek okunur."""
+        if self.records is None:
+            return None
+        store = TopKStore(k or self.meta["keep"])
+        for i in np.flatnonzero(self.shards["done"] == 1):
+            store.push_array(self.shard_records(i))
+        return store
+
+
+if __name__ == "__main__":
+    import tempfile
+    import yagi_optimizasyon_modulu as yom
+    from izleme import Tracer
+
+    ranges = dict(yom.DEFAULT_RANGES, director=(0.40, 0.42))
+    args = (145.0, 6, 0.002, 0.004)
+    kw = dict(ranges=ranges, prune=False, checkpoint_points=400_000)
+    ref = yom.optimize_yagi(*args, ranges=ranges, prune=False)
+    ref_store = TopKStore(100)
+    yom.optimize_yagi(*args, ranges=ranges, prune=False, store=ref_store)
+
+    with tempfile.TemporaryDirectory() as d:
+        # max_seconds=0: her çağrı tek parça işleyip durur (süreç ölmüş gibi)
+        assert yom.optimize_yagi(*args, checkpoint=d, max_seconds=0, store=TopKStore(100), **kw) is None
+        run = RunStore.open(d)
+        done, total, n_done, n_shards = run.progress()
+        print(f"ilk çağrı: {n_done}/{n_shards} parça, {done:,}/{total:,} nokta, durum {run.meta['status']}")
+
+        tr = Tracer()
+        store = TopKStore(100)
+        res = yom.optimize_yagi(*args, checkpoint=d, store=store, tracer=tr, **kw)
+        assert res == ref
+        assert tr.counters["points"] == total - done and tr.counters["resumed"] == done
+        assert np.array_equal(store.array, ref_store.array)
+        print(f"devam: {tr.counters['points']:,} nokta tarandı, {tr.counters['resumed']:,} atlandı")
+
+        # Biten çalışma salt okunur açılır ve yeniden çağrı hiçbir şey taramaz
+        run = RunStore.open(d)
+        assert run.meta["status"] == STATUS_DONE and not run.shards.flags.writeable
+        print("en iyi:", run.best(), "| ilk aday:", run.top(5).array[0])
+        tr = Tracer()
+        assert yom.optimize_yagi(*args, checkpoint=d, store=TopKStore(100), tracer=tr, **kw) == ref
+        assert tr.counters.get("points", 0) == 0
+
+        # Farklı parametreler aynı dizine yazamaz
+        try:
+            yom.optimize_yagi(145.0, 7, 0.002, 0.004, checkpoint=d, **kw)
+            raise AssertionError("farklı parametre kabul edildi")
+        except ValueError as e:
+            print("beklenen hata:", e)
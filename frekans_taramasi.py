@@ -0,0 +1,113 @@
+# frekans_taramasi.py
+"""
+Hızlı Frekans Taraması
+Bir tasarımın besleme empedansını ve SWR'sini bant boyunca hesaplar.
+Birkaç çapa (anchor) frekansı MoM ile tam çözülür; aradaki noktalar empedansa
+uydurulan rasyonel bir fonksiyonla (Levy doğrusallaştırmalı en küçük kareler)
+bulunur. Çapalar arasındaki orta noktalar ayrıca tam çözülerek uydurma hatası
+ölçülür; hata toleransı aşılırsa bu noktalar çapaya eklenir ve uydurma tekrarlanır.
+Geometri (mesafeler, Gauss düğümleri) tüm tarama boyunca bir kez hesaplanır.
+"""
+import numpy as np
+
+from mom_cozucu import model_from_design
+
+
+def _fit_rational(x, z, order):
+    # z(x) ≈ P(x) / (1 + x Q(x)) ; P derecesi order, paydanın derecesi order
+    # Doğrusal sistem: P(x) - z * x Q(x) = z
+    V = np.vander(x, order + 1, increasing=True)
+    A = np.hstack([V, -z[:, None] * V[:, 1:]])
+    coef, *_ = np.linalg.lstsq(A, z, rcond=None)
+    return coef[:order + 1], coef[order + 1:]
+
+
+def _eval_rational(p, q, x):
+    V = np.vander(x, p.size, increasing=True)
+    return (V @ p) / (1.0 + V[:, 1:] @ q)
+
+
+def sweep_design(sonuclar, f_min_mhz, f_max_mhz, step_khz=1.0, z0=50.0,
+                 tol=1e-3, initial_anchors=5, max_anchors=33, segments=21):
+    """
+    Tasarımı [f_min, f_max] aralığında step_khz çözünürlükle tarar.
+    tol: orta noktalardaki en büyük bağıl empedans hatası |Z_fit - Z| / |Z|.
+    Dönüş: freqs_mhz, impedance (karmaşık), swr dizileri; anchors (MHz),
+    max_error (doğrulanan en büyük bağıl hata) ve exact_solves (tam çözüm sayısı).
+    """
+    if f_max_mhz <= f_min_mhz:
+        raise ValueError("f_max, f_min'den büyük olmalı.")
+    model, image = model_from_design(sonuclar, segments=segments)
+    feed = model.feed_index()
+    scale = 0.5 if image else 1.0
+
+    def exact(freqs_mhz):
+        return np.array([scale / model.solve(f * 1e6)[feed, 0] for f in freqs_mhz])
+
+    # Frekansı [-1, 1] aralığına normalize et (uydurmanın koşullanması için)
+    mid = 0.5 * (f_min_mhz + f_max_mhz)
+    half = 0.5 * (f_max_mhz - f_min_mhz)
+
+    anchors = np.linspace(f_min_mhz, f_max_mhz, initial_anchors)
+    z_anchor = exact(anchors)
+    solves = anchors.size
+    max_error = np.inf
+    while True:
+        order = min((anchors.size - 1) // 2, 6)
+        p, q = _fit_rational((anchors - mid) / half, z_anchor, order)
+
+        check = 0.5 * (anchors[1:] + anchors[:-1])
+        z_check = exact(check)
+        solves += check.size
+        err = np.abs(_eval_rational(p, q, (check - mid) / half) - z_check) / np.abs(z_check)
+        max_error = float(err.max())
+
+        if max_error <= tol or anchors.size >= max_anchors:
+            break
+        # Hatalı orta noktaları çapaya ekle (zaten tam çözüldüler)
+        bad = err > tol
+        anchors = np.concatenate([anchors, check[bad]])
+        z_anchor = np.concatenate([z_anchor, z_check[bad]])
+        order_idx = np.argsort(anchors)
+        anchors, z_anchor = anchors[order_idx], z_anchor[order_idx]
+
+    n_points = int(round((f_max_mhz - f_min_mhz) * 1000.0 / step_khz)) + 1
+    freqs = np.linspace(f_min_mhz, f_max_mhz, n_points)
+    z = _eval_rational(p, q, (freqs - mid) / half)
+    gamma = np.abs((z - z0) / (z + z0))
+    swr = (1 + gamma) / np.maximum(1 - gamma, 1e-12)
+    return {
+        "freqs_mhz": freqs,
+        "impedance": z,
+        "swr": swr,
+        "anchors": anchors,
+        "max_error": max_error,
+        "exact_solves": solves,
+    }
+
+
+if __name__ == "__main__":
+    import time
+    from mom_cozucu import C
+
+    lam = C / 145e6
+    k = 0.985 - 0.005 * np.log10(lam / 0.004)
+    dipol = {"tip": "Dipol", "frekans": 145.0, "uzunluk": lam / 2 * k, "cap_m": 0.004}
+
+    t0 = time.perf_counter()
+    res = sweep_design(dipol, 144.0, 146.0, step_khz=1.0)
+    dt = time.perf_counter() - t0
+    print(f"{res['freqs_mhz'].size} nokta, {res['exact_solves']} tam çözüm, "
+          f"hata={res['max_error']:.2e}, {dt*1000:.1f} ms")
+
+    # Doğrulama: rastgele noktalarda tam çözümle karşılaştır
+    model, _ = model_from_design(dipol)
+    idx = np.random.default_rng(0).integers(0, res["freqs_mhz"].size, 10)
+    exact = np.array([1 / model.solve(f * 1e6)[model.feed_index(), 0] for f in res["freqs_mhz"][idx]])
+    print("rastgele nokta bağıl hata:", float(np.max(np.abs(res["impedance"][idx] - exact) / np.abs(exact))))
+
+    t0 = time.perf_counter()
+    for f in res["freqs_mhz"][::100]:
+        model.solve(f * 1e6)
+    dt = (time.perf_counter() - t0) / res["freqs_mhz"][::100].size
+    print(f"tam tarama tahmini: {dt * res['freqs_mhz'].size * 1000:.0f} ms")
@@ -0,0 +1,193 @@
+# isima_deseni.py
+"""
+Uzak Alan Işıma Deseni
+MoM çözücüsünün segment akımlarından ışıma desenini hesaplar. Tüm teller z yönlü
+ve x ekseni (boom) üzerinde olduğundan alan ayrışır:
+    E(θ,φ) ∝ sinθ Σ_w F_w(θ) e^{jk x_w sinθ cosφ},   F_w(θ) = Σ_s I_ws Δ_w e^{jk z_ws cosθ}
+Eleman çarpanı F yalnızca θ'ya, dizi terimi tel konumlarına bağlıdır; θ/φ ızgarasının
+tamamı tek bir NumPy işlemiyle bulunur. Geometri x-z düzleminde olduğundan desen
+φ ↔ -φ simetriktir ve yalnızca tekil cosφ değerleri hesaplanır.
+
+İleri yön +x'tir. E düzlemi x-z düzlemi (elemanlar boyunca), H düzlemi x-y düzlemidir.
+Monopol tasarımları görüntü dipolü ile çözülür; desen üst yarı uzayla sınırlanır (+3 dB).
+"""
+import math
+import numpy as np
+
+from mom_cozucu import ETA0, C, model_from_design, solve_design
+
+# dBi değerlerinin alt sınırı (sıfır yönler için -inf yerine)
+FLOOR_DB = -100.0
+
+
+def _moments(model, currents):
+    # Akım momentleri I Δ, (tel, segment)
+    return np.asarray(currents).reshape(model.lengths.size, model.segments) * model.delta[:, None]
+
+
+def _element_factors(model, moments, k, theta):
+    # F_w(θ): (..., tel)
+    ez = np.exp(1j * k * np.cos(theta)[..., None, None] * model.z)
+    return np.einsum("ws,...ws->...w", moments, ez)
+
+
+def far_field_points(model, currents, freq_hz, theta, phi):
+    """Rastgele (θ, φ) noktalarında normalize edilmemiş uzak alan (aynı şekilli diziler)."""
+    k = 2 * math.pi * freq_hz / C
+    theta = np.asarray(theta, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+    f = _element_factors(model, _moments(model, currents), k, theta)
+    u = (np.sin(theta) * np.cos(phi))[..., None]
+    return np.sin(theta) * np.sum(f * np.exp(1j * k * u * model.positions), axis=-1)
+
+
+def far_field_grid(model, currents, freq_hz, theta_deg, phi_deg):
+    """
+    θ × φ ızgarasında (derece) normalize edilmemiş uzak alan, şekil (Nθ, Nφ).
+    Eleman çarpanı θ başına bir kez, dizi terimi yalnızca tekil |φ| değerleri için hesaplanır.
+    """
+    k = 2 * math.pi * freq_hz / C
+    theta = np.radians(np.asarray(theta_deg, dtype=float))
+    phi_deg = np.asarray(phi_deg, dtype=float) % 360.0
+    folded, inverse = np.unique(np.minimum(phi_deg, 360.0 - phi_deg), return_inverse=True)
+    f = _element_factors(model, _moments(model, currents), k, theta)              # (Nθ, W)
+    u = np.sin(theta)[:, None] * np.cos(np.radians(folded))[None, :]             # (Nθ, Nφ')
+    af = np.einsum("tw,tpw->tp", f, np.exp(1j * k * u[..., None] * model.positions))
+    return (np.sin(theta)[:, None] * af)[:, inverse.reshape(-1)]
+
+
+def _gain_db(model, currents, freq_hz, field, image):
+    # G = 4π U / P_in, U = η k² |E|² / (32π²), P_in = Re(I_besleme)/2 (1 V uyarım)
+    k = 2 * math.pi * freq_hz / C
+    p_in = 0.5 * np.asarray(currents)[model.feed_index()].real
+    u = ETA0 * k**2 / (32 * math.pi**2) * np.abs(field)**2
+    gain = 4 * math.pi * u / p_in * (2.0 if image else 1.0)
+    return np.maximum(10 * np.log10(np.maximum(gain, 1e-30)), FLOOR_DB)
+
+
+def _beamwidth(angles_deg, gain_db):
+    """
+    Dairesel bir kesitte ana hüzmenin -3 dB genişliği (derece). Kesit, açıları eşit
+    aralıklı ve 360°'yi kaplayan örneklerdir; kazanç hiç 3 dB düşmüyorsa None.
+    """
+    n = gain_db.size
+    step = 360.0 / n
+    peak = int(np.argmax(gain_db))
+    thr = gain_db[peak] - 3.0
+    width = 0.0
+    for direction in (1, -1):
+        prev = gain_db[peak]
+        for i in range(1, n):
+            cur = gain_db[(peak + direction * i) % n]
+            if cur < thr:
+                width += (i - 1 + (prev - thr) / (prev - cur)) * step
+                break
+            prev = cur
+        else:
+            return None
+    return float(width)
+
+
+def cuts(model, currents, freq_hz, step_deg=1.0, image=False):
+    """
+    E ve H düzlemi kesitleri: açılar +x'ten ölçülür ([-180, 180) derece).
+    E düzleminde pozitif açılar +z'ye, H düzleminde +y'ye doğrudur.
+    """
+    alpha = np.arange(-180.0, 180.0, step_deg)
+    a = np.radians(alpha)
+    # E düzlemi: yön (cos α, 0, sin α) → θ = arccos(sin α), φ = 0 veya π
+    theta_e = np.arccos(np.clip(np.sin(a), -1.0, 1.0))
+    phi_e = np.where(np.cos(a) >= 0, 0.0, math.pi)
+    e = _gain_db(model, currents, freq_hz, far_field_points(model, currents, freq_hz, theta_e, phi_e), image)
+    h = _gain_db(model, currents, freq_hz,
+                 far_field_points(model, currents, freq_hz, np.full_like(a, math.pi / 2), a), image)
+    if image:
+        e[np.sin(a) < 0] = FLOOR_DB  # zemin altı
+    return alpha, e, h
+
+
+def design_pattern(sonuclar, step_deg=1.0, segments=21, freq_mhz=None, sphere=False):
+    """
+    Bir tasarım sözlüğünün (monopol/dipol/Yagi-Uda) ışıma deseni.
+    Akımlar sonuclar['mom']['currents'] içinde varsa yeniden kullanılır, yoksa MoM çözülür.
+    Dönüş: e_plane / h_plane (angle_deg, gain_dbi), peak_gain (dBi), peak_theta/peak_phi,
+    beamwidth_e / beamwidth_h (derece, None: -3 dB'ye düşmüyor), fb (ön/arka) ve
+    fr (ön / arka yarı uzaydaki en büyük lob) dB cinsinden. sphere=True ise tam küre
+    ızgarası da eklenir: theta_deg, phi_deg, gain_dbi (Nθ, Nφ).
+    """
+    model, image = model_from_design(sonuclar, segments=segments)
+    freq_hz = (freq_mhz if freq_mhz is not None else sonuclar["frekans"]) * 1e6
+    mom = sonuclar.get("mom")
+    currents = mom.get("currents") if mom and freq_mhz is None else None
+    if currents is None or np.size(currents) != model.size:
+        currents = model.solve(freq_hz)[:, 0]
+
+    theta_deg = np.arange(0.0, (90.0 if image else 180.0) + step_deg / 2, step_deg)
+    phi_deg = np.arange(0.0, 360.0, step_deg)
+    grid = _gain_db(model, currents, freq_hz, far_field_grid(model, currents, freq_hz, theta_deg, phi_deg), image)
+
+    alpha, e, h = cuts(model, currents, freq_hz, step_deg, image)
+    front = _gain_db(model, currents, freq_hz,
+                     far_field_points(model, currents, freq_hz, np.array([math.pi / 2] * 2),
+                                      np.array([0.0, math.pi])), image)
+    # Arka yarı uzay: x < 0 (90° < φ < 270°)
+    rear = np.cos(np.radians(phi_deg)) < -1e-12
+    t, p = np.unravel_index(int(np.argmax(grid)), grid.shape)
+    res = {
+        "e_plane": {"angle_deg": alpha, "gain_dbi": e},
+        "h_plane": {"angle_deg": alpha, "gain_dbi": h},
+        "peak_gain": float(grid[t, p]),
+        "peak_theta": float(theta_deg[t]),
+        "peak_phi": float(phi_deg[p]),
+        "beamwidth_e": _beamwidth(alpha, e),
+        "beamwidth_h": _beamwidth(alpha, h),
+        "fb": float(front[0] - front[1]),
+        "fr": float(front[0] - grid[:, rear].max()) if rear.any() else None,
+    }
+    if sphere:
+        res.update(theta_deg=theta_deg, phi_deg=phi_deg, gain_dbi=grid)
+    return res
+
+
+if __name__ == "__main__":
+    import time
+    from anten_cekirdek import dipol_hesapla, monopol_hesapla, yagi_uda_hesapla
+
+    # Doğrulama: ayrışık ızgara, doğrudan toplamla (WireModel.far_field) aynı olmalı
+    yagi = yagi_uda_hesapla(145.0, 8)
+    model, _ = model_from_design(yagi)
+    f = 145e6
+    currents = model.solve(f)[:, 0]
+    th = np.arange(0.0, 181.0, 7.0)
+    ph = np.arange(0.0, 360.0, 11.0)
+    grid = far_field_grid(model, currents, f, th, ph)
+    tt, pp = np.meshgrid(np.radians(th), np.radians(ph), indexing="ij")
+    direct = model.far_field(currents, f, tt, pp)
+    assert np.allclose(grid, direct, rtol=1e-10, atol=1e-12 * np.abs(direct).max())
+
+    # Kazanç ve F/B, MoM analiziyle tutarlı olmalı
+    for tasarim in (dipol_hesapla(145.0, 0.004), monopol_hesapla(145.0, 0.004), yagi):
+        tasarim["mom"] = solve_design(tasarim)
+        d = design_pattern(tasarim)
+        h0 = d["h_plane"]["gain_dbi"][d["h_plane"]["angle_deg"] == 0.0][0]
+        assert abs(h0 - tasarim["mom"]["gain"]) < 1e-9
+        if tasarim["tip"] != "Monopol":
+            assert abs(d["fb"] - tasarim["mom"]["fb"]) < 1e-9
+        bw = lambda v: "-" if v is None else f"{v:.1f}°"
+        print(f"{tasarim['tip']}: tepe {d['peak_gain']:.2f} dBi, E-BW {bw(d['beamwidth_e'])}, "
+              f"H-BW {bw(d['beamwidth_h'])}, F/B {d['fb']:.1f} dB, "
+              f"F/R {d['fr']:.1f} dB")
+
+    # 1°×1° tam küre süresi (akımlar hazır)
+    th = np.arange(0.0, 181.0, 1.0)
+    ph = np.arange(0.0, 360.0, 1.0)
+    far_field_grid(model, currents, f, th, ph)
+    t0 = time.perf_counter()
+    for _ in range(20):
+        far_field_grid(model, currents, f, th, ph)
+    dt = (time.perf_counter() - t0) / 20
+    t0 = time.perf_counter()
+    model.far_field(currents, f, *np.meshgrid(np.radians(th), np.radians(ph), indexing="ij"))
+    dt_direct = time.perf_counter() - t0
+    print(f"1°×1° küre ({th.size}×{ph.size}, {model.lengths.size} tel): {dt*1000:.1f} ms "
+          f"(doğrudan toplam {dt_direct*1000:.0f} ms)")
@@ -0,0 +1,309 @@
+# istif_dizisi.py
+"""
+İstiflenmiş (Stacked) Yagi Dizileri
+Aynı Yagi'nin satır × sütun düzeninde istiflenmesiyle oluşan dizinin deseni, kazancı
+ve en iyi istif aralığı. Desen çarpımı kullanılır: dizi alanı = tek anten alanı × dizi
+çarpanı (AF); antenler arası karşılıklı kuplaj ihmal edilir.
+
+Eksenler yatay polarizasyonlu montaja göredir (elemanlar yatay):
+    vertical   : dikey istif, hem boom'a hem elemanlara dik (modelde y, H düzlemi)
+    horizontal : yan yana istif, elemanlar doğrultusunda (modelde z, E düzlemi)
+
+Kazanç, giriş gücünün antenler arasında eşit bölündüğü kabulüyle toplam ışıyan güce
+göre bulunur: G_dizi(û) = G_tek(û) · |AF(û)|² · P_1 / P_N, P_N = ∫|E|²|AF|² dΩ.
+|AF|² gecikme (lag) terimlerine ayrıldığından P_N, tek antenin
+R(x) = ∫|E|² e^{jk x u} dΩ fonksiyonunun birkaç değerinin ağırlıklı toplamıdır. R,
+istif ekseni kutup ekseni olan bir küre ızgarasında (cosθ için Gauss-Legendre, φ için
+eşit aralık) hesaplanır ve x boyunca tek boyutlu bir toplama iner. Böylece sayıların ×
+aralıkların tamamı tek bir broadcast işlemiyle taranır.
+"""
+import math
+import numpy as np
+
+from isima_deseni import FLOOR_DB, _beamwidth, _gain_db, cuts, far_field_points
+from mom_cozucu import C, model_from_design
+
+# İstif ekseni -> (eksen, küre ızgarasının iki dik ekseni); model koordinatları (x boom, z eleman)
+STACK_AXES = {
+    "vertical": ((0.0, 1.0, 0.0), (1.0, 0.0, 0.0), (0.0, 0.0, 1.0)),
+    "horizontal": ((0.0, 0.0, 1.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)),
+}
+# İstif ekseninin yer aldığı desen kesiti (isima_deseni.cuts)
+_CUT_PLANE = {"vertical": "h_plane", "horizontal": "e_plane"}
+
+
+def _lag_coefficients(counts, max_lag):
+    # |AF_N|² = Σ_p c_p e^{jpψ}: c_0 = N, c_±p = N - p; (C, max_lag) p = 1..max_lag
+    p = np.arange(1, max_lag + 1)
+    return np.maximum(np.asarray(counts)[:, None] - p[None, :], 0).astype(float)
+
+
+def _af_power(counts, cos_psi):
+    # |AF_N|² = N + 2 Σ_p (N-p) cos(pψ), (C,) + cos_psi.shape; cos(pψ) Chebyshev yinelemesiyle
+    max_lag = int(counts.max()) - 1
+    coef = _lag_coefficients(counts, max_lag)
+    shape = (counts.size,) + (1,) * cos_psi.ndim
+    af = np.broadcast_to(counts.reshape(shape).astype(float), (counts.size,) + cos_psi.shape).copy()
+    prev, cur = np.ones_like(cos_psi), cos_psi
+    for p in range(max_lag):
+        af += 2 * coef[:, p].reshape(shape) * cur
+        prev, cur = cur, 2 * cos_psi * cur - prev
+    return af
+
+
+class StackedArray:
+    """
+    Bir tasarım sözlüğünün (dipol veya Yagi-Uda) istiflenmiş dizisi. Tek antenin MoM
+    akımları bir kez çözülür; küre ızgaraları ve kesitler ilk kullanımda hesaplanıp
+    saklanır, sonraki sweep/pattern çağrıları yalnızca dizi çarpanı işlemidir.
+    """
+
+    def __init__(self, sonuclar, segments=21, freq_mhz=None):
+        model, image = model_from_design(sonuclar, segments=segments)
+        if image:
+            raise ValueError("Monopol tasarımları istiflenemez (zemin düzlemi modeli).")
+        self.model = model
+        self.freq_hz = (freq_mhz if freq_mhz is not None else sonuclar["frekans"]) * 1e6
+        self.wavelength = C / self.freq_hz
+        self.k = 2 * math.pi / self.wavelength
+        mom = sonuclar.get("mom")
+        currents = mom.get("currents") if mom and freq_mhz is None else None
+        if currents is None or np.size(currents) != model.size:
+            currents = model.solve(self.freq_hz)[:, 0]
+        self.currents = np.asarray(currents)
+        # Tek antenin açıklığı (küre ızgarası bant genişliği için)
+        self.aperture = float(np.ptp(model.positions) + model.lengths.max())
+        self._spheres = {}
+        self._cuts = {}
+
+    # --- tek anten ---
+    def _nodes(self, extent):
+        # e^{jk x u} (x ≤ extent) × tek anten deseni için yeterli düğüm sayısı (16'nın katı)
+        return 16 * math.ceil((self.k * (extent + self.aperture) + 24) / 16)
+
+    def _sphere(self, axis, extent, phi_extent=0.0):
+        """
+        Kutup ekseni istif ekseni olan küre ızgarası: u = cosθ' düğümleri (T,),
+        sinθ' (T,), φ' (F,) ve A = ağırlık × |E|² (T, F). θ' düğümleri e^{jk x u}
+        terimini (x ≤ extent), φ' düğümleri kutup eksenine dik gecikmeleri (≤ phi_extent)
+        ve tek antenin desenini tam integre edecek kadardır.
+        """
+        n, m = self._nodes(extent), 2 * self._nodes(phi_extent)
+        key = (axis, n, m)
+        if key not in self._spheres:
+            a, e1, e2 = (np.array(v) for v in STACK_AXES[axis])
+            u, w = np.polynomial.legendre.leggauss(n)
+            phi = np.arange(m) * (2 * math.pi / m)
+            s = np.sqrt(1.0 - u**2)
+            d = (u[:, None, None] * a + s[:, None, None] * (np.cos(phi)[None, :, None] * e1
+                                                            + np.sin(phi)[None, :, None] * e2))
+            theta = np.arccos(np.clip(d[..., 2], -1.0, 1.0))
+            phi_m = np.arctan2(d[..., 1], d[..., 0])
+            field = far_field_points(self.model, self.currents, self.freq_hz, theta, phi_m)
+            weights = w[:, None] * (2 * math.pi / m)
+            self._spheres[key] = (u, s, phi, weights * np.abs(field)**2)
+        return self._spheres[key]
+
+    def lag_power(self, axis, x):
+        """R(x) = ∫|E|² e^{jk x u} dΩ (u: istif ekseni doğrultusundaki yön kosinüsü), x metre."""
+        x = np.asarray(x, dtype=float)
+        u, _, _, power = self._sphere(axis, float(np.max(np.abs(x), initial=0.0)))
+        return np.exp(1j * self.k * x[..., None] * u) @ power.sum(axis=1)
+
+    def single_cuts(self, step_deg=0.25):
+        """Tek antenin E/H kesitleri (isima_deseni.cuts), dBi."""
+        if step_deg not in self._cuts:
+            self._cuts[step_deg] = cuts(self.model, self.currents, self.freq_hz, step_deg)
+        return self._cuts[step_deg]
+
+    # --- dizi ---
+    def _array_power(self, axis, counts, spacings_m, phase):
+        # P_N / P_1, (C, S): P_N = N R(0) + 2 Re Σ_p (N-p) e^{jpβ} R(p d)
+        counts = np.asarray(counts)
+        spacings_m = np.asarray(spacings_m, dtype=float)
+        max_lag = max(int(counts.max()) - 1, 1)
+        p = np.arange(1, max_lag + 1)
+        r = self.lag_power(axis, np.concatenate([[0.0], (p[:, None] * spacings_m[None, :]).ravel()]))
+        r0, r = r[0].real, r[1:].reshape(max_lag, spacings_m.size)
+        coef = _lag_coefficients(counts, max_lag) * np.exp(1j * p * phase)[None, :]
+        return (counts[:, None] * r0 + 2 * (coef @ r).real) / r0
+
+    def sweep(self, axis="vertical", counts=range(2, 9), spacings_m=None, phase_deg=0.0, step_deg=0.25):
+        """
+        Tek eksenli istif taraması: counts (anten sayıları) × spacings_m (aralıklar) için
+        istif ekseni kesitindeki tepe kazancı (dBi) ve istif kazancı (dB, tek antene göre).
+        phase_deg: komşu antenler arası ilerleyen faz (hüzme eğme). spacings_m verilmezse
+        0.3λ-3λ, 0.01λ adım. Dönüş: counts, spacings_m, spacings_wl, gain, stack_gain (C, S),
+        peak_angle_deg (C, S), single_gain ve her sayı için en iyi aralık (optimum).
+        """
+        if axis not in STACK_AXES:
+            raise ValueError(f"Bilinmeyen istif ekseni: {axis}")
+        counts = np.atleast_1d(np.asarray(counts, dtype=int))
+        if counts.min() < 1:
+            raise ValueError("Anten sayısı en az 1 olmalı.")
+        if spacings_m is None:
+            spacings_m = np.arange(0.3, 3.0 + 1e-9, 0.01) * self.wavelength
+        spacings_m = np.atleast_1d(np.asarray(spacings_m, dtype=float))
+        phase = math.radians(phase_deg)
+
+        alpha, e, h = self.single_cuts(step_deg)
+        single = e if _CUT_PLANE[axis] == "e_plane" else h
+        u = np.sin(np.radians(alpha))                     # kesitte istif eksenine izdüşüm
+        single_lin = 10 ** (single / 10)
+        # Sınır: |AF|² ≤ N². Tek antenin tepe yönündeki dizi değerini hiçbir (N, d) için
+        # geçemeyecek açılar (single · N_max² < en küçük tepe değeri) hiç hesaplanmaz
+        top = int(np.argmax(single_lin))
+        at_top = _af_power(counts, np.cos(self.k * spacings_m * u[top] + phase)) * single_lin[top]
+        keep = np.flatnonzero(single_lin * float(counts.max())**2 >= at_top.min())
+        cos_psi = np.cos(self.k * spacings_m[:, None] * u[None, keep] + phase)    # (S, A')
+        # Tepe doğrusal ölçekte aranır; logaritma yalnızca tepe değerlerine uygulanır
+        lin = np.maximum(_af_power(counts, cos_psi), 0.0) * single_lin[None, None, keep]
+        peak = np.argmax(lin, axis=-1)
+        ratio = np.take_along_axis(lin, peak[..., None], axis=-1)[..., 0]
+        peak = keep[peak]
+        gain = 10 * np.log10(np.maximum(ratio / self._array_power(axis, counts, spacings_m, phase), 1e-30))
+        single_gain = float(single.max())
+        best = np.argmax(gain, axis=1)
+        return {
+            "axis": axis,
+            "counts": counts,
+            "spacings_m": spacings_m,
+            "spacings_wl": spacings_m / self.wavelength,
+            "gain": gain,
+            "stack_gain": gain - single_gain,
+            "peak_angle_deg": alpha[peak],
+            "single_gain": single_gain,
+            "optimum": [{"count": int(n), "spacing_m": float(spacings_m[i]),
+                         "spacing_wl": float(spacings_m[i] / self.wavelength),
+                         "gain": float(gain[c, i]), "stack_gain": float(gain[c, i] - single_gain)}
+                        for c, (n, i) in enumerate(zip(counts, best))],
+        }
+
+    def pattern(self, rows=1, cols=1, v_spacing_m=0.0, h_spacing_m=0.0, v_phase_deg=0.0, h_phase_deg=0.0,
+                step_deg=0.25):
+        """
+        rows (dikey) × cols (yatay) dizinin E/H kesitleri ve özetleri; design_pattern ile
+        aynı anahtarlar (e_plane, h_plane, peak_gain, beamwidth_e/h, fb) + single_gain,
+        stack_gain. P_N iki boyutlu gecikmelerle (satır × sütun) hesaplanır.
+        """
+        rows, cols = int(rows), int(cols)
+        if rows < 1 or cols < 1:
+            raise ValueError("Satır ve sütun sayısı en az 1 olmalı.")
+        bv, bh = math.radians(v_phase_deg), math.radians(h_phase_deg)
+        k = self.k
+
+        # P_N/P_1: yatay eksen kutuplu ızgarada R(p dv ŷ + q dh ẑ), p, q = -(N-1)..N-1
+        u, s, phi, power = self._sphere("horizontal", (cols - 1) * h_spacing_m, (rows - 1) * v_spacing_m)
+        pv = np.arange(-(rows - 1), rows)
+        qh = np.arange(-(cols - 1), cols)
+        uy = s[:, None] * np.sin(phi)[None, :]                             # (T, F)
+        inner = np.einsum("tf,ptf->pt", power, np.exp(1j * k * v_spacing_m * pv[:, None, None] * uy[None]))
+        r = inner @ np.exp(1j * k * h_spacing_m * qh[None, :] * u[:, None])  # (2R-1, 2C-1)
+        cv = (rows - np.abs(pv)) * np.exp(1j * pv * bv)
+        ch = (cols - np.abs(qh)) * np.exp(1j * qh * bh)
+        ratio_p = (cv @ r @ ch).real / power.sum()
+
+        def af2(n, d, beta, proj):
+            lag = np.arange(1, n)
+            return n + 2 * np.sum((n - lag)[:, None] * np.cos(lag[:, None] * (k * d * proj + beta)), axis=0)
+
+        alpha, e, h = self.single_cuts(step_deg)
+        a = np.radians(alpha)
+        # E düzlemi: (cos α, 0, sin α) -> u_y = 0, u_z = sin α; H düzlemi: u_y = sin α, u_z = 0
+        af_e = af2(rows, v_spacing_m, bv, np.zeros_like(a)) * af2(cols, h_spacing_m, bh, np.sin(a))
+        af_h = af2(rows, v_spacing_m, bv, np.sin(a)) * af2(cols, h_spacing_m, bh, np.zeros_like(a))
+        ge = np.maximum(e + 10 * np.log10(np.maximum(af_e, 1e-30) / ratio_p), FLOOR_DB)
+        gh = np.maximum(h + 10 * np.log10(np.maximum(af_h, 1e-30) / ratio_p), FLOOR_DB)
+        peak = float(max(ge.max(), gh.max()))
+        single_gain = float(max(e.max(), h.max()))
+        front, back = gh[alpha == 0.0], gh[alpha == -180.0]
+        return {
+            "rows": rows, "cols": cols, "v_spacing_m": v_spacing_m, "h_spacing_m": h_spacing_m,
+            "e_plane": {"angle_deg": alpha, "gain_dbi": ge},
+            "h_plane": {"angle_deg": alpha, "gain_dbi": gh},
+            "peak_gain": peak,
+            "single_gain": single_gain,
+            "stack_gain": peak - single_gain,
+            "beamwidth_e": _beamwidth(alpha, ge),
+            "beamwidth_h": _beamwidth(alpha, gh),
+            "fb": float(front[0] - back[0]) if front.size and back.size else None,
+        }
+
+
+def stacking_sweep(sonuclar, axis="vertical", counts=range(2, 9), spacings_wl=None, phase_deg=0.0):
+    """StackedArray(sonuclar).sweep kısayolu; aralıklar dalga boyu cinsinden."""
+    arr = StackedArray(sonuclar)
+    spacings_m = None if spacings_wl is None else np.asarray(spacings_wl, dtype=float) * arr.wavelength
+    return arr.sweep(axis, counts, spacings_m, phase_deg)
+
+
+def stack_pattern(sonuclar, rows=1, cols=1, v_spacing_wl=0.0, h_spacing_wl=0.0, v_phase_deg=0.0, h_phase_deg=0.0):
+    """StackedArray(sonuclar).pattern kısayolu; aralıklar dalga boyu cinsinden."""
+    arr = StackedArray(sonuclar)
+    return arr.pattern(rows, cols, v_spacing_wl * arr.wavelength, h_spacing_wl * arr.wavelength,
+                       v_phase_deg, h_phase_deg)
+
+
+if __name__ == "__main__":
+    import time
+    from anten_cekirdek import dipol_hesapla, yagi_uda_hesapla
+    from isima_deseni import far_field_grid
+    from mom_cozucu import solve_design
+
+    yagi = yagi_uda_hesapla(145.0, 8)
+    # Etkileşimli gecikme: MoM + ilk tarama (doğrulama integralleri süreye dahil değil)
+    t0 = time.perf_counter()
+    arr = StackedArray(yagi)
+    sw = arr.sweep("vertical")
+    dt = time.perf_counter() - t0
+    lam = arr.wavelength
+
+    # Küre integrali: ileri yön yönlülüğü MoM kazancıyla (kayıpsız model) aynı olmalı
+    u, s, phi, power = arr._sphere("vertical", 0.0)
+    e_fwd = far_field_points(arr.model, arr.currents, arr.freq_hz, np.array([math.pi / 2]), np.array([0.0]))
+    d_fwd = 10 * np.log10(4 * math.pi * np.abs(e_fwd[0])**2 / power.sum())
+    g_fwd = _gain_db(arr.model, arr.currents, arr.freq_hz, e_fwd, False)[0]
+    assert abs(d_fwd - solve_design(yagi)["gain"]) < 0.05 and abs(g_fwd - solve_design(yagi)["gain"]) < 1e-9
+    print(f"yönlülük (küre integrali) {d_fwd:.3f} dBi, MoM kazancı {g_fwd:.3f} dBi")
+
+    # Gauss-Legendre integrali, sık eşit aralıklı θ/φ ızgarasındaki doğrudan toplamla aynı olmalı
+    th = np.arange(0.05, 180.0, 0.1)
+    ph = np.arange(0.0, 360.0, 0.1)
+    tt, pp = np.meshgrid(np.radians(th), np.radians(ph), indexing="ij")
+    e2 = np.abs(far_field_grid(arr.model, arr.currents, arr.freq_hz, th, ph))**2 * np.sin(tt)
+    uy = np.sin(tt) * np.sin(pp)
+    for n, d in ((2, 1.2), (4, 2.0)):
+        af2 = np.abs(sum(np.exp(1j * arr.k * i * d * lam * uy) for i in range(n)))**2
+        brute = (e2 * af2).sum() / e2.sum()
+        quad = arr._array_power("vertical", [n], [d * lam], 0.0)[0, 0]
+        assert abs(quad / brute - 1) < 1e-4, (n, d, quad, brute)
+
+    # Çok büyük aralıkta kazanç artışı 10 log N'ye yaklaşır; 1 anten = tek anten
+    far = arr.sweep("vertical", [1, 2, 4], [12 * lam])
+    assert abs(far["stack_gain"][0, 0]) < 1e-9
+    assert np.allclose(far["stack_gain"][1:, 0], 10 * np.log10([2, 4]), atol=0.15), far["stack_gain"]
+    # 2-B desen, tek eksenli taramayla aynı kazancı vermeli
+    opt = sw["optimum"][2]
+    pat = arr.pattern(rows=opt["count"], v_spacing_m=opt["spacing_m"])
+    assert abs(pat["peak_gain"] - opt["gain"]) < 1e-6, (pat["peak_gain"], opt)
+    hor = arr.sweep("horizontal", [2], [1.5 * lam])
+    pat = arr.pattern(cols=2, h_spacing_m=1.5 * lam)
+    assert abs(pat["peak_gain"] - hor["gain"][0, 0]) < 1e-6
+
+    for o in sw["optimum"]:
+        print(f"{o['count']} anten dikey: en iyi {o['spacing_wl']:.2f}λ ({o['spacing_m']:.2f} m), "
+              f"{o['gain']:.2f} dBi (+{o['stack_gain']:.2f} dB)")
+    t1 = time.perf_counter()
+    arr.sweep("vertical")
+    box = arr.pattern(rows=2, cols=2, v_spacing_m=sw["optimum"][0]["spacing_m"], h_spacing_m=1.5 * lam)
+    dt_again = time.perf_counter() - t1
+    print(f"2×2: {box['peak_gain']:.2f} dBi, E-BW {box['beamwidth_e']:.1f}°, H-BW {box['beamwidth_h']:.1f}°, "
+          f"F/B {box['fb']:.1f} dB")
+    print(f"tarama {sw['counts'].size}×{sw['spacings_m'].size}: ilk {dt*1000:.0f} ms (MoM + ızgara dahil, doğrulama hariç), "
+          f"tekrar + 2×2 desen {dt_again*1000:.1f} ms")
+
+    try:
+        StackedArray(dipol_hesapla(145.0, 0.004)).sweep("diagonal")
+        raise AssertionError("geçersiz eksen kabul edildi")
+    except ValueError as e:
+        print("beklenen hata:", e)
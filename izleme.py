@@ -0,0 +1,324 @@
+# izleme.py
+"""
+Optimizasyon İzleme (Enstrümantasyon)
+İsteğe bağlı sayaçlar (değerlendirilen nokta, iyileşme, budanan nokta...), aşama
+süreölçerleri ve isteğe bağlı profil kancası (cProfile veya örnekleyici) sağlar.
+Sonuç JSON'a çevrilebilen yapılandırılmış bir izdir; arayüz durum çubuğunda özetler,
+toplu çalıştırmalar aggregate() ile birleştirir.
+
+İzleme kapalıyken fonksiyonlar NULL izleyicisini kullanır: sayaç ve aşama çağrıları
+boş işlemdir. Vektörel yollarda ölçümler nokta başına değil parça (chunk) başına
+yapıldığından açıkken de ek yük ihmal edilebilir düzeydedir. Skaler optimize_yagi
+yolunda tahminciler (estimate_impedance, estimate_swr, estimate_gain) wrap ile çağrı
+başına ölçülür; bu ek yük yalnızca izleme açıkken vardır.
+
+Örnek:
+    tr = Tracer(profile="cprofile")
+    with tr:
+        optimize_yagi(145.0, 5, 0.001, 0.004, tracer=tr)
+    print(tr.to_json())
+"""
+import cProfile
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+PROFILERS = (None, "cprofile", "sample")
+
+
+class _Phase:
+    __slots__ = ("tracer", "name", "t0")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.add_time(self.name, time.perf_counter() - self.t0)
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _NullTracer:
+    """Kapalı izleyici: tüm çağrılar boş işlemdir."""
+    enabled = False
+
+    def __bool__(self):
+        return False
+
+    def count(self, name, n=1):
+        pass
+
+    def add_time(self, name, seconds, calls=1):
+        pass
+
+    def phase(self, name):
+        return _NULL_PHASE
+
+    def merge(self, trace):
+        pass
+
+    def wrap(self, fn, name=None):
+        return fn
+
+    def to_dict(self):
+        return None
+
+
+NULL = _NullTracer()
+
+
+class _Sampler(threading.Thread):
+    # Hedef iş parçacığının yığınını aralıklarla okur (istatistiksel profil)
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.own = Counter()
+        self.total = Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.own[_frame_name(frame)] += 1
+            seen = set()
+            while frame is not None:
+                name = _frame_name(frame)
+                if name not in seen:
+                    self.total[name] += 1
+                    seen.add(name)
+                frame = frame.f_back
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_firstlineno}({code.co_name})"
+
+
+class Tracer:
+    """
+    Açık izleyici.
+    profile: None, "cprofile" (deterministik) veya "sample" (sample_interval saniyede bir
+    yığın örneği); profil yalnızca `with tracer:` bloğu içinde ve bloğu açan iş
+    parçacığında çalışır. top: izde tutulacak en pahalı fonksiyon sayısı.
+    """
+    enabled = True
+
+    def __init__(self, profile=None, sample_interval=0.005, top=25):
+        if profile not in PROFILERS:
+            raise ValueError(f"Bilinmeyen profil türü: {profile}")
+        self.profile = profile
+        self.sample_interval = sample_interval
+        self.top = top
+        self.counters = {}
+        self.phases = {}  # ad -> [saniye, çağrı]
+        self.wall = 0.0
+        self._t0 = None
+        self._profiler = None
+        self._profile_rows = None
+
+    def __bool__(self):
+        return True
+
+    # --- ölçüm ---
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_time(self, name, seconds, calls=1):
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [seconds, calls]
+        else:
+            entry[0] += seconds
+            entry[1] += calls
+
+    def phase(self, name):
+        """Bir aşamanın süresini ölçen bağlam yöneticisi."""
+        return _Phase(self, name)
+
+    def wrap(self, fn, name=None):
+        """fn'in her çağrısını name aşaması olarak ölçen sarmalayıcı (ör. skaler tahminciler)."""
+        name = name or fn.__name__
+
+        def wrapped(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add_time(name, time.perf_counter() - t0)
+        wrapped.__wrapped__ = fn
+        return wrapped
+
+    def merge(self, trace):
+        """Başka bir izin (to_dict çıktısı, ör. süreç havuzu işçisinden) sayaç ve sürelerini ekler."""
+        if not trace:
+            return
+        for name, n in trace.get("counters", {}).items():
+            self.count(name, n)
+        for name, p in trace.get("phases", {}).items():
+            self.add_time(name, p["seconds"], p["calls"])
+
+    # --- profil ---
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        if self.profile == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.profile == "sample":
+            self._profiler = _Sampler(threading.get_ident(), self.sample_interval)
+            self._profiler.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self.profile == "cprofile" and self._profiler is not None:
+            self._profiler.disable()
+            stats = pstats.Stats(self._profiler).stats
+            rows = sorted(stats.items(), key=lambda kv: -kv[1][3])[:self.top]
+            self._profile_rows = [{"function": f"{fn.rsplit('/', 1)[-1]}:{line}({name})",
+                                   "calls": nc, "tottime": tt, "cumtime": ct}
+                                  for (fn, line, name), (cc, nc, tt, ct, _) in rows]
+        elif self.profile == "sample" and self._profiler is not None:
+            s = self._profiler
+            s.stop()
+            # Fonksiyonun kendi örneklerine göre sıralı (toplam: yığında bulunduğu örnekler)
+            self._profile_rows = [{"function": name, "own_samples": n, "samples": s.total[name],
+                                   "fraction": n / s.samples}
+                                  for name, n in s.own.most_common(self.top)]
+        self._profiler = None
+        self.wall += time.perf_counter() - self._t0
+        self._t0 = None
+        return False
+
+    # --- çıktı ---
+    def to_dict(self):
+        wall = self.wall + (time.perf_counter() - self._t0 if self._t0 is not None else 0.0)
+        trace = {
+            "wall": wall,
+            "counters": dict(self.counters),
+            "phases": {name: {"seconds": s, "calls": c} for name, (s, c) in self.phases.items()},
+        }
+        points = self.counters.get("points")
+        if points and wall > 0:
+            trace["points_per_sec"] = points / wall
+        if self._profile_rows is not None:
+            trace["profile"] = {"kind": self.profile, "top": self._profile_rows}
+        return trace
+
+    def to_json(self, path=None, indent=2):
+        text = json.dumps(self.to_dict(), indent=indent)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def summary(self, phases=3):
+        """Durum çubuğu için tek satırlık özet."""
+        return summarize(self.to_dict(), phases)
+
+
+def summarize(trace, phases=3):
+    """Bir iz sözlüğünün kısa özeti: nokta sayısı, hız ve en pahalı aşamalar."""
+    parts = []
+    points = trace["counters"].get("points")
+    if points:
+        parts.append(f"{points:,} nokta")
+    if trace.get("points_per_sec"):
+        parts.append(f"{trace['points_per_sec']:,.0f} nokta/s")
+    total = trace["wall"] or sum(p["seconds"] for p in trace["phases"].values())
+    if total > 0:
+        top = sorted(trace["phases"].items(), key=lambda kv: -kv[1]["seconds"])[:phases]
+        parts.append(", ".join(f"{name} %{100 * p['seconds'] / total:.0f}" for name, p in top))
+    return "; ".join(parts)
+
+
+def aggregate(traces):
+    """Birden fazla izi (dict) tek bir izde toplar; duvar süreleri de toplanır."""
+    tr = Tracer()
+    runs = 0
+    for trace in traces:
+        if not trace:
+            continue
+        tr.merge(trace)
+        tr.wall += trace.get("wall", 0.0)
+        runs += 1
+    out = tr.to_dict()
+    out["runs"] = runs
+    return out
+
+
+def _sure(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    # Kullanım: python izleme.py iz1.json iz2.json ...  -> birleşik iz (stdout)
+    if len(sys.argv) > 1:
+        loaded = []
+        for path in sys.argv[1:]:
+            with open(path, encoding="utf-8") as f:
+                loaded.append(json.load(f))
+        print(json.dumps(aggregate(loaded), indent=2))
+        sys.exit(0)
+
+    import yagi_optimizasyon_modulu as yom
+
+    # İzleme sonucu değiştirmemeli; açık izlemenin ek yükü küçük olmalı
+    args = (145.0, 8, 0.004)
+    ref = yom.optimize_yagi_adaptive(*args)
+    t_off = min(_sure(lambda: yom.optimize_yagi_adaptive(*args)) for _ in range(5))
+    t_on = min(_sure(lambda: yom.optimize_yagi_adaptive(*args, tracer=Tracer())) for _ in range(5))
+    tr = Tracer()
+    with tr:
+        assert yom.optimize_yagi_adaptive(*args, tracer=tr) == ref
+    print(f"kaba-ince: kapalı {t_off*1000:.1f} ms, açık {t_on*1000:.1f} ms; {tr.summary()}")
+
+    grid = (145.0, 5, 0.001, 0.004)
+    par = Tracer()
+    with par:
+        assert yom.optimize_yagi(*grid, workers=2, max_chunk_points=200, tracer=par) == yom.optimize_yagi(*grid)
+    print("paralel grid:", par.counters)
+
+    # Skaler yol: tahminciler çağrı başına ölçülür (her puanlanan noktada bir çağrı)
+    sca = Tracer()
+    assert yom.optimize_yagi(145.0, 6, 0.005, 0.004, vectorized=False, tracer=sca) == \
+        yom.optimize_yagi(145.0, 6, 0.005, 0.004, vectorized=False)
+    for name in ("estimate_impedance", "estimate_swr", "estimate_gain"):
+        assert sca.phases[name][1] == sca.counters["points"], (name, sca.phases)
+    print("skaler tahminciler:", {name: sca.phases[name][1] for name in ("estimate_impedance", "estimate_gain")})
+
+    for kind in ("cprofile", "sample"):
+        prof = Tracer(profile=kind, top=3)
+        with prof:
+            yom.optimize_yagi_de(145.0, 10, 0.004, tracer=prof)
+        top = prof.to_dict()["profile"]["top"]
+        print(f"DE {kind}: {prof.summary()}; en üst: {top[0]['function'] if top else '-'}")
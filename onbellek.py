@@ -0,0 +1,250 @@
+# onbellek.py
+"""
+Tasarım ve Çözücü Sonuçları için Kalıcı Önbellek
+İki katmanlıdır: bellekte LRU (en son kullanılan) katmanı ve diskte boyut sınırlı
+bir katman. Anahtarlar normalize edilmiş girdilerden (anten tipi, frekans, çap,
+eleman sayısı, optimizasyon ayarları) ve bir model sürümünden üretilir. Model sürümü
+tahminci modüllerinin kaynak kodunun özetidir; bir tahminci değiştiğinde eski
+kayıtlar kendiliğinden geçersiz olur. İsabet/ıska sayaçları stats() ile okunur.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+# Önbellek biçim sürümü (kayıt yapısı değişirse artırılır)
+CACHE_FORMAT = 1
+
+
+def default_directory():
+    # XDG_CACHE_HOME/anten_tasarim veya ~/.cache/anten_tasarim
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "anten_tasarim")
+
+
+def source_version(*modules):
+    """
+    Verilen modüllerin kaynak dosyalarının özetinden kısa bir sürüm dizgesi.
+    Modül nesnesi ya da modül adı verilebilir; ad verilirse modül içe aktarılmaz.
+    """
+    h = hashlib.sha256(str(CACHE_FORMAT).encode())
+    for mod in modules:
+        if isinstance(mod, str):
+            spec = importlib.util.find_spec(mod)
+            path = spec.origin if spec else None
+        else:
+            path = getattr(mod, "__file__", None)
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                h.update(f.read())
+        else:
+            h.update(repr(mod).encode())
+    return h.hexdigest()[:16]
+
+
+def _normalize(value):
+    # Kayan noktalı sayılar 12 anlamlı basamağa yuvarlanır (145.0 ile 145.00000000001 aynı anahtar)
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return float(f"{value:.12g}")
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if hasattr(value, "item"):  # numpy skalerleri
+        return _normalize(value.item())
+    return repr(value)
+
+
+def make_key(namespace, params, version=""):
+    """Ad alanı, parametreler ve sürümden kararlı bir SHA-256 anahtarı."""
+    payload = json.dumps([namespace, version, _normalize(params)], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    İki katmanlı sonuç önbelleği.
+    memory_items: bellekteki en fazla kayıt sayısı (LRU),
+    directory: disk katmanı dizini (None ise yalnızca bellek),
+    disk_bytes: disk katmanının bayt sınırı (en eski kullanılanlar silinir),
+    version: anahtarlara katılan model sürümü (bkz. source_version).
+    Değerler pickle olarak saklanır; get her çağrıda bağımsız bir kopya döndürür.
+    """
+
+    def __init__(self, directory=None, memory_items=256, disk_bytes=64 * 1024 * 1024, version=""):
+        self.directory = directory
+        self.memory_items = int(memory_items)
+        self.disk_bytes = int(disk_bytes)
+        self.version = version
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0,
+                          "puts": 0, "memory_evictions": 0, "disk_evictions": 0}
+        self._disk_size = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_size = sum(size for _, size, _ in self._disk_entries())
+
+    def key(self, namespace, params):
+        return make_key(namespace, params, self.version)
+
+    # --- disk katmanı ---
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def _disk_entries(self):
+        # (yol, boyut, son kullanım zamanı)
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pkl"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_size, st.st_mtime))
+        return entries
+
+    def _disk_get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+            os.utime(path, None)  # son kullanım zamanını güncelle
+            return blob
+        except OSError:
+            return None
+
+    def _disk_put(self, key, blob):
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            old = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(tmp, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self._disk_size += len(blob) - old
+        if self._disk_size > self.disk_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        # En eski kullanılanları sınırın altına inene dek sil (%90 hedef, sık taramayı önler)
+        entries = sorted(self._disk_entries(), key=lambda e: e[2])
+        size = sum(e[1] for e in entries)
+        target = int(self.disk_bytes * 0.9)
+        for path, nbytes, _ in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= nbytes
+            self._counters["disk_evictions"] += 1
+        self._disk_size = size
+
+    # --- genel arayüz ---
+    def get(self, key, default=None):
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return pickle.loads(blob)
+            if self.directory:
+                blob = self._disk_get(key)
+                if blob is not None:
+                    self._counters["disk_hits"] += 1
+                    self._memory_put(key, blob)
+                    return pickle.loads(blob)
+            self._counters["misses"] += 1
+            return default
+
+    def _memory_put(self, key, blob):
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+            self._counters["memory_evictions"] += 1
+
+    def put(self, key, value):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._counters["puts"] += 1
+            self._memory_put(key, blob)
+            if self.directory:
+                self._disk_put(key, blob)
+
+    def get_or_compute(self, namespace, params, compute):
+        """Önbellekte varsa döndürür, yoksa compute() ile hesaplayıp saklar."""
+        key = self.key(namespace, params)
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self.directory:
+                for path, _, _ in self._disk_entries():
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                self._disk_size = 0
+
+    def stats(self):
+        with self._lock:
+            s = dict(self._counters)
+            s["memory_items"] = len(self._memory)
+            s["disk_bytes"] = self._disk_size
+            lookups = s["memory_hits"] + s["disk_hits"] + s["misses"]
+            s["hit_rate"] = (s["memory_hits"] + s["disk_hits"]) / lookups if lookups else 0.0
+            return s
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+    import yagi_optimizasyon_modulu as yom
+
+    with tempfile.TemporaryDirectory() as d:
+        version = source_version(yom)
+        cache = ResultCache(d, memory_items=4, disk_bytes=4096, version=version)
+        params = {"freq": 145.0, "elements": 8, "cap": 0.004, "final_step": 0.001}
+
+        t0 = time.perf_counter()
+        cache.get_or_compute("adaptive", params, lambda: yom.optimize_yagi_adaptive(145.0, 8, 0.004))
+        t1 = time.perf_counter()
+        cache.get_or_compute("adaptive", params, lambda: yom.optimize_yagi_adaptive(145.0, 8, 0.004))
+        t2 = time.perf_counter()
+        print(f"ilk: {(t1-t0)*1000:.1f} ms, bellekten: {(t2-t1)*1000:.3f} ms")
+
+        # Yeni oturum: bellek boş, disk katmanından gelir
+        cache2 = ResultCache(d, version=version)
+        assert cache2.get(cache2.key("adaptive", params)) is not None
+        # Farklı model sürümü eski kayıtları görmez
+        cache3 = ResultCache(d, version="baska-surum")
+        assert cache3.get(cache3.key("adaptive", params)) is None
+
+        # Boyut sınırı: çok sayıda kayıt sonrası disk sınırın altında kalmalı
+        for i in range(50):
+            cache.put(cache.key("dolgu", {"i": i}), b"x" * 500)
+        assert cache.stats()["disk_bytes"] <= 4096
+        print("önbellek:", cache.stats())
+        print("ikinci oturum:", cache2.stats())
@@ -0,0 +1,184 @@
+# sonuc_deposu.py
+"""
+Sınırlı En İyi-k Sonuç Deposu
+Optimizasyon adaylarını sözlükler yerine NumPy yapılı dizisinde (aday başına 72 bayt)
+saklar ve yalnızca en iyi k tanesini tutar: 10.000 aday ~0.7 MB'tır.
+
+Sıralama anahtarı skor (azalan), eşitlikte index (artan; döngü sırasında ilk bulunan
+önce gelir). Depo öbek (heap) anlamında çalışır: k dolduktan sonra threshold en kötü
+tutulan adayın skorudur ve altında kalan adaylar hiç eklenmez. Eklemeler parça parça
+(vektörel) yapılır; bekleyen adaylar k'yı aşınca tek bir lexsort ile sıkıştırılır.
+
+Örnek:
+    store = TopKStore(10_000)
+    optimize_yagi(145.0, 6, 0.005, 0.004, store=store)
+    iyi = store.filter(lambda r: r["swr"] < 1.3)
+    store.to_csv("adaylar.csv")
+"""
+import json
+
+import numpy as np
+
+# optimize_yagi sonuç sözlüğünün alanları (uzunluklar metre) + grid düz indeksi
+RECORD_DTYPE = np.dtype([
+    ("index", np.int64),
+    ("reflector", np.float64),
+    ("active", np.float64),
+    ("director", np.float64),
+    ("spacing", np.float64),
+    ("gain", np.float64),
+    ("impedance", np.float64),
+    ("swr", np.float64),
+    ("score", np.float64),
+])
+
+
+class TopKStore:
+    """
+    En iyi k kaydı tutan depo.
+    k: en fazla kayıt sayısı, dtype: "score" ve "index" alanlarını içeren yapılı dtype.
+    meta: kayıtlara ortak bilgiler (ör. wavelength); to_dicts ve save ile taşınır.
+    """
+
+    def __init__(self, k=10_000, dtype=RECORD_DTYPE):
+        if k < 1:
+            raise ValueError("k en az 1 olmalı.")
+        self.k = int(k)
+        self.dtype = np.dtype(dtype)
+        self.meta = {}
+        self._data = np.empty(0, dtype=self.dtype)  # her zaman sıralı
+        self._pending = []
+        self._pending_size = 0
+
+    # --- ekleme ---
+    @property
+    def threshold(self):
+        """Eklenecek bir adayın en az sahip olması gereken skor (depo dolmadıysa -inf)."""
+        if self._data.size < self.k:
+            return -np.inf
+        return float(self._data["score"][-1])
+
+    def push(self, **columns):
+        """Alan adı -> dizi (broadcast edilir) biçiminde bir aday grubu ekler."""
+        n = np.broadcast(*columns.values()).size if len(columns) > 1 else np.size(next(iter(columns.values())))
+        batch = np.empty(n, dtype=self.dtype)
+        for name in self.dtype.names:
+            batch[name] = columns[name]
+        self.push_array(batch)
+
+    def push_array(self, records):
+        """Aynı dtype'lı yapılı diziyi ekler (ör. başka bir süreçteki deponun array çıktısı)."""
+        records = np.asarray(records, dtype=self.dtype)
+        if self._data.size >= self.k:
+            records = records[records["score"] >= self.threshold]
+        if records.size == 0:
+            return
+        self._pending.append(records)
+        self._pending_size += records.size
+        if self._pending_size >= self.k:
+            self._compact()
+
+    def _compact(self):
+        if not self._pending:
+            return
+        data = np.concatenate([self._data] + self._pending)
+        self._pending = []
+        self._pending_size = 0
+        order = np.lexsort((data["index"], -data["score"]))[:self.k]
+        self._data = data[order]
+
+    # --- okuma ---
+    def __len__(self):
+        self._compact()
+        return self._data.size
+
+    @property
+    def array(self):
+        """Kayıtlar (skora göre azalan), salt okunur görünüm."""
+        self._compact()
+        view = self._data.view()
+        view.flags.writeable = False
+        return view
+
+    def best(self):
+        """En iyi kayıt sözlük olarak (depo boşsa None)."""
+        arr = self.array
+        return self.to_dicts(arr[:1])[0] if arr.size else None
+
+    def sorted(self, by="score", descending=True):
+        """by alanına göre sıralı kopya; eşitlikte index sırası korunur."""
+        arr = self.array
+        key = -arr[by] if descending else arr[by]
+        return arr[np.lexsort((arr["index"], key))]
+
+    def filter(self, where):
+        """where(dizi) -> bool maske (ya da hazır maske) ile süzülmüş kopya, skora göre sıralı."""
+        arr = self.array
+        mask = where(arr) if callable(where) else np.asarray(where, dtype=bool)
+        return arr[mask]
+
+    def to_dicts(self, records=None):
+        """Kayıtları optimize_yagi sonuç sözlüklerine çevirir (meta alanları eklenir)."""
+        records = self.array if records is None else records
+        names = [n for n in records.dtype.names if n != "index"]
+        return [dict({n: float(r[n]) for n in names}, **self.meta) for r in records]
+
+    # --- dışa aktarım ---
+    def to_csv(self, path, records=None):
+        records = self.array if records is None else records
+        fmt = ["%d" if records.dtype[n].kind in "iu" else "%.10g" for n in records.dtype.names]
+        np.savetxt(path, records, fmt=fmt, delimiter=",", header=",".join(records.dtype.names), comments="")
+
+    def save(self, path):
+        """Kayıtlar ve meta tek bir .npz dosyasına (load ile geri okunur)."""
+        np.savez(path, records=self.array, meta=np.array(json.dumps(self.meta)), k=self.k)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as f:
+            store = cls(int(f["k"]), dtype=f["records"].dtype)
+            store.meta = json.loads(str(f["meta"]))
+            store._data = f["records"].copy()
+        return store
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    import tracemalloc
+    import yagi_optimizasyon_modulu as yom
+
+    # En iyi kayıt, optimize_yagi sonucuyla birebir aynı olmalı (seri, parçalı, paralel)
+    ref = yom.optimize_yagi(145.0, 6, 0.005, 0.004)
+    for kwargs in ({}, {"max_chunk_points": 7}, {"workers": 2, "max_chunk_points": 7}, {"prune": False}):
+        store = TopKStore(50)
+        assert yom.optimize_yagi(145.0, 6, 0.005, 0.004, store=store, **kwargs) == ref
+        assert store.best() == ref, (kwargs, store.best(), ref)
+    # Kaba kuvvet: tüm grid sıralanınca ilk 50 ile aynı
+    full = TopKStore(10**6)
+    yom.optimize_yagi(145.0, 6, 0.005, 0.004, store=full, prune=False)
+    small = TopKStore(50)
+    yom.optimize_yagi(145.0, 6, 0.005, 0.004, store=small, prune=False, max_chunk_points=100)
+    assert np.array_equal(full.array[:50], small.array)
+
+    # Büyük arama: 1,2 milyar noktalık grid (dal-sınır + k=10.000), bellek sınırlı kalmalı
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    store = TopKStore(10_000)
+    yom.optimize_yagi(145.0, 8, 0.0005, 0.004, store=store, ranges=yom.DEFAULT_RANGES)
+    dt = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    iyi = store.filter(lambda r: r["swr"] < 1.05)
+    print(f"k=10.000: {len(store)} kayıt ({store.array.nbytes / 1024:.0f} KB), eşik {store.threshold:.4f}, "
+          f"SWR<1.05: {iyi.size}, {dt*1000:.0f} ms, tepe bellek {peak / 2**20:.1f} MB")
+
+    with tempfile.TemporaryDirectory() as d:
+        store.to_csv(os.path.join(d, "adaylar.csv"), iyi[:10])
+        store.save(os.path.join(d, "adaylar.npz"))
+        again = TopKStore.load(os.path.join(d, "adaylar.npz"))
+        assert np.array_equal(again.array, store.array) and again.meta == store.meta
+        with open(os.path.join(d, "adaylar.csv"), encoding="utf-8") as f:
+            print(f.readline().strip())
+            print(f.readline().strip())
@@ -0,0 +1,625 @@
+# tasarim_servisi.py
+"""
+Yerel Tasarım Servisi (HTTP/JSON, asyncio)
+Tk penceresi dışındaki araçların dipol, monopol, Yagi hesaplarını ve Yagi
+optimizasyonlarını çağırabilmesi için yalnızca yerel (127.0.0.1) HTTP servisi.
+Bağımlılığı yoktur (standart kütüphane asyncio + süreç havuzu).
+
+İki şerit vardır:
+    hızlı şerit : /design - boyut hesabı ve MoM analizi küçük bir iş parçacığı
+                  havuzunda çalışır (olay döngüsü bloklanmaz); optimizasyonları hiç beklemez.
+    ağır şerit  : /optimize - sınırlı bir süreç havuzunda (workers) çalışır. Havuz
+                  doluysa işler en fazla max_queue derinliğinde bekler; kuyruk da
+                  doluysa istek 503 (Retry-After) ile reddedilir (geri basınç).
+Aynı parametreli, hâlâ süren bir optimizasyon isteği yeni iş başlatmaz; mevcut işin
+sonucunu bekler (istek birleştirme). "stream": true ile yanıt NDJSON akışıdır:
+queued / progress / result (veya error) olayları; artımlı yöntemlerde (adaptive, de,
+pareto) ilerleme işçi süreçten bir kuyrukla aktarılır.
+
+Uç noktalar:
+    GET  /health     {"status": "ok"}
+    GET  /metrics    kuyruk derinliği, çalışan/bekleyen/birleştirilen/reddedilen işler, gecikmeler
+    POST /design     {"type": "dipol", "band": "2m" | "freq_mhz": 145.0, "diameter_mm": 4,
+                      "elements": 5, "mom": false}
+    POST /optimize   {"method": "grid" | "adaptive" | "de" | "pareto", "freq_mhz": 145.0,
+                      "elements": 6, "diameter_mm": 4, "stream": false, ...yönteme özel ayarlar}
+Frekans, çap, eleman sayısı ve ayarlar LIMITS sınırları içinde olmalı, grid/pareto tam gridi MAX_GRID_POINTS'i aşmamalı;
+aksi halde istek 400 ile reddedilir.
+
+Örnek:
+    python tasarim_servisi.py --port 8765 --workers 4
+    curl -s localhost:8765/optimize -d '{"method": "de", "freq_mhz": 145, "elements": 10, "stream": true}'
+    python tasarim_servisi.py --self-test
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import count
+
+from anten_cekirdek import bant_frekansi
+from onbellek import make_key
+from toplu_tasarim import ELEMENT_LIMITS, _jsonable, run_job
+
+MAX_BODY = 64 * 1024
+# İşçiden gelen ilerleme kayıtları arasındaki en kısa süre (s)
+PROGRESS_INTERVAL = 0.1
+# Akış başına bekletilen en fazla ilerleme olayı (yavaş istemcide eskiler düşer)
+STREAM_BUFFER = 32
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+# Yöntem -> (yagi_optimizasyon_modulu fonksiyonu, izin verilen ayarlar ve türleri)
+OPTIMIZERS = {
+    "grid": ("optimize_yagi", {"step": float, "prune": bool}),
+    "adaptive": ("optimize_yagi_adaptive_iter",
+                 {"final_step": float, "coarse_points": int, "top_k": int, "refine": int}),
+    "de": ("optimize_yagi_de_iter",
+           {"popsize": int, "generations": int, "mutation": float, "crossover": float, "seed": int,
+            "patience": int}),
+    "pareto": ("optimize_yagi_pareto_iter", {"step": float, "prune": bool}),
+}
+RANGE_NAMES = ("reflector", "active", "director", "spacing")
+# Tek bir isteğin işçiyi bellek/CPU olarak tüketmemesi için ayar sınırları (dahil)
+LIMITS = {
+    "freq_mhz": (0.1, 30000.0),
+    "diameter_mm": (0.1, 500.0),
+    "elements": ELEMENT_LIMITS,
+    "step": (0.001, 0.1),
+    "final_step": (0.001, 0.1),
+    "coarse_points": (2, 50),
+    "top_k": (1, 32),
+    "refine": (2, 10),
+    "popsize": (4, 200),
+    "generations": (0, 5000),
+    "patience": (1, 5000),
+    "mutation": (0.0, 2.0),
+    "crossover": (0.0, 1.0),
+}
+# Aralık uçları (dalga boyu çarpanı) ve grid/pareto tam gridinin en fazla nokta sayısı
+RANGE_BOUNDS = (0.01, 1.5)
+MAX_GRID_POINTS = 100_000_000
+# yagi_optimizasyon_modulu.DEFAULT_RANGES ile aynı (numpy ana süreçte yüklenmesin diye kopya)
+DEFAULT_RANGES = {"reflector": (0.49, 0.55), "active": (0.46, 0.52),
+                  "director": (0.40, 0.50), "spacing": (0.10, 0.30)}
+
+
+# --- İşçi süreç tarafı ---
+_PROGRESS = None  # havuz başlatıcısıyla devralınan ilerleme kuyruğu
+
+
+def _init_worker(progress_queue):
+    global _PROGRESS
+    _PROGRESS = progress_queue
+
+
+def _run_optimization(job_id, method, args, kwargs):
+    # numpy ve optimizasyon modülü yalnızca işçi süreçte yüklenir
+    import yagi_optimizasyon_modulu as yom
+    kwargs = dict(kwargs)
+    ranges = kwargs.pop("ranges", None)
+    if method == "grid":
+        if ranges:
+            kwargs["ranges"] = dict(yom.DEFAULT_RANGES, **ranges)
+        return yom.optimize_yagi(*args, **kwargs)
+    if ranges:
+        prefix = {"reflector": "ref", "active": "act", "director": "dir", "spacing": "spacing"}
+        kwargs.update({f"{prefix[name]}_range": tuple(r) for name, r in ranges.items()})
+    last, sent = None, 0.0
+    for last in getattr(yom, OPTIMIZERS[method][0])(*args, **kwargs):
+        now = time.perf_counter()
+        if _PROGRESS is not None and not last["finished"] and now - sent >= PROGRESS_INTERVAL:
+            _PROGRESS.put((job_id, {"done": last["done"], "total": last["total"], "best": last["best"]}))
+            sent = now
+    return last["best"]
+
+
+# --- İstek ayrıştırma ---
+def _frequency(body):
+    if "freq_mhz" in body:
+        frekans = float(body["freq_mhz"])
+    else:
+        frekans = bant_frekansi(body["band"])
+    _check_limit("freq_mhz", frekans)
+    return frekans
+
+
+def _diameter(body):
+    # Eleman çapı (m)
+    cap_mm = float(body.get("diameter_mm", 4.0))
+    _check_limit("diameter_mm", cap_mm)
+    return cap_mm / 1000.0
+
+
+def _check_limit(name, value):
+    lo, hi = LIMITS[name]
+    if not lo <= value <= hi:
+        raise ValueError(f"{name} {lo} ile {hi} arasında olmalı.")
+
+
+def _grid_points(ranges, step):
+    # optimize_yagi/pareto'nun tam gridindeki nokta sayısı (eksik aralıklar varsayılandır)
+    total = 1
+    for name in RANGE_NAMES:
+        lo, hi = ranges.get(name, DEFAULT_RANGES[name])
+        total *= int((hi - lo) / step + 1e-9) + 1
+    return total
+
+
+def parse_optimization(body):
+    """/optimize gövdesi -> (yöntem, argümanlar, anahtar argümanlar); geçersizse ValueError."""
+    method = body.get("method", "grid")
+    if method not in OPTIMIZERS:
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
+    elements = int(body.get("elements", 3))
+    _check_limit("elements", elements)
+    cap_m = _diameter(body)
+    allowed = OPTIMIZERS[method][1]
+    unknown = set(body) - set(allowed) - {"method", "band", "freq_mhz", "elements", "diameter_mm",
+                                          "ranges", "stream"}
+    if unknown:
+        raise ValueError(f"{method} için bilinmeyen ayar: {', '.join(sorted(unknown))}")
+    kwargs = {name: kind(body[name]) for name, kind in allowed.items() if name in body}
+    for name, value in kwargs.items():
+        if name in LIMITS:
+            _check_limit(name, value)
+    ranges = body.get("ranges")
+    if ranges:
+        if method == "de":
+            raise ValueError("de yöntemi aralık (ranges) kabul etmez.")
+        if not isinstance(ranges, dict):
+            raise ValueError("ranges bir JSON nesnesi olmalı.")
+        checked = {}
+        for name, r in ranges.items():
+            if name not in RANGE_NAMES or not isinstance(r, list) or len(r) != 2:
+                raise ValueError(f"Geçersiz aralık: {name}")
+            lo, hi = float(r[0]), float(r[1])
+            if not RANGE_BOUNDS[0] <= lo < hi <= RANGE_BOUNDS[1]:
+                raise ValueError(f"{name} aralığı {RANGE_BOUNDS[0]} ≤ alt < üst ≤ {RANGE_BOUNDS[1]} olmalı.")
+            checked[name] = [lo, hi]
+        kwargs["ranges"] = checked
+    if method == "pareto" or (method == "grid" and ranges):
+        points = _grid_points(kwargs.get("ranges", {}), kwargs.get("step", 0.005))
+        if points > MAX_GRID_POINTS:
+            raise ValueError(f"Grid çok büyük: {points:,} nokta (en fazla {MAX_GRID_POINTS:,}).")
+
+    if method == "grid":
+        args = (_frequency(body), elements, kwargs.pop("step", 0.005), cap_m)
+    else:
+        args = (_frequency(body), elements, cap_m)
+    return method, args, kwargs
+
+
+def parse_design(body):
+    """/design gövdesinin frekans, çap ve eleman sayısını LIMITS'e göre doğrular; geçersizse ValueError."""
+    _frequency(body)
+    _diameter(body)
+    if "elements" in body:
+        _check_limit("elements", int(body["elements"]))
+
+
+# --- Servis ---
+class _Job:
+    __slots__ = ("id", "key", "state", "task", "subscribers", "last")
+
+    def __init__(self, job_id, key):
+        self.id = job_id
+        self.key = key
+        self.state = "queued"
+        self.task = None
+        self.subscribers = set()  # akış istemcilerinin olay kuyrukları
+        self.last = None          # son ilerleme (sonradan katılan akışlar için)
+
+
+class _Latency:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count, self.total, self.max = 0, 0.0, 0.0
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self):
+        return {"count": self.count, "mean_ms": 1000 * self.total / self.count if self.count else 0.0,
+                "max_ms": 1000 * self.max}
+
+
+class DesignService:
+    """
+    workers: ağır şerit süreç sayısı, max_queue: havuz doluyken bekleyebilecek en fazla iş,
+    quick_workers: MoM analizleri için iş parçacığı sayısı.
+    start() ile dinlemeye başlar, close() ile havuzları kapatır.
+    """
+
+    def __init__(self, workers=None, max_queue=8, quick_workers=2):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = int(max_queue)
+        self.quick_workers = quick_workers
+        self._jobs = {}
+        self._ids = count(1)
+        self._counters = {"completed": 0, "failed": 0, "rejected": 0, "coalesced": 0}
+        self._latency = {}
+        self._quick_in_flight = 0
+        self._started = time.time()
+        self._server = None
+
+    # --- yaşam döngüsü ---
+    async def start(self, host="127.0.0.1", port=0):
+        """Dinlemeye başlar; (adres, port) döndürür (port=0 ise boş bir port seçilir)."""
+        self._loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._waiting = 0
+        self._running = 0
+        # spawn: fork ile başlayan işçiler açık istemci soketlerini devralır ve bağlantılar
+        # ana süreç kapatsa da kapanmaz
+        ctx = mp.get_context("spawn")
+        self._progress = ctx.Queue()
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx,
+                                         initializer=_init_worker, initargs=(self._progress,))
+        self._quick_pool = ThreadPoolExecutor(max_workers=self.quick_workers)
+        self._pump = threading.Thread(target=self._pump_progress, daemon=True)
+        self._pump.start()
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for job in list(self._jobs.values()):
+            job.task.cancel()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._quick_pool.shutdown(wait=True)
+        self._progress.put(None)
+        self._pump.join()
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    def _pump_progress(self):
+        # İşçilerin ilerleme kayıtlarını olay döngüsüne aktarır (ayrı iş parçacığı)
+        while True:
+            item = self._progress.get()
+            if item is None:
+                return
+            self._loop.call_soon_threadsafe(self._on_progress, *item)
+
+    def _on_progress(self, job_id, progress):
+        for job in self._jobs.values():
+            if job.id == job_id:
+                job.last = progress
+                self._publish(job, {"event": "progress", **progress})
+                return
+
+    @staticmethod
+    def _publish(job, event):
+        for q in job.subscribers:
+            if q.full():
+                q.get_nowait()  # en eski ara olay düşer; sonuç/hata her zaman son olaydır
+            q.put_nowait(event)
+
+    # --- metrikler ---
+    def metrics(self):
+        return {
+            "uptime": time.time() - self._started,
+            "heavy": {"workers": self.workers, "max_queue": self.max_queue,
+                      "queue_depth": self._waiting, "running": self._running,
+                      "in_flight": len(self._jobs), **self._counters},
+            "quick": {"workers": self.quick_workers, "in_flight": self._quick_in_flight},
+            "latency": {name: lat.to_dict() for name, lat in self._latency.items()},
+        }
+
+    def _observe(self, name, seconds):
+        self._latency.setdefault(name, _Latency()).add(seconds)
+
+    # --- ağır şerit ---
+    def _submit(self, method, args, kwargs):
+        """Yeni iş başlatır ya da aynı parametreli süren işe katılır; kuyruk doluysa None."""
+        key = make_key("optimize", {"method": method, "args": args, "kwargs": kwargs})
+        job = self._jobs.get(key)
+        if job is not None:
+            self._counters["coalesced"] += 1
+            return job
+        if len(self._jobs) >= self.workers + self.max_queue:
+            self._counters["rejected"] += 1
+            return None
+        job = self._jobs[key] = _Job(next(self._ids), key)
+        job.task = asyncio.ensure_future(self._run(job, method, args, kwargs))
+        # Yalnızca akış istemcisi olan işlerde hata, olay olarak iletilmiştir
+        job.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return job
+
+    async def _run(self, job, method, args, kwargs):
+        self._waiting += 1
+        try:
+            async with self._slots:
+                self._waiting -= 1
+                self._running += 1
+                job.state = "running"
+                self._publish(job, {"event": "running"})
+                try:
+                    fut = self._pool.submit(_run_optimization, job.id, method, args, kwargs)
+                    result = await asyncio.wrap_future(fut)
+                finally:
+                    self._running -= 1
+            self._counters["completed"] += 1
+            self._publish(job, {"event": "result", "result": _jsonable(result)})
+            return result
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._counters["failed"] += 1
+            self._publish(job, {"event": "error", "error": f"{type(e).__name__}: {e}"})
+            raise
+        finally:
+            if job.state == "queued":
+                self._waiting -= 1
+            job.state = "done"
+            self._jobs.pop(job.key, None)
+
+    # --- HTTP ---
+    async def _handle(self, reader, writer):
+        t0 = time.perf_counter()
+        name = "invalid"
+        try:
+            request = await reader.readline()
+            parts = request.decode("latin-1").split()
+            if len(parts) != 3:
+                return
+            method, path = parts[0], parts[1].split("?", 1)[0]
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                k, _, v = line.decode("latin-1").partition(":")
+                headers[k.strip().lower()] = v.strip()
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY:
+                await _send(writer, 413, {"error": "İstek gövdesi çok büyük."})
+                return
+            body = await reader.readexactly(length) if length else b""
+
+            routes = {"/health": ("GET", self._health), "/metrics": ("GET", self._metrics),
+                      "/design": ("POST", self._design), "/optimize": ("POST", self._optimize)}
+            if path not in routes:
+                await _send(writer, 404, {"error": f"Bilinmeyen yol: {path}"})
+                return
+            expected, handler = routes[path]
+            if method != expected:
+                await _send(writer, 405, {"error": f"{path} yalnızca {expected} kabul eder."})
+                return
+            name = path.strip("/")
+            if method == "POST":
+                try:
+                    data = json.loads(body or b"{}")
+                    if not isinstance(data, dict):
+                        raise ValueError("Gövde bir JSON nesnesi olmalı.")
+                except ValueError as e:
+                    await _send(writer, 400, {"error": f"Geçersiz JSON: {e}"})
+                    return
+                await handler(writer, data)
+            else:
+                await handler(writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._observe(name, time.perf_counter() - t0)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _health(self, writer):
+        await _send(writer, 200, {"status": "ok"})
+
+    async def _metrics(self, writer):
+        await _send(writer, 200, self.metrics())
+
+    async def _design(self, writer, data):
+        try:
+            parse_design(data)
+        except (KeyError, TypeError, ValueError) as e:
+            await _send(writer, 400, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._quick_in_flight += 1
+        try:
+            result = await self._loop.run_in_executor(self._quick_pool, run_job, data, bool(data.get("mom")))
+        finally:
+            self._quick_in_flight -= 1
+        await _send(writer, 400 if "error" in result else 200, result)
+
+    async def _optimize(self, writer, data):
+        try:
+            method, args, kwargs = parse_optimization(data)
+        except (KeyError, TypeError, ValueError) as e:
+            await _send(writer, 400, {"error": f"{type(e).__name__}: {e}"})
+            return
+        job = self._submit(method, args, kwargs)
+        if job is None:
+            await _send(writer, 503, {"error": "Optimizasyon kuyruğu dolu.", "queue_depth": self._waiting},
+                        headers={"Retry-After": "1"})
+            return
+        if data.get("stream"):
+            await self._stream(writer, job)
+            return
+        try:
+            result = await asyncio.shield(job.task)
+        except Exception as e:
+            await _send(writer, 500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        await _send(writer, 200, {"job": job.id, "result": _jsonable(result)})
+
+    async def _stream(self, writer, job):
+        events = asyncio.Queue(STREAM_BUFFER)
+        job.subscribers.add(events)
+        try:
+            writer.write(_head(200, "application/x-ndjson"))
+            first = {"event": job.state, "job": job.id}
+            if job.state == "queued":
+                first["queue_depth"] = self._waiting
+            await _write_line(writer, first)
+            if job.last is not None:
+                await _write_line(writer, {"event": "progress", **job.last})
+            while True:
+                event = await events.get()
+                await _write_line(writer, event)  # drain: yavaş istemci geri basınç uygular
+                if event["event"] in ("result", "error"):
+                    return
+        finally:
+            job.subscribers.discard(events)
+
+
+def _head(status, content_type, headers=None, length=None):
+    lines = [f"HTTP/1.1 {status} {_REASONS[status]}", f"Content-Type: {content_type}",
+             "Connection: close"]
+    if length is not None:
+        lines.append(f"Content-Length: {length}")
+    lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _send(writer, status, payload, headers=None):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    writer.write(_head(status, "application/json; charset=utf-8", headers, len(body)) + body)
+    await writer.drain()
+
+
+async def _write_line(writer, payload):
+    writer.write(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+async def _serve(host, port, workers, max_queue):
+    service = DesignService(workers=workers, max_queue=max_queue)
+    host, port = await service.start(host, port)
+    task = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            asyncio.get_running_loop().add_signal_handler(sig, task.cancel)
+        except (NotImplementedError, AttributeError):  # Windows
+            pass
+    print(f"Tasarım servisi http://{host}:{port} (işçi {service.workers}, kuyruk {service.max_queue})",
+          file=sys.stderr)
+    try:
+        await service.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await service.close()
+
+
+# --- Öz denetim (yalnızca localhost) ---
+async def _request(port, method, path, payload=None):
+    # Küçük istemci: (durum, gövde) ya da akışta (durum, olay listesi)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+                 + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        k, _, v = line.decode().partition(":")
+        headers[k.lower()] = v.strip()
+    data = await reader.read()
+    writer.close()
+    if headers.get("content-type") == "application/x-ndjson":
+        return status, [json.loads(line) for line in data.splitlines()]
+    return status, json.loads(data)
+
+
+async def _self_test():
+    import yagi_optimizasyon_modulu as yom
+    from anten_cekirdek import dipol_hesapla
+
+    service = DesignService(workers=2, max_queue=1)
+    _, port = await service.start()
+    try:
+        assert await _request(port, "GET", "/health") == (200, {"status": "ok"})
+        status, res = await _request(port, "POST", "/design", {"type": "dipol", "freq_mhz": 145.0})
+        assert status == 200 and res["result"]["uzunluk"] == dipol_hesapla(145.0, 0.004)["uzunluk"]
+        assert (await _request(port, "POST", "/optimize", {"method": "x"}))[0] == 400
+        # Geçersiz/aşırı ayarlar bağlantıyı koparmadan 400 alır
+        assert DEFAULT_RANGES == yom.DEFAULT_RANGES
+        for bad in ({"ranges": [1, 2]}, {"ranges": {"active": 0.5}}, {"ranges": {"active": [0.6, 0.5]}},
+                    {"elements": 500}, {"step": 1e-6}, {"method": "adaptive", "refine": 1}, {"method": "de", "generations": -1},
+                    {"method": "de", "generations": 10**9}, {"method": "de", "popsize": 10**6},
+                    {"method": "de", "ranges": {"active": [0.46, 0.52]}},
+                    {"step": 0.001, "ranges": {"spacing": [0.01, 1.5], "director": [0.01, 1.5]}}):
+            status, res = await _request(port, "POST", "/optimize", dict({"freq_mhz": 145.0}, **bad))
+            assert status == 400 and "error" in res, (bad, status, res)
+        for bad in ({"type": "yagi", "elements": 3000000}, {"type": "yagi", "elements": 500, "mom": True},
+                    {"diameter_mm": 0}, {"diameter_mm": 1e6}, {"freq_mhz": -1.0}, {"freq_mhz": 1e9}):
+            t0 = time.perf_counter()
+            status, res = await _request(port, "POST", "/design", dict({"freq_mhz": 145.0}, **bad))
+            assert status == 400 and "error" in res and time.perf_counter() - t0 < 0.5, (bad, status, res)
+        assert (await _request(port, "GET", "/yok"))[0] == 404
+
+        # Birleştirme: aynı 4 istek tek iş olarak çalışır; sonuç doğrudan çağrıyla aynı
+        de = {"method": "de", "freq_mhz": 145.0, "elements": 12, "generations": 150}
+        replies = await asyncio.gather(*[_request(port, "POST", "/optimize", de) for _ in range(4)])
+        direct = yom.optimize_yagi_de(145.0, 12, 0.004, generations=150)
+        assert all(s == 200 and r["result"] == direct and r["job"] == replies[0][1]["job"] for s, r in replies)
+        assert service.metrics()["heavy"]["coalesced"] == 3
+
+        # Akış: queued/running, ilerleme olayları, en son sonuç
+        status, events = await _request(port, "POST", "/optimize", dict(de, seed=1, stream=True))
+        kinds = [e["event"] for e in events]
+        assert status == 200 and kinds[-1] == "result" and "progress" in kinds
+        assert events[-1]["result"] == yom.optimize_yagi_de(145.0, 12, 0.004, generations=150, seed=1)
+        print(f"akış: {len(events)} olay ({kinds.count('progress')} ilerleme)")
+
+        # Geri basınç: 2 işçi + 1 kuyruk dolu iken dördüncü farklı iş 503 alır;
+        # bu sırada hızlı şerit (dipol) gecikmesi düşük kalır
+        slow = dict(de, generations=600, patience=600)
+        heavy = [asyncio.ensure_future(_request(port, "POST", "/optimize", dict(slow, seed=10 + i)))
+                 for i in range(3)]
+        await asyncio.sleep(0.3)
+        m = service.metrics()["heavy"]
+        assert m["running"] == 2 and m["queue_depth"] == 1, m
+        status, res = await _request(port, "POST", "/optimize", dict(slow, seed=99))
+        assert status == 503 and res["queue_depth"] == 1
+        t0 = time.perf_counter()
+        for _ in range(20):
+            assert (await _request(port, "POST", "/design", {"type": "yagi", "band": "70cm", "elements": 7}))[0] == 200
+        quick = (time.perf_counter() - t0) / 20
+        assert all(s == 200 for s, _ in await asyncio.gather(*heavy))
+        status, metrics = await _request(port, "GET", "/metrics")
+        print(f"geri basınç: 503 alındı; yoğun havuzda /design {quick * 1000:.2f} ms")
+        print("metrikler:", json.dumps(metrics["heavy"]))
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel HTTP/JSON anten tasarım servisi")
+    parser.add_argument("--host", default="127.0.0.1", help="Dinlenecek adres (varsayılan yalnızca yerel)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Optimizasyon süreç sayısı")
+    parser.add_argument("--max-queue", type=int, default=8, help="Havuz doluyken bekleyebilecek en fazla iş")
+    parser.add_argument("--self-test", action="store_true", help="Yerel öz denetimi çalıştır ve çık")
+    args = parser.parse_args(argv)
+    if args.self_test:
+        asyncio.run(_self_test())
+        return
+    try:
+        asyncio.run(_serve(args.host, args.port, args.workers, args.max_queue))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# tolerans_analizi.py
+"""
+Üretim Toleransı Analizi (Monte Carlo)
+Bir tasarımın eleman boylarına (kesim hatası), boom üzerindeki konumlarına (aralık
+kayması) ve çapına rastgele sapmalar eklenerek on binlerce varyant üretilir; besleme
+empedansı, SWR ve ileri kazanç dağılımları ile VSWR hedefine göre verim raporlanır.
+
+Her varyantı MoM ile çözmek dakikalar sürer. Bunun yerine tasarım çevresinde bir yanıt
+yüzeyi kurulur: her parametre tolerans aralığının yarısı kadar iki yöne oynatılıp MoM
+ile çözülür (2P+1 çözüm). Bu çözümlerden türev ve köşegen ikinci türev elde edilir ve
+tüm örnekler tek bir matris çarpımıyla değerlendirilir. Yüzeyin doğruluğu, örneklerin
+bir kısmı tam MoM ile çözülerek ölçülür (model_error).
+Çap, MoM modelinde tüm teller için ortaktır (aynı boru partisi varsayımı).
+"""
+import math
+import numpy as np
+
+from mom_cozucu import WireModel, wires_from_design
+
+DISTRIBUTIONS = ("uniform", "normal")
+
+
+def _response(lengths, positions, radius_m, feed, image, freq_hz, segments, z0):
+    # (besleme empedansı, ileri kazanç dBi); monopol görüntü dipolüyle çözülür
+    model = WireModel(lengths, positions, radius_m, segments=segments, feed=feed)
+    res = model.analyze(freq_hz, z0=z0 * (2 if image else 1))
+    if image:
+        return res["impedance"] / 2, res["gain"] + 10 * math.log10(2)
+    return res["impedance"], res["gain"]
+
+
+def _swr(z, z0):
+    gamma = np.abs((z - z0) / (z + z0))
+    return (1 + gamma) / np.maximum(1 - gamma, 1e-12)
+
+
+def _summary(values):
+    p5, p50, p95 = np.percentile(values, [5, 50, 95])
+    return {"mean": float(np.mean(values)), "std": float(np.std(values)),
+            "min": float(np.min(values)), "p5": float(p5), "p50": float(p50),
+            "p95": float(p95), "max": float(np.max(values))}
+
+
+def tolerance_analysis(sonuclar, samples=20_000, length_tol_m=0.002, spacing_tol_m=0.002,
+                       diameter_tol_m=0.0002, distribution="uniform", vswr_target=1.5,
+                       seed=None, validate=16, freq_mhz=None, segments=21, z0=50.0):
+    """
+    Tasarım sözlüğü (monopol/dipol/Yagi-Uda) için Monte Carlo tolerans analizi.
+    Toleranslar ± sınırlardır: "uniform" dağılımda sapma [-tol, tol] içinde düzgün,
+    "normal" dağılımda σ = tol/3'tür. Aralık kayması her elemanın boom konumuna ayrı
+    ayrı uygulanır (reflektör referanstır).
+    Dönüş: impedance (karmaşık), swr, gain örnek dizileri; nominal değerler; her büyüklük
+    için özet (mean/std/min/p5/p50/p95/max); yield (SWR ≤ vswr_target oranı);
+    model_error (doğrulanan örneklerde en büyük bağıl |ΔZ| ve |ΔSWR|) ve exact_solves.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Bilinmeyen dağılım: {distribution}")
+    lengths, positions, radius_m, feed, image = wires_from_design(sonuclar)
+    lengths = np.asarray(lengths, dtype=float)
+    positions = np.asarray(positions, dtype=float)
+    n_w = lengths.size
+    freq_hz = (freq_mhz if freq_mhz is not None else sonuclar["frekans"]) * 1e6
+
+    # Parametreler: boylar (W), konumlar (W-1, reflektör sabit), yarıçap (1)
+    nominal = np.concatenate([lengths, positions[1:], [radius_m]])
+    tol = np.concatenate([np.full(n_w, length_tol_m * (2 if image else 1)),  # görüntü dipolü 2L
+                          np.full(n_w - 1, spacing_tol_m),
+                          [diameter_tol_m / 2]])
+
+    def solve(p):
+        return _response(p[:n_w], np.concatenate([[0.0], p[n_w:2 * n_w - 1]]), p[-1],
+                         feed, image, freq_hz, segments, z0)
+
+    # Yanıt yüzeyi: merkezi farklar, adım = tol/2 (tolerans aralığı boyunca kiriş eğimi)
+    z_nom, g_nom = solve(nominal)
+    active = np.flatnonzero(tol > 0)
+    dz = np.zeros(nominal.size, dtype=complex)
+    d2z = np.zeros(nominal.size, dtype=complex)
+    dg = np.zeros(nominal.size)
+    d2g = np.zeros(nominal.size)
+    for i in active:
+        h = tol[i] / 2
+        p = nominal.copy()
+        p[i] += h
+        z_p, g_p = solve(p)
+        p[i] -= 2 * h
+        z_m, g_m = solve(p)
+        dz[i], d2z[i] = (z_p - z_m) / (2 * h), (z_p - 2 * z_nom + z_m) / h**2
+        dg[i], d2g[i] = (g_p - g_m) / (2 * h), (g_p - 2 * g_nom + g_m) / h**2
+
+    # Örnekler tek parti halinde
+    rng = np.random.default_rng(seed)
+    if distribution == "uniform":
+        delta = rng.uniform(-1.0, 1.0, (samples, nominal.size)) * tol
+    else:
+        delta = rng.normal(0.0, 1.0, (samples, nominal.size)) * (tol / 3)
+    delta_sq = 0.5 * delta**2
+    z = z_nom + delta @ dz + delta_sq @ d2z
+    gain = g_nom + delta @ dg + delta_sq @ d2g
+    swr = _swr(z, z0)
+
+    # Doğrulama: ilk validate örnek tam MoM ile
+    n_val = min(validate, samples)
+    z_err = swr_err = 0.0
+    for j in range(n_val):
+        z_exact, _ = solve(nominal + delta[j])
+        z_err = max(z_err, abs(z[j] - z_exact) / abs(z_exact))
+        swr_err = max(swr_err, abs(swr[j] - float(_swr(z_exact, z0))))
+
+    return {
+        "impedance": z,
+        "swr": swr,
+        "gain": gain,
+        "nominal": {"impedance": complex(z_nom), "swr": float(_swr(z_nom, z0)), "gain": float(g_nom)},
+        "stats": {"swr": _summary(swr), "resistance": _summary(z.real),
+                  "reactance": _summary(z.imag), "gain": _summary(gain)},
+        "vswr_target": vswr_target,
+        "yield": float(np.mean(swr <= vswr_target)),
+        "model_error": {"impedance": float(z_err), "swr": float(swr_err), "samples": n_val},
+        "exact_solves": 1 + 2 * active.size + n_val,
+    }
+
+
+if __name__ == "__main__":
+    import time
+    from anten_cekirdek import dipol_hesapla, monopol_hesapla, yagi_uda_hesapla
+    from mom_cozucu import solve_design
+
+    for tasarim in (dipol_hesapla(145.0, 0.004), monopol_hesapla(145.0, 0.004),
+                    yagi_uda_hesapla(145.0, 8), yagi_uda_hesapla(435.0, 6, cap_m=0.003)):
+        t0 = time.perf_counter()
+        res = tolerance_analysis(tasarim, samples=20_000, seed=1)
+        dt = time.perf_counter() - t0
+        # Nominal nokta solve_design ile aynı olmalı
+        assert abs(res["nominal"]["impedance"] - solve_design(tasarim)["impedance"]) < 1e-9
+        s = res["stats"]["swr"]
+        print(f"{tasarim['tip']:8s} {tasarim['frekans']} MHz: SWR nominal {res['nominal']['swr']:.2f}, "
+              f"p5-p95 {s['p5']:.2f}-{s['p95']:.2f}, verim (≤{res['vswr_target']}) %{100 * res['yield']:.1f}, "
+              f"kazanç σ {res['stats']['gain']['std']:.3f} dB | yüzey hatası Z {res['model_error']['impedance']:.1e}, "
+              f"SWR {res['model_error']['swr']:.1e} | {res['exact_solves']} MoM, {dt:.2f} s")
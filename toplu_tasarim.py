@@ -0,0 +1,191 @@
+# toplu_tasarim.py
+"""
+Toplu Anten Tasarımı (komut satırı)
+CSV veya JSONL dosyasından tasarım işlerini okur ve sonuçları satır satır JSONL
+olarak yazar. İşler tembel okunur ve bir süreç havuzuna sınırlı sayıda parça halinde
+gönderilir; bellek kullanımı iş sayısından bağımsızdır ve çıktı sırası girdi sırasıdır.
+
+İş alanları (CSV başlığı veya JSON anahtarları):
+    band        : "2m", "2m (144-146 MHz)" veya frekans (MHz)   [ya da freq_mhz]
+    type        : monopol | dipol | yagi
+    diameter_mm : eleman çapı (mm), varsayılan 4.0
+    elements    : Yagi eleman sayısı, varsayılan 3 (ELEMENT_LIMITS aralığında)
+Her çıktı satırının "line" alanı işin girdi dosyasındaki satır numarasıdır.
+
+Örnek:
+    python toplu_tasarim.py isler.csv -o sonuclar.jsonl --workers 8 --mom
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from anten_cekirdek import bant_frekansi, monopol_hesapla, dipol_hesapla, yagi_uda_hesapla
+
+_TIPLER = {"monopol": "Monopol", "dipol": "Dipol", "yagi": "Yagi-Uda", "yagi-uda": "Yagi-Uda"}
+# Yagi eleman sayısı sınırları (dahil); tek bir satır toplu işi saniyelerce/MoM'da bellekçe tüketmesin
+ELEMENT_LIMITS = (2, 40)
+
+
+class BadLine:
+    """Ayrıştırılamayan girdi satırı; hesaplanmaz, çıktıya hata kaydı olarak yazılır."""
+
+    def __init__(self, text, error):
+        self.text = text
+        self.error = error
+
+
+def read_jobs(stream, fmt):
+    """
+    Girdi akışından (satır numarası, iş) çiftlerini tek tek üretir (csv veya jsonl).
+    Satır numarası girdi dosyasındakidir (CSV'de başlık 1. satırdır); boş satırlar atlanır.
+    Geçersiz JSON ya da nesne olmayan satırlar akışı durdurmaz; yerlerine BadLine üretilir.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {k.strip(): v.strip() for k, v in row.items()
+                                    if k and v is not None and v.strip() != ""}
+    else:
+        for no, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = json.loads(line)
+            except ValueError as e:
+                yield no, BadLine(line, f"{type(e).__name__}: {e}")
+                continue
+            if isinstance(job, dict):
+                yield no, job
+            else:
+                yield no, BadLine(line, f"TypeError: iş bir JSON nesnesi olmalı, {type(job).__name__} geldi")
+
+
+def _jsonable(value):
+    # MoM sonuçlarındaki karmaşık sayılar [re, im] olur; akım dizileri atlanır
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items() if k != "currents"}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def run_job(job, mom=False):
+    """Tek bir işi hesaplar; hata durumunda {"error": ...} döndürür."""
+    if isinstance(job, BadLine):
+        return {"error": job.error}
+    try:
+        if "freq_mhz" in job:
+            frekans = float(job["freq_mhz"])
+        else:
+            frekans = bant_frekansi(job["band"])
+        tip = _TIPLER.get(str(job.get("type", "dipol")).strip().lower())
+        if tip is None:
+            raise ValueError(f"Bilinmeyen anten tipi: {job.get('type')}")
+        cap_m = float(job.get("diameter_mm", 4.0)) / 1000.0
+        if frekans <= 0 or cap_m <= 0:
+            raise ValueError("Frekans ve çap pozitif olmalı.")
+
+        if tip == "Monopol":
+            sonuc = monopol_hesapla(frekans, cap_m)
+        elif tip == "Dipol":
+            sonuc = dipol_hesapla(frekans, cap_m)
+        else:
+            eleman_sayisi = int(job.get("elements", 3))
+            lo, hi = ELEMENT_LIMITS
+            if not lo <= eleman_sayisi <= hi:
+                raise ValueError(f"Yagi-Uda eleman sayısı {lo} ile {hi} arasında olmalı.")
+            sonuc = yagi_uda_hesapla(frekans, eleman_sayisi, cap_m=cap_m)
+
+        if mom:
+            from mom_cozucu import solve_design  # numpy yalnızca istenirse yüklenir
+            sonuc["mom"] = solve_design(sonuc)
+        return {"result": _jsonable(sonuc)}
+    except (KeyError, ValueError, TypeError, ArithmeticError) as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def _run_batch(batch, mom):
+    return [run_job(job, mom) for _, job in batch]
+
+
+def _batches(jobs, size):
+    it = iter(jobs)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def process(jobs, out, workers=1, chunksize=256, mom=False, max_pending=None):
+    """
+    (satır numarası, iş) çiftlerini (bkz. read_jobs) hesaplayıp out akışına JSONL yazar;
+    yazılan satır sayısını döndürür.
+    Havuzda aynı anda en fazla max_pending parça (varsayılan 4 * workers) bekler.
+    """
+    written = 0
+
+    def emit(batch, results):
+        nonlocal written
+        for (no, job), res in zip(batch, results):
+            written += 1
+            if isinstance(job, BadLine):
+                job = job.text
+            out.write(json.dumps({"line": no, "job": job, **res}, ensure_ascii=False) + "\n")
+
+    if workers <= 1:
+        for batch in _batches(jobs, chunksize):
+            emit(batch, _run_batch(batch, mom))
+        return written
+
+    max_pending = max_pending or 4 * workers
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch in _batches(jobs, chunksize):
+            pending.append((batch, pool.submit(_run_batch, batch, mom)))
+            if len(pending) >= max_pending:
+                done_batch, fut = pending.popleft()
+                emit(done_batch, fut.result())
+        while pending:
+            done_batch, fut = pending.popleft()
+            emit(done_batch, fut.result())
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV/JSONL'den toplu anten tasarımı, JSONL çıktı.")
+    parser.add_argument("input", help="Girdi dosyası (.csv / .jsonl) veya stdin için '-'")
+    parser.add_argument("-o", "--output", default="-", help="Çıktı JSONL dosyası (varsayılan stdout)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Girdi biçimi (uzantıdan tahmin edilir)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Süreç sayısı")
+    parser.add_argument("--chunksize", type=int, default=256, help="Bir işçiye giden iş sayısı")
+    parser.add_argument("--mom", action="store_true", help="Her tasarımı MoM çözücüsüyle de analiz et")
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if args.input.lower().endswith(".csv") else "jsonl"
+
+    inp = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        n = process(read_jobs(inp, fmt), out, workers=args.workers,
+                    chunksize=args.chunksize, mom=args.mom)
+    finally:
+        if inp is not sys.stdin:
+            inp.close()
+        if out is not sys.stdout:
+            out.close()
+    print(f"{n} iş işlendi.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,521 @@
+# uyumlama.py
+"""
+Empedans Uyumlama Devreleri
+Bir tasarımın besleme empedansını besleme hattına (varsayılan 50 Ω) uyduran devrelerin
+eleman değerlerini bulur:
+    l_network    : iki reaktif elemanlı L devresi (paralel-seri veya seri-paralel, L/C)
+    quarter_wave : hat transformatörü (gerçel yükte çeyrek dalga, karmaşık yükte keyfi boy)
+    gamma        : gamma çubuğu + seri kondansatör (dengesiz besleme, aktif eleman kesilmez)
+    hairpin      : hairpin/beta (kısa devre hat saplaması) + kısaltılmış aktif eleman
+
+Her devre için merkez frekansta tam uyum sağlayan çözüm analitik olarak (gamma'da tek
+frekanslı yoğun tarama ile) bulunur. Bu çözümün çevresinde aday değerlerden bir ızgara
+kurulur ve tüm adayların SWR'si bant boyunca tek bir (yük × aday × frekans) broadcast
+işlemiyle hesaplanır. Bant içindeki en kötü SWR'si en küçük aday seçilir (eşitlikte
+ortalama SWR). Böylece devre yalnızca merkez frekansa değil banda göre ayarlanır.
+
+Yük tek bir sayı (ör. 50, 73 veya best_cfg['impedance']), frekans başına bir dizi
+(frekans_taramasi.sweep_design) ya da match_batch ile çok sayıda yük olabilir. Sabit
+yükte frekans bağımlılığı yalnızca devreden gelir.
+
+Gamma ve hairpin aktif elemanın orta noktasındaki (dengeli) empedansa uygulanır ve iletim
+hattı modelleriyle hesaplanır: gamma, akım bölme katsayılı katlanmış dipol (T uyumlama)
+modelinin yarısıdır; hairpin kısa devre iki telli hattır. Uç etkileri ve bağlantı
+endüktansları ihmal edilir. Hairpin'in seri kapasitif reaktansı aktif elemanın
+kısaltılmasıyla elde edilir ve burada eşdeğer seri kondansatör olarak modellenir.
+"""
+import math
+import numpy as np
+
+from anten_cekirdek import C
+
+NETWORKS = ("l_network", "quarter_wave", "gamma", "hairpin")
+# Aktif elemanın orta noktasına uygulanan (eleman çapı gerektiren) devreler
+BALANCED_NETWORKS = ("gamma", "hairpin")
+
+# Aday ızgarası: merkez çözüm çevresindeki çarpan aralıkları (geometrik, merkez dahil)
+_SCALE_SPAN = 1.25
+_LENGTH_SPAN = 1.1
+_LINE_SPAN = 1.3
+
+
+def _swr(z, z0):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gamma = np.abs((z - z0) / (z + z0))
+        swr = (1 + gamma) / np.maximum(1 - gamma, 1e-12)
+    return np.where(np.isfinite(swr), swr, np.inf)
+
+
+def _scales(span, points):
+    # span^-1 .. span, tek sayıda nokta; ortadaki tam 1.0
+    points = max(1, int(points) | 1)
+    return np.geomspace(1.0 / span, span, points) if points > 1 else np.ones(1)
+
+
+def _reactance(x0, nu):
+    # f0'da reaktansı x0 olan toplu elemanın f = nu·f0'daki reaktansı:
+    # bobin (x0 > 0) frekansla artar, kondansatör (x0 < 0) azalır
+    return np.where(x0 > 0, x0 * nu, x0 / nu)
+
+
+def _element(x0, f0_hz):
+    """f0'daki reaktanstan eleman: {"kind": "L"/"C", "value" (H/F), "reactance_ohm"}."""
+    w = 2 * math.pi * f0_hz
+    if x0 > 0:
+        return {"kind": "L", "value": x0 / w, "reactance_ohm": x0}
+    return {"kind": "C", "value": -1.0 / (w * x0) if x0 else math.inf, "reactance_ohm": x0}
+
+
+def _two_wire(spacing_m, a1, a2):
+    # İki paralel silindirik iletkenli hattın karakteristik empedansı (yarıçaplar a1, a2)
+    return 60.0 * np.arccosh((spacing_m**2 - a1**2 - a2**2) / (2 * a1 * a2))
+
+
+# --- Devreler ---
+# Hepsi aynı imzayı taşır: zl (N, F) yük, zc (N,) f0'daki yük, nu (F,) = f/f0.
+# Dönüş: adayların parametreleri {ad: (N, K)} ve giriş empedansı (N, K, F).
+
+def _l_network(zl, zc, nu, f0_hz, z0, opts):
+    r, x = zc.real, zc.imag
+    s = _scales(_SCALE_SPAN, opts["points"])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Paralel-seri: yük üzerinde paralel B, hat tarafında seri X (R_L > Z0'da her zaman çözülür)
+        mag2 = r**2 + x**2
+        root = np.sqrt(r / z0) * np.sqrt(mag2 - z0 * r)
+        b = np.stack([(x + root) / mag2, (x - root) / mag2], axis=1)                      # (N, 2)
+        x_series = 1 / b + x[:, None] * z0 / r[:, None] - z0 / (b * r[:, None])
+        shunt_series = (-1 / b, x_series)                          # (yük tarafı, hat tarafı)
+        # Seri-paralel: yüke seri X, hat tarafında paralel B (R_L < Z0)
+        q = np.sqrt(r * (z0 - r))
+        x_series = np.stack([q - x, -q - x], axis=1)
+        b = np.stack([np.sqrt((z0 - r) / r) / z0, -np.sqrt((z0 - r) / r) / z0], axis=1)
+        series_shunt = (x_series, -1 / b)
+
+    n = zc.size
+    shape = (n, 2, s.size, s.size)
+    zs = []
+    params = {"topology": [], "x_load": [], "x_line": []}
+    for topo, (x_load, x_line) in enumerate((shunt_series, series_shunt)):
+        # (N, 2 çözüm, yük tarafı ölçeği, hat tarafı ölçeği, F); ölçekler eleman reaktanslarına
+        # uygulanır. Yük tarafı tek başına hesaplanır, hat tarafı son adımda broadcast edilir.
+        xl = x_load[:, :, None, None] * s[None, None, :, None]                            # (N, 2, m, 1)
+        xn = x_line[:, :, None, None] * s[None, None, None, :]                            # (N, 2, 1, m)
+        rl, rn = _reactance(xl[..., None], nu), _reactance(xn[..., None], nu)
+        load = zl[:, None, None, None, :]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if topo == 0:
+                z = 1j * rn + 1 / (1 / (1j * rl) + 1 / load)
+            else:
+                z = 1 / (1 / (1j * rn) + 1 / (load + 1j * rl))
+        zs.append(z.reshape(n, -1, nu.size))
+        params["topology"].append(np.full((n, z.shape[1] * z.shape[2] * z.shape[3]), topo))
+        params["x_load"].append(np.broadcast_to(xl, shape).reshape(n, -1))
+        params["x_line"].append(np.broadcast_to(xn, shape).reshape(n, -1))
+    return {k: np.concatenate(v, axis=1) for k, v in params.items()}, np.concatenate(zs, axis=1)
+
+
+def _quarter_wave(zl, zc, nu, f0_hz, z0, opts):
+    r, x = zc.real, zc.imag
+    s = _scales(_LINE_SPAN, opts["points"])
+    theta_off = np.radians(np.linspace(-30.0, 30.0, s.size))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Z_in = Z0 koşulu: Z1² = Z0 R - Z0 X² / (Z0 - R), tanθ = Z1 (Z0 - R) / (Z0 X);
+        # X = 0'da Z1 = √(Z0 R), θ = 90°. Çözüm yoksa gerçel kısma göre çeyrek dalga merkezi
+        z1 = np.sqrt(z0 * r - z0 * x**2 / (z0 - r))
+        theta = np.mod(np.arctan2(z1 * (z0 - r), z0 * x), np.pi)
+        z1 = np.stack([z1, np.sqrt(z0 * r)], axis=1)                                    # (N, 2)
+        theta = np.stack([theta, np.full_like(r, np.pi / 2)], axis=1)
+    shape = (zc.size, 2, s.size, s.size)
+    z1 = np.broadcast_to(z1[:, :, None, None] * s[None, None, :, None], shape).reshape(zc.size, -1)
+    theta = np.clip(theta[:, :, None, None] + theta_off[None, None, None, :], 0.05, np.pi - 0.05)
+    theta = np.broadcast_to(theta, shape).reshape(zc.size, -1)
+    t = np.tan(theta[..., None] * nu)                                                    # (N, K, F)
+    zk, zload = z1[..., None], zl[:, None, :]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = zk * (zload + 1j * zk * t) / (zk + 1j * zload * t)
+    return {"line_impedance": z1, "theta": theta}, z
+
+
+def _gamma_impedance(zd, line_z, alpha, k_len):
+    # Gamma = T uyumlamanın yarısı: Z = Zt (1+α)² Zd / (2 Zt + (1+α)² Zd), Zt = j Z_hat tan(kℓ)
+    zt = 1j * line_z * np.tan(k_len)
+    step = (1 + alpha)**2 * zd
+    return zt * step / (2 * zt + step)
+
+
+def _gamma(zl, zc, nu, f0_hz, z0, opts):
+    lam = C / f0_hz
+    k0 = 2 * math.pi / lam
+    a, ar = opts["element_diameter_m"] / 2, opts["rod_diameter_m"] / 2
+    # Uygulanabilir çubuk aralıkları (merkezden merkeze): 0.005λ-0.025λ
+    spacing = np.geomspace(max(2 * (a + ar), 0.005 * lam), 0.025 * lam, 12)
+    line_z = _two_wire(spacing, a, ar)                                                   # (S,)
+    alpha = np.log(spacing / ar) / np.log(spacing / a)
+
+    # f0'da R(ℓ) = Z0 olan en kısa çubuk boyu: yoğun ℓ taraması + doğrusal ara değer
+    lengths = np.linspace(0.002, 0.2, 400) * lam
+    with np.errstate(invalid="ignore", divide="ignore"):
+        zg = _gamma_impedance(zc[:, None, None], line_z[None, :, None], alpha[None, :, None],
+                              k0 * lengths[None, None, :])                               # (N, S, L)
+    excess = zg.real - z0
+    cross = (excess[..., :-1] < 0) & (excess[..., 1:] >= 0)
+    first = np.argmax(cross, axis=-1)
+    found = np.take_along_axis(cross, first[..., None], axis=-1)[..., 0]
+    e0 = np.take_along_axis(excess, first[..., None], axis=-1)[..., 0]
+    e1 = np.take_along_axis(excess, first[..., None] + 1, axis=-1)[..., 0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        length0 = lengths[first] + (lengths[first + 1] - lengths[first]) * (-e0 / (e1 - e0))
+        length0 = np.where(found, length0, np.nan)                                       # (N, S)
+        # Kondansatör girişteki (endüktif) reaktansı f0'da sıfırlar
+        x_in = _gamma_impedance(zc[:, None], line_z, alpha, k0 * length0).imag
+        x_cap = np.where(x_in > 0, -x_in, np.nan)
+
+    sl = _scales(_LENGTH_SPAN, opts["points"])
+    sc = _scales(_SCALE_SPAN, opts["points"])
+    n = zc.size
+    shape = (n, spacing.size, sl.size, sc.size)
+    length = length0[:, :, None, None] * sl[None, None, :, None]                         # (N, S, L, 1)
+    x_cap = x_cap[:, :, None, None] * sc[None, None, None, :]                            # (N, S, 1, C)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Çubuk kısmı (N, S, L, 1, F) kondansatör ekseninden bağımsızdır
+        rod = _gamma_impedance(zl[:, None, None, None, :], line_z[None, :, None, None, None],
+                               alpha[None, :, None, None, None], k0 * length[..., None] * nu)
+        z = (rod + 1j * x_cap[..., None] / nu).reshape(n, -1, nu.size)
+    params = {"rod_length": length, "rod_spacing": spacing[None, :, None, None], "x_cap": x_cap}
+    return {k: np.broadcast_to(v, shape).reshape(n, -1) for k, v in params.items()}, z
+
+
+def _hairpin(zl, zc, nu, f0_hz, z0, opts):
+    lam = C / f0_hz
+    k0 = 2 * math.pi / lam
+    ar = opts["rod_diameter_m"] / 2
+    spacing = np.geomspace(max(3 * ar, 0.004 * lam), 0.04 * lam, 8)
+    line_z = 120.0 * np.arccosh(spacing / (2 * ar))                                      # (S,)
+    r, x = zc.real, zc.imag
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Seri-paralel L devresi: seri X (eleman kısaltma) + hat tarafında paralel bobin (saplama)
+        x_tot = -np.sqrt(r * (z0 - r))
+        x_series = x_tot - x
+        x_stub = (r**2 + x_tot**2) / -x_tot
+        length0 = np.arctan(x_stub[:, None] / line_z[None, :]) / k0                      # (N, S)
+
+    sl = _scales(_LENGTH_SPAN, opts["points"])
+    sx = _scales(_SCALE_SPAN, opts["points"])
+    n = zc.size
+    shape = (n, spacing.size, sl.size, sx.size)
+    length = length0[:, :, None, None] * sl[None, None, :, None]                         # (N, S, L, 1)
+    xs = x_series[:, None, None, None] * sx[None, None, None, :]                         # (N, 1, 1, X)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Anten (N, 1, 1, X, F) ve saplama (N, S, L, 1, F) admitansları ayrı hesaplanıp toplanır
+        y_ant = 1 / (zl[:, None, None, None, :] + 1j * _reactance(xs[..., None], nu))
+        y_stub = 1 / (1j * line_z[None, :, None, None, None] * np.tan(k0 * length[..., None] * nu))
+        z = (1 / (y_ant + y_stub)).reshape(n, -1, nu.size)
+    params = {"hairpin_length": length, "hairpin_spacing": spacing[None, :, None, None], "x_series": xs}
+    return {k: np.broadcast_to(v, shape).reshape(n, -1) for k, v in params.items()}, z
+
+
+_NETWORK_FUNCS = {
+    "l_network": _l_network,
+    "quarter_wave": _quarter_wave,
+    "gamma": _gamma,
+    "hairpin": _hairpin,
+}
+
+
+def _select(fn, zl, nu, center, f0_hz, z0, opts):
+    # Yük başına bant içi en kötü SWR'si en küçük aday. SWR |Γ| ile monoton olduğundan
+    # sıralama (n, K, F) üzerinde karmaşık bölme yapmadan |Γ|² ile yapılır; eşitlikte
+    # ortalama |Γ|². SWR yalnızca seçilen adaylar için hesaplanır.
+    params, z_in = fn(zl, zl[:, center], nu, f0_hz, z0, opts)
+    zr, zi = z_in.real, z_in.imag
+    zi2 = zi * zi
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        g2 = ((zr - z0)**2 + zi2) / ((zr + z0)**2 + zi2)
+    worst = g2.max(axis=-1)
+    mean = g2.mean(axis=-1)
+    worst = np.where(np.isnan(worst), np.inf, worst)
+    mean = np.where(np.isnan(mean), np.inf, mean)
+    best = np.lexsort((mean, worst), axis=-1)[:, 0]
+    rows = np.arange(zl.shape[0])
+    swr = _swr(z_in[rows, best], z0)
+    return (swr, swr.max(axis=-1), swr.mean(axis=-1),
+            {key: values[rows, best] for key, values in params.items()}, z_in.shape[1])
+
+
+def _resolve_networks(networks, element_diameter_m):
+    if networks is None:
+        return NETWORKS if element_diameter_m else tuple(n for n in NETWORKS if n not in BALANCED_NETWORKS)
+    networks = tuple(networks)
+    for name in networks:
+        if name not in _NETWORK_FUNCS:
+            raise ValueError(f"Bilinmeyen uyumlama devresi: {name}")
+        if name in BALANCED_NETWORKS and not element_diameter_m:
+            raise ValueError(f"{name} için eleman çapı (element_diameter_m) gerekli.")
+    return networks
+
+
+def match_batch(z_loads, freqs_mhz, f0_mhz=None, z0=50.0, networks=None, element_diameter_m=None,
+                rod_diameter_m=None, points=7, max_chunk_points=500_000):
+    """
+    Çok sayıda yük için toplu sentez (ör. optimizasyonun en iyi k adayı).
+    z_loads: (N,) frekanstan bağımsız yükler ya da (N, F) frekans başına yükler.
+    f0_mhz verilmezse bandın ortası; yük f0'da (en yakın frekansta) uydurulur.
+    networks verilmezse eleman çapı varsa dört devre, yoksa l_network ve quarter_wave.
+    points: aday ızgarasının eksen başına nokta sayısı (tek). Yükler, aday × frekans ×
+    yük sayısı max_chunk_points'i aşmayacak partiler halinde işlenir.
+    Dönüş: freqs_mhz, f0_mhz ve her devre için swr (N, F), swr_max (N,), swr_mean (N,),
+    params {ad: (N,)}; best (N,) en iyi devre adı ve best_swr_max (N,).
+    """
+    freqs = np.atleast_1d(np.asarray(freqs_mhz, dtype=float))
+    if f0_mhz is None:
+        f0_mhz = 0.5 * (freqs.min() + freqs.max())
+    if f0_mhz <= 0 or freqs.min() <= 0:
+        raise ValueError("Frekanslar pozitif olmalı.")
+    z = np.asarray(z_loads, dtype=complex)
+    if z.ndim <= 1:
+        z = np.broadcast_to(np.atleast_1d(z)[:, None], (np.atleast_1d(z).size, freqs.size))
+    if z.ndim != 2 or z.shape[1] != freqs.size:
+        raise ValueError("z_loads (N,) ya da (N, F) biçiminde olmalı.")
+    if np.any(z.real <= 0):
+        raise ValueError("Yük direnci pozitif olmalı.")
+    networks = _resolve_networks(networks, element_diameter_m)
+    opts = {"points": points, "element_diameter_m": element_diameter_m,
+            "rod_diameter_m": rod_diameter_m or (element_diameter_m or 0.0) / 2}
+    f0_hz = f0_mhz * 1e6
+    nu = freqs / f0_mhz
+    center = int(np.argmin(np.abs(freqs - f0_mhz)))
+    n = z.shape[0]
+
+    out = {"freqs_mhz": freqs, "f0_mhz": float(f0_mhz), "z0": z0}
+    for name in networks:
+        fn = _NETWORK_FUNCS[name]
+        # İlk yük tek başına çözülür; aday sayısı öğrenilince kalanlar partiler halinde
+        parts = [_select(fn, z[:1], nu, center, f0_hz, z0, opts)]
+        chunk = max(1, max_chunk_points // (parts[0][-1] * freqs.size))
+        for start in range(1, n, chunk):
+            parts.append(_select(fn, z[start:start + chunk], nu, center, f0_hz, z0, opts))
+        swr_best, swr_max, swr_mean = (np.concatenate([p[i] for p in parts]) for i in range(3))
+        params = {key: np.concatenate([p[3][key] for p in parts]) for key in parts[0][3]}
+        out[name] = {"swr": swr_best, "swr_max": swr_max, "swr_mean": swr_mean, "params": params}
+    table = np.stack([out[name]["swr_max"] for name in networks], axis=0)
+    out["best"] = np.array(networks, dtype=object)[np.argmin(table, axis=0)]
+    out["best_swr_max"] = table.min(axis=0)
+    return out
+
+
+def _describe(name, params, f0_hz, opts, velocity_factor):
+    # Seçilen adayın ham parametrelerinden okunabilir eleman değerleri
+    lam = C / f0_hz
+    if name == "l_network":
+        if params["topology"] == 0:
+            elements = [dict(_element(params["x_load"], f0_hz), position="shunt"),
+                        dict(_element(params["x_line"], f0_hz), position="series")]
+        else:
+            elements = [dict(_element(params["x_load"], f0_hz), position="series"),
+                        dict(_element(params["x_line"], f0_hz), position="shunt")]
+        return {"topology": ("shunt-series", "series-shunt")[params["topology"]], "elements": elements}
+    if name == "quarter_wave":
+        theta = params["theta"]
+        return {"line_impedance_ohm": params["line_impedance"], "electrical_deg": math.degrees(theta),
+                "velocity_factor": velocity_factor, "length_m": theta / (2 * math.pi) * lam * velocity_factor}
+    if name == "gamma":
+        return {"rod_length_m": params["rod_length"], "rod_spacing_m": params["rod_spacing"],
+                "rod_diameter_m": opts["rod_diameter_m"], "capacitor": _element(params["x_cap"], f0_hz)}
+    ar = opts["rod_diameter_m"] / 2
+    return {"hairpin_length_m": params["hairpin_length"], "hairpin_spacing_m": params["hairpin_spacing"],
+            "hairpin_diameter_m": opts["rod_diameter_m"],
+            "hairpin_impedance_ohm": float(120.0 * np.arccosh(params["hairpin_spacing"] / (2 * ar))),
+            "series": _element(params["x_series"], f0_hz)}
+
+
+def _bandwidth(freqs, swr, center, target):
+    # f0'ı içeren ve SWR ≤ target olan kesintisiz aralığın genişliği (MHz)
+    if swr[center] > target:
+        return 0.0
+    ok = swr <= target
+    lo = center
+    while lo > 0 and ok[lo - 1]:
+        lo -= 1
+    hi = center
+    while hi < ok.size - 1 and ok[hi + 1]:
+        hi += 1
+    return float(freqs[hi] - freqs[lo])
+
+
+def synthesize(z_load, freqs_mhz, f0_mhz=None, z0=50.0, networks=None, element_diameter_m=None,
+               rod_diameter_m=None, velocity_factor=0.66, swr_target=1.5, points=7):
+    """
+    Tek yük için uyumlama sentezi. z_load sabit (sayı) ya da freqs_mhz boyunda dizi.
+    rod_diameter_m: gamma çubuğu / hairpin teli çapı (verilmezse eleman çapının yarısı);
+    velocity_factor: hat transformatörünün fiziksel boyu için kablo hız katsayısı.
+    Dönüş: freqs_mhz, f0_mhz, z0, load (f0'daki yük), networks {ad: sonuç ya da None
+    (bu yükte gerçeklenemez)}, best (bant içi en kötü SWR'si en küçük devre). Sonuç:
+    components (eleman değerleri), swr (F,), swr_max, swr_center, bandwidth_mhz (f0
+    çevresinde SWR ≤ swr_target kalan aralık).
+    """
+    z = np.asarray(z_load, dtype=complex)
+    batch = match_batch(z[None], freqs_mhz, f0_mhz, z0, networks, element_diameter_m, rod_diameter_m, points)
+    freqs, f0 = batch["freqs_mhz"], batch["f0_mhz"]
+    center = int(np.argmin(np.abs(freqs - f0)))
+    opts = {"rod_diameter_m": rod_diameter_m or (element_diameter_m or 0.0) / 2}
+    results = {}
+    for name in _resolve_networks(networks, element_diameter_m):
+        res = batch[name]
+        swr = res["swr"][0]
+        if not np.isfinite(res["swr_max"][0]):
+            results[name] = None
+            continue
+        params = {key: values[0].item() for key, values in res["params"].items()}
+        results[name] = {
+            "components": _describe(name, params, f0 * 1e6, opts, velocity_factor),
+            "swr": swr,
+            "swr_max": float(res["swr_max"][0]),
+            "swr_center": float(swr[center]),
+            "bandwidth_mhz": _bandwidth(freqs, swr, center, swr_target),
+        }
+    return {
+        "freqs_mhz": freqs,
+        "f0_mhz": f0,
+        "z0": z0,
+        "load": complex(np.broadcast_to(z, freqs.shape)[center]),
+        "networks": results,
+        "best": batch["best"][0] if np.isfinite(batch["best_swr_max"][0]) else None,
+        "swr_target": swr_target,
+    }
+
+
+def match_design(sonuclar, f_min_mhz=None, f_max_mhz=None, points=41, z0=50.0, networks=None,
+                 rod_diameter_m=None, velocity_factor=0.66, swr_target=1.5, segments=21):
+    """
+    Tasarım sözlüğünün MoM besleme empedansını [f_min, f_max] bandında (varsayılan f0 ±%1)
+    points frekansta tarar (frekans_taramasi.sweep_design) ve synthesize ile uyumlar.
+    Gamma/hairpin yalnızca dipol ve Yagi için (eleman çapı tasarımdan alınır).
+    synthesize sonucuna ek olarak impedance (uyumsuz yük), unmatched_swr ve exact_solves.
+    """
+    from frekans_taramasi import sweep_design
+
+    f0 = sonuclar["frekans"]
+    f_min = f0 * 0.99 if f_min_mhz is None else f_min_mhz
+    f_max = f0 * 1.01 if f_max_mhz is None else f_max_mhz
+    if not f_min <= f0 <= f_max:
+        raise ValueError("Tasarım frekansı bandın içinde olmalı.")
+    step_khz = (f_max - f_min) * 1000.0 / max(points - 1, 1)
+    sweep = sweep_design(sonuclar, f_min, f_max, step_khz=step_khz, z0=z0, segments=segments)
+    diameter = None if sonuclar["tip"] == "Monopol" else sonuclar.get("cap_m")
+    res = synthesize(sweep["impedance"], sweep["freqs_mhz"], f0, z0, networks, diameter,
+                     rod_diameter_m, velocity_factor, swr_target)
+    res["impedance"] = sweep["impedance"]
+    res["unmatched_swr"] = sweep["swr"]
+    res["exact_solves"] = sweep["exact_solves"]
+    return res
+
+
+def _value_text(element):
+    if element["kind"] == "L":
+        return f"{element['value'] * 1e9:.1f} nH"
+    return f"{element['value'] * 1e12:.1f} pF"
+
+
+def component_text(name, components):
+    """Bir devrenin eleman değerlerinin kısa metin özeti (cm, nH, pF)."""
+    if name == "l_network":
+        yer = {"shunt": "paralel", "series": "seri"}
+        return ", ".join(f"{yer[e['position']]} {_value_text(e)}" for e in components["elements"]) + " (yükten hatta)"
+    if name == "quarter_wave":
+        return (f"{components['line_impedance_ohm']:.1f} Ω hat, {components['electrical_deg']:.0f}°, "
+                f"{components['length_m'] * 100:.1f} cm (VF {components['velocity_factor']:g})")
+    if name == "gamma":
+        return (f"çubuk {components['rod_length_m'] * 100:.1f} cm, aralık {components['rod_spacing_m'] * 100:.2f} cm, "
+                f"Ø {components['rod_diameter_m'] * 1000:.1f} mm, C {_value_text(components['capacitor'])}")
+    seri = components["series"]
+    ayar = "kısaltma" if seri["kind"] == "C" else "uzatma"
+    return (f"hairpin {components['hairpin_length_m'] * 100:.1f} cm × {components['hairpin_spacing_m'] * 100:.1f} cm "
+            f"({components['hairpin_impedance_ohm']:.0f} Ω), aktif eleman {ayar}: "
+            f"{seri['reactance_ohm']:+.1f} Ω ({_value_text(seri)})")
+
+
+if __name__ == "__main__":
+    import time
+    from anten_cekirdek import monopol_hesapla, yagi_uda_hesapla
+
+    def cascade(z_load, comps, name, f_hz, f0_hz, z0):
+        # Bağımsız kontrol: seçilen eleman değerleriyle tek frekansta skaler hesap
+        w = 2 * math.pi * f_hz
+
+        def x(el):
+            return w * el["value"] if el["kind"] == "L" else -1 / (w * el["value"])
+        if name == "l_network":
+            (e1, e2) = comps["elements"]
+            if comps["topology"] == "shunt-series":
+                return 1j * x(e2) + 1 / (1 / (1j * x(e1)) + 1 / z_load)
+            return 1 / (1 / (1j * x(e2)) + 1 / (z_load + 1j * x(e1)))
+        bl = 2 * math.pi * f_hz / C * comps["length_m"] / comps["velocity_factor"]
+        z1, t = comps["line_impedance_ohm"], math.tan(bl)
+        return z1 * (z_load + 1j * z1 * t) / (z1 + 1j * z_load * t)
+
+    f0 = 145.0
+    freqs = np.linspace(144.0, 146.0, 41)
+    # Tek frekansta her gerçeklenebilir devre tam uyum verir
+    for z in (25.0, 73.0, 30 - 20j, 120 + 40j, 12 + 5j):
+        res = synthesize(z, [f0], element_diameter_m=0.004)
+        for name, net in res["networks"].items():
+            assert net is None or net["swr_max"] < 1.001, (z, name, net["swr_max"])
+        assert res["networks"]["hairpin"] is None or z.real < 50
+    # Bant boyunca: seçilen değerler skaler zincir hesabıyla aynı SWR'yi verir ve bant
+    # ayarı merkez çözümünden (points=1) daha kötü olamaz
+    z_band = (30 - 20j) + 0.8j * (freqs - f0) / (freqs[-1] - freqs[0]) * 40
+    res = synthesize(z_band, freqs, f0, element_diameter_m=0.004)
+    center_only = synthesize(z_band, freqs, f0, element_diameter_m=0.004, points=1)
+    for name in ("l_network", "quarter_wave"):
+        net = res["networks"][name]
+        z_in = np.array([cascade(zl, net["components"], name, f * 1e6, f0 * 1e6, 50.0)
+                         for zl, f in zip(z_band, freqs)])
+        assert np.allclose(_swr(z_in, 50.0), net["swr"], rtol=1e-9), name
+    for name, net in res["networks"].items():
+        assert net["swr_max"] <= center_only["networks"][name]["swr_max"] + 1e-12, name
+
+    # Toplu sentez parti boyundan bağımsızdır ve tek tek sentezle aynıdır
+    loads = np.random.default_rng(0).uniform(20.0, 100.0, 200) + 1j * np.random.default_rng(1).uniform(-30, 30, 200)
+    t0 = time.perf_counter()
+    batch = match_batch(loads, freqs, element_diameter_m=0.004)
+    dt = time.perf_counter() - t0
+    small = match_batch(loads[:20], freqs, element_diameter_m=0.004, max_chunk_points=5_000)
+    for name in NETWORKS:
+        assert np.array_equal(small[name]["swr_max"], batch[name]["swr_max"][:20]), name
+        single = synthesize(loads[3], freqs, element_diameter_m=0.004)["networks"][name]
+        assert (single is None) == (not np.isfinite(batch[name]["swr_max"][3]))
+        assert single is None or single["swr_max"] == batch[name]["swr_max"][3]
+    kinds, counts = np.unique(batch["best"].astype(str), return_counts=True)
+    print(f"{loads.size} yük × {freqs.size} frekans: {dt * 1000:.0f} ms ({dt / loads.size * 1000:.2f} ms/yük), "
+          f"en iyi: {dict(zip(kinds, counts.tolist()))}")
+
+    # Tasarımlar (MoM bant taraması + sentez)
+    for tasarim, band in ((yagi_uda_hesapla(145.0, 8), (144.0, 146.0)),
+                          (yagi_uda_hesapla(435.0, 6, cap_m=0.003), (430.0, 440.0)),
+                          (monopol_hesapla(145.0, 0.004), (144.0, 146.0))):
+        t0 = time.perf_counter()
+        res = match_design(tasarim, *band)
+        dt = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        diameter = None if tasarim["tip"] == "Monopol" else tasarim["cap_m"]
+        assert synthesize(res["impedance"], res["freqs_mhz"], res["f0_mhz"],
+                          element_diameter_m=diameter)["best"] == res["best"]
+        dt_syn = time.perf_counter() - t0
+        z = res["load"]
+        print(f"{tasarim['tip']} {tasarim['frekans']} MHz, Z = {z.real:.1f}{z.imag:+.1f}j Ω, "
+              f"uyumsuz SWR ≤ {res['unmatched_swr'].max():.2f} | {dt * 1000:.0f} ms "
+              f"({res['exact_solves']} MoM), sentez {dt_syn * 1000:.1f} ms")
+        for name, net in res["networks"].items():
+            if net is None:
+                print(f"  {name:12s} gerçeklenemez")
+                continue
+            print(f"  {name:12s} SWR ≤ {net['swr_max']:.3f} (f0 {net['swr_center']:.3f}) | "
+                  f"{component_text(name, net['components'])}")
+        print("  en iyi:", res["best"])
+
+    for kwargs in ({"networks": ("pi",)}, {"networks": ("gamma",)}):
+        try:
+            synthesize(50.0, freqs, **kwargs)
+            raise AssertionError("geçersiz devre kabul edildi")
+        except ValueError as e:
+            print("beklenen hata:", e)
@@ -3,9 +3,24 @@
 Basit Yagi Optimizasyon Modülü
 Bu modül, temel Yagi-Uda tasarımı için grid search tabanlı optimizasyon yapar.
 Çap (radius/diameter) parametresini kullanarak empedans ve SWR tahminini günceller.
+Optimizasyon fonksiyonları isteğe bağlı bir tracer (izleme.Tracer) alır; verilmezse
+izleme kapalıdır ve ek maliyet yoktur. optimize_yagi ayrıca en iyi k adayı tutan bir
+sonuc_deposu.TopKStore doldurabilir ve uzun taramaları diske kaydedip kaldığı yerden
+sürdürebilir (calisma_kaydi.RunStore).
+Grid skorlama çekirdeği değiştirilebilir: saf Python (referans), NumPy ve numba kuruluysa
+JIT derlenmiş çekirdek (bkz. SCORE_BACKENDS, score_backend).
 """
 import numpy as np
 import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from calisma_kaydi import RunStore
+from izleme import NULL, Tracer
+from onbellek import source_version
+from sonuc_deposu import TopKStore
 
 # Işık hızı (m/s)
 C = 299792458.0
@@ -57,8 +72,1054 @@ def estimate_swr(z, target_z=50):
     else:
         return abs(z) / target_z
 
+# --- NumPy (broadcast) sürümleri ---
+# Skaler fonksiyonlarla aynı işlem sırasını izlerler; böylece grid üzerindeki
+# skorlar skaler yolla bit düzeyinde aynı çıkar. Girdiler birbirine broadcast
+# edilebilen diziler olabilir (ör. (R,1,1,1), (1,A,1,1) ...).
+
+def estimate_gain_np(num_elements, spacing_factor):
+    spacing_factor = np.asarray(spacing_factor, dtype=float)
+    base_gain = 2.15
+    gain_increase = 0.8 * (num_elements - 1)
+    spacing_penalty = 10 * (spacing_factor - 0.18)**2
+    gain = base_gain + gain_increase - spacing_penalty
+    return np.maximum(3.0, gain)
+
+def estimate_impedance_np(ref_len, act_len, dir_len, spacing, wavelength, radius_m):
+    # log_factor skalerdir (dalga boyu ve yarıçap grid boyunca sabit)
+    ratio_lambda_radius = wavelength / radius_m
+    log_factor = math.log(ratio_lambda_radius) if ratio_lambda_radius > 0 else 1.0
+    z_base = 50 + 10 * (8.5 - log_factor) / 8.5
+
+    act_ratio = np.asarray(act_len, dtype=float) / wavelength
+    spacing_ratio = np.asarray(spacing, dtype=float) / wavelength
+    z = z_base + 20 * (act_ratio - 0.47) - 10 * (spacing_ratio - 0.18)
+
+    return np.maximum(20.0, np.minimum(100.0, np.abs(z)))
+
+def estimate_swr_np(z, target_z=50):
+    z_abs = np.abs(z)
+    return np.where(z_abs < target_z, target_z / z_abs, z_abs / target_z)
+
+def _score_np(gain, swr):
+    # optimize_yagi içindeki SWR ceza puanının dizi karşılığı
+    swr_penalty = 10 * np.maximum(0, swr - 1.5) + (swr - 1.0) * 0.5
+    return gain - swr_penalty
+
+# Arama faktörleri (step ile belirlenen hassasiyet, sabit merkezler etrafında ±2*step)
+def _search_factors(step):
+    ref_factors = np.arange(0.50 * 1.03 - 2*step, 0.50 * 1.03 + 2*step + step, step)
+    act_factors = np.arange(0.50 - 2*step, 0.50 + 2*step + step, step)
+    dir_factors = np.arange(0.46 - 2*step, 0.46 + 2*step + step, step)
+    spacing_factors = np.arange(0.18 - 2*step, 0.18 + 2*step + step, step)
+    return ref_factors, act_factors, dir_factors, spacing_factors
+
+def _best_dict(ref_len, act_len, dir_len, spacing, gain, imp, swr, score, wavelength):
+    return {
+        "reflector": float(ref_len),
+        "active": float(act_len),
+        "director": float(dir_len),
+        "spacing": float(spacing),
+        "gain": float(gain),
+        "impedance": float(imp),
+        "swr": float(swr),
+        "score": float(score),
+        "wavelength": wavelength
+    }
+
+def _metrics_grid(ref_factors, act_factors, dir_factors, spacing_factors,
+                  element_count, wavelength, radius_m, tracer=NULL):
+    # Dış çarpım üzerindeki kazanç (1,1,1,S) ve empedans (R,A,D,S) - birbirine broadcast edilir
+    with tracer.phase("grid"):
+        ref_len = (np.asarray(ref_factors) * wavelength)[:, None, None, None]
+        act_len = (np.asarray(act_factors) * wavelength)[None, :, None, None]
+        dir_len = (np.asarray(dir_factors) * wavelength)[None, None, :, None]
+        spacing = (np.asarray(spacing_factors) * wavelength)[None, None, None, :]
+    with tracer.phase("gain"):
+        gain = estimate_gain_np(element_count, spacing_factors)[None, None, None, :]
+    with tracer.phase("impedance"):
+        imp = estimate_impedance_np(ref_len, act_len, dir_len, spacing, wavelength, radius_m)
+    return gain, imp
+
+def _score_grid(ref_factors, act_factors, dir_factors, spacing_factors,
+                element_count, wavelength, radius_m, tracer=NULL, backend=None):
+    # Dört faktör ekseninin dış çarpımı üzerindeki skorlar, (R, A, D, S) biçiminde
+    kernel = SCORE_BACKENDS[score_backend(backend)]
+    return kernel(ref_factors, act_factors, dir_factors, spacing_factors,
+                  element_count, wavelength, radius_m, tracer)
+
+# --- Skor çekirdekleri ---
+# Hepsi aynı imzayı taşır ve (R, A, D, S) biçiminde (salt okunur broadcast görünümü
+# olabilen) skor dizisi döndürür. Aynı grid üzerinde bit düzeyinde aynı skorları
+# üretmeleri gerekir (check_score_backends); böylece çekirdek seçimi yalnızca hızı
+# etkiler, sonucu değil.
+
+def _score_grid_python(ref_factors, act_factors, dir_factors, spacing_factors,
+                       element_count, wavelength, radius_m, tracer=NULL):
+    # Referans çekirdek: skaler tahmincilerle nokta nokta (yavaş; yalnızca istenirse)
+    score = np.empty((len(ref_factors), len(act_factors), len(dir_factors), len(spacing_factors)))
+    with tracer.phase("score"):
+        for i, rf in enumerate(ref_factors):
+            ref_len = rf * wavelength
+            for j, af in enumerate(act_factors):
+                act_len = af * wavelength
+                for k, df in enumerate(dir_factors):
+                    dir_len = df * wavelength
+                    for l, sf in enumerate(spacing_factors):
+                        imp = estimate_impedance(ref_len, act_len, dir_len, sf * wavelength, wavelength, radius_m)
+                        swr = estimate_swr(imp)
+                        swr_penalty = 10 * max(0, swr - 1.5) + (swr - 1.0) * 0.5
+                        score[i, j, k, l] = estimate_gain(element_count, sf) - swr_penalty
+    return score
+
+def _score_grid_numpy(ref_factors, act_factors, dir_factors, spacing_factors,
+                      element_count, wavelength, radius_m, tracer=NULL):
+    gain, imp = _metrics_grid(ref_factors, act_factors, dir_factors, spacing_factors,
+                              element_count, wavelength, radius_m, tracer)
+    with tracer.phase("score"):
+        swr = estimate_swr_np(imp)
+        score = _score_np(gain, swr)
+    shape = (len(ref_factors), len(act_factors), len(dir_factors), len(spacing_factors))
+    return np.broadcast_to(score, shape)
+
+_NUMBA_KERNEL = None
+
+def _numba_kernel():
+    # numba yalnızca bu çekirdek ilk kez istendiğinde içe aktarılır ve derlenir
+    global _NUMBA_KERNEL
+    if _NUMBA_KERNEL is None:
+        import numba
+
+        @numba.njit(cache=True)
+        def kernel(act_factors, spacing_factors, element_count, wavelength, z_base, out):
+            # estimate_*_np ve _score_np ile aynı işlem sırası (fastmath kapalı)
+            gain_base = 2.15 + 0.8 * (element_count - 1)
+            for j in range(act_factors.size):
+                act_ratio = act_factors[j] * wavelength / wavelength
+                for l in range(spacing_factors.size):
+                    sf = spacing_factors[l]
+                    gain = max(3.0, gain_base - 10 * (sf - 0.18) ** 2)
+                    spacing_ratio = sf * wavelength / wavelength
+                    z = abs(z_base + 20 * (act_ratio - 0.47) - 10 * (spacing_ratio - 0.18))
+                    z = max(20.0, min(100.0, z))
+                    swr = 50 / z if z < 50 else z / 50
+                    out[j, l] = gain - (10 * max(0.0, swr - 1.5) + (swr - 1.0) * 0.5)
+        _NUMBA_KERNEL = kernel
+    return _NUMBA_KERNEL
+
+def _score_grid_numba(ref_factors, act_factors, dir_factors, spacing_factors,
+                      element_count, wavelength, radius_m, tracer=NULL):
+    # Skor yalnızca aktif eleman ve aralığa bağlıdır (_score_dependencies ile aynı yapı);
+    # (A, S) düzlemi derlenmiş döngüyle hesaplanıp tüm grid'e broadcast edilir
+    kernel = _numba_kernel()
+    ratio_lambda_radius = wavelength / radius_m
+    log_factor = math.log(ratio_lambda_radius) if ratio_lambda_radius > 0 else 1.0
+    z_base = 50 + 10 * (8.5 - log_factor) / 8.5
+    act = np.ascontiguousarray(act_factors, dtype=float)
+    spacing = np.ascontiguousarray(spacing_factors, dtype=float)
+    plane = np.empty((act.size, spacing.size))
+    with tracer.phase("score"):
+        kernel(act, spacing, int(element_count), float(wavelength), z_base, plane)
+    shape = (len(ref_factors), len(act_factors), len(dir_factors), len(spacing_factors))
+    return np.broadcast_to(plane[None, :, None, :], shape)
+
+# Ad -> çekirdek; otomatik seçim bu sıradaki ilk kullanılabilir çekirdektir (en hızlısı önce)
+SCORE_BACKENDS = {
+    "numba": _score_grid_numba,
+    "numpy": _score_grid_numpy,
+    "python": _score_grid_python,
+}
+AUTO_BACKENDS = ("numba", "numpy")
+# Ortam değişkeni ile kalıcı seçim (ör. YAGI_SCORE_BACKEND=python); set_score_backend önceliklidir
+BACKEND_ENV = "YAGI_SCORE_BACKEND"
+_BACKEND_OVERRIDE = None
+_AVAILABLE = {}
+
+def backend_available(name):
+    """Çekirdek bu ortamda çalışabilir mi (numba kurulu mu)?"""
+    if name not in SCORE_BACKENDS:
+        raise ValueError(f"Bilinmeyen skor çekirdeği: {name}")
+    if name not in _AVAILABLE:
+        if name == "numba":
+            try:
+                _numba_kernel()
+                _AVAILABLE[name] = True
+            except ImportError:
+                _AVAILABLE[name] = False
+        else:
+            _AVAILABLE[name] = True
+    return _AVAILABLE[name]
+
+def available_backends():
+    return [name for name in SCORE_BACKENDS if backend_available(name)]
+
+def set_score_backend(name=None):
+    """Süreç genelinde çekirdeği sabitler; None otomatik seçime döner."""
+    global _BACKEND_OVERRIDE
+    if name is not None and not backend_available(name):
+        raise ValueError(f"Skor çekirdeği kullanılamıyor: {name}")
+    _BACKEND_OVERRIDE = name
+
+def score_backend(name=None):
+    """
+    Kullanılacak çekirdeğin adı: açıkça verilen ad, set_score_backend ile sabitlenen,
+    YAGI_SCORE_BACKEND ortam değişkeni veya AUTO_BACKENDS içindeki ilk kullanılabilir çekirdek.
+    """
+    name = name or _BACKEND_OVERRIDE or os.environ.get(BACKEND_ENV) or None
+    if name is None:
+        return next(n for n in AUTO_BACKENDS if backend_available(n))
+    if not backend_available(name):
+        raise ValueError(f"Skor çekirdeği kullanılamıyor: {name}")
+    return name
+
+def check_score_backends(backends=None, grids=None):
+    """
+    Uygunluk testi: her çekirdek aynı gridlerde referans (python) çekirdekle bit düzeyinde
+    aynı skorları vermeli. Sapma varsa AssertionError; test edilen çekirdek adlarını döndürür.
+    """
+    backends = available_backends() if backends is None else backends
+    if grids is None:
+        grids = []
+        for freq, n, cap, step in ((145.0, 6, 0.004, 0.01), (14.175, 3, 0.02, 0.02),
+                                   (435.0, 12, 0.003, 0.015), (1270.0, 2, 0.1, 0.03)):
+            axes = [_range_axis(lo, hi, step) for lo, hi in DEFAULT_RANGES.values()]
+            grids.append((*axes, n, C / (freq * 1e6), cap / 2))
+    for grid in grids:
+        ref = _score_grid_python(*grid)
+        for name in backends:
+            score = SCORE_BACKENDS[name](*grid)
+            assert score.shape == ref.shape and np.array_equal(score, ref), \
+                f"{name} çekirdeği referanstan sapıyor (en büyük fark {np.max(np.abs(score - ref)):.3e})"
+    return list(backends)
+
+# Bağımlılık yapısı yalnızca koda bağlıdır; anahtar tahminci fonksiyonlarının kendisidir
+_DEPENDENCY_CACHE = {}
+
+def _score_dependencies(axes, element_count, wavelength, radius_m):
+    """
+    Skor terimlerinin bağlı olduğu eksenler: (kazanç, skor) için eksen başına bool demetleri.
+    Tahminciler iki değerli deneme eksenleriyle broadcast edilerek çağrılır; bir eksene
+    bağlı olmayan terimin çıktısında o boyut 1 kalır. Tahmincilere yeni bir bağımlılık
+    eklendiğinde (ör. empedansın direktör uzunluğunu kullanması) kendiliğinden algılanır.
+    """
+    key = (_metrics_grid, estimate_gain_np, estimate_impedance_np, estimate_swr_np, _score_np)
+    deps = _DEPENDENCY_CACHE.get(key)
+    if deps is None:
+        probe = [np.array([ax[0], ax[0] + 0.01]) for ax in axes]
+        gain, imp = _metrics_grid(*probe, element_count, wavelength, radius_m)
+        score = _score_np(gain, estimate_swr_np(imp))
+        dims = lambda a: tuple(d > 1 for d in np.shape(a)[-4:]) if np.ndim(a) == 4 else (False,) * 4
+        deps = _DEPENDENCY_CACHE[key] = (dims(gain), dims(score))
+    return deps
+
+def _collapse_axes(axes, depends):
+    # Skorun bağlı olmadığı eksenler ilk değerine indirgenir; bu noktalar döngü sırasında
+    # ilk gelenlerdir, dolayısıyla eşitlikte seçilen nokta tam gridle aynıdır
+    return [ax if dep else ax[:1] for ax, dep in zip(axes, depends)]
+
+# Bu kadar noktadan küçük gridler tek vektörel geçişte taranır (sınır hesabı daha pahalı)
+BRANCH_MIN_POINTS = 4096
+
+def _branch_and_bound(axes, element_count, wavelength, radius_m, gain_dims,
+                      max_chunk_points=1_000_000, tracer=NULL, store=None, backend=None):
+    """
+    axes gridinde en iyi nokta -> (skor, düz indeks); eşitlikte küçük indeks.
+    SWR ≥ 1 iken ceza ≥ 0 olduğundan skor ≤ kazanç. Kazancın bağlı olduğu en uzun eksen
+    dallanır: o eksendeki her değer için sınır, diğer eksenlerdeki en büyük kazançtır.
+    Değerler azalan sınır sırasıyla puanlanır (önce tek dilim, sonra en fazla
+    max_chunk_points noktalık bloklar); sınırı mevcut en iyinin altındaki dilimler hiç
+    puanlanmaz ve "pruned" sayacına eklenir. store verilirse sınır, en iyi skor ile deponun
+    eşiğinden küçüğüdür (depoya girebilecek dilimler de puanlanır).
+    """
+    shape = tuple(ax.size for ax in axes)
+    total = int(np.prod(shape))
+    branch = [i for i in range(4) if gain_dims[i] and shape[i] > 1]
+    if not branch or total < BRANCH_MIN_POINTS:
+        keep = store.k if store is not None else 0
+        task = (*axes, element_count, wavelength, radius_m, 0, total, max_chunk_points, tracer.enabled, keep,
+                backend)
+        return _reduce_shards([_best_in_range(task)], tracer, store)
+    b = max(branch, key=lambda i: shape[i])
+    with tracer.phase("bound"):
+        gain, _ = _metrics_grid(*[ax if gain_dims[i] else ax[:1] for i, ax in enumerate(axes)],
+                                element_count, wavelength, radius_m)
+        gain = np.broadcast_to(gain, [shape[i] if gain_dims[i] else 1 for i in range(4)])
+        bound = np.moveaxis(gain, b, 0).reshape(shape[b], -1).max(axis=1)
+        order = np.lexsort((np.arange(shape[b]), -bound))
+    slice_points = total // shape[b]
+    per_block = max(1, int(max_chunk_points) // slice_points)
+
+    best_score, best_flat, evaluated, pos = None, None, 0, 0
+    while pos < shape[b]:
+        block = order[pos:pos + (1 if best_score is None else per_block)]
+        pos += block.size
+        if best_score is not None:
+            limit = best_score if store is None else min(best_score, store.threshold)
+            block = block[bound[block] >= limit]
+            if block.size == 0:
+                break
+        block = np.sort(block) # alt grid sırası küresel düz indeks sırasıyla aynı yönde
+        sub = list(axes)
+        sub[b] = axes[b][block]
+        score = _score_grid(*sub, element_count, wavelength, radius_m, tracer, backend)
+        evaluated += score.size
+        if store is not None:
+            with tracer.phase("store"):
+                _push_candidates(store, np.ascontiguousarray(score).reshape(-1), 0, sub,
+                                 lambda idx: np.ravel_multi_index(idx[:b] + (block[idx[b]],) + idx[b + 1:], shape),
+                                 element_count, wavelength, radius_m)
+        with tracer.phase("reduce"):
+            rows = np.moveaxis(score, b, 0).reshape(block.size, -1)
+            first = np.argmax(rows, axis=1)            # dilim içinde ilk maksimum
+            values = rows[np.arange(block.size), first]
+            rest = np.unravel_index(first, tuple(n for i, n in enumerate(shape) if i != b))
+            idx = list(rest)
+            idx.insert(b, block)
+            flats = np.ravel_multi_index(idx, shape)
+            top = values.max()
+            flat = int(flats[values == top].min())
+        if best_score is None or top > best_score or (top == best_score and flat < best_flat):
+            best_score, best_flat = top, flat
+            tracer.count("improvements")
+    tracer.count("points", evaluated)
+    tracer.count("pruned", total - evaluated)
+    return best_score, best_flat
+
+def _push_candidates(store, seg, offset, sub_axes, to_global, element_count, wavelength, radius_m):
+    """
+    Bir parçanın en iyi adaylarını depoya ekler. seg, sub_axes dış çarpımının (C sırası)
+    offset'ten başlayan düz skorlarıdır; yerel sıra küresel düz indeksle aynı yönde
+    artmalıdır. Kayıt alanları yalnızca seçilen (en fazla k) aday için hesaplanır.
+    """
+    local = _top_k_indices(seg, store.k)
+    local = local[seg[local] >= store.threshold]
+    if local.size == 0:
+        return
+    idx = np.unravel_index(local + offset, tuple(len(ax) for ax in sub_axes))
+    rf, af, df, sf = (np.asarray(ax)[i] for ax, i in zip(sub_axes, idx))
+    ref_len, act_len, dir_len, spacing = rf * wavelength, af * wavelength, df * wavelength, sf * wavelength
+    imp = estimate_impedance_np(ref_len, act_len, dir_len, spacing, wavelength, radius_m)
+    store.push(index=to_global(idx), reflector=ref_len, active=act_len, director=dir_len, spacing=spacing,
+               gain=estimate_gain_np(element_count, sf), impedance=imp, swr=estimate_swr_np(imp),
+               score=seg[local])
+
+def _result_from_factors(rf, af, df, sf, element_count, wavelength, radius_m, score):
+    # Seçilen grid noktası için sonuç sözlüğü (skaler tahmincilerle)
+    ref_len = rf * wavelength
+    act_len = af * wavelength
+    dir_len = df * wavelength
+    spacing = sf * wavelength
+    imp = estimate_impedance(ref_len, act_len, dir_len, spacing, wavelength, radius_m)
+    swr = estimate_swr(imp)
+    gain = estimate_gain(element_count, sf)
+    return _best_dict(ref_len, act_len, dir_len, spacing, gain, imp, swr, score, wavelength)
+
+def _best_in_range(task):
+    """
+    Düz indeks aralığı [start, stop) içindeki en iyi nokta -> (skor, düz indeks, iz, kayıtlar).
+    Seri yol ve süreç havuzu işçileri aynı fonksiyonu kullanır; eşit skorda
+    küçük indeks (döngü sırasındaki ilk nokta) kazanır. traced ise iz, bu aralığın
+    Tracer.to_dict() çıktısıdır (işçiden ana sürece taşınır), değilse None. keep > 0 ise
+    kayıtlar aralığın en iyi keep adayıdır (TopKStore yapılı dizisi), değilse None.
+    backend: skor çekirdeğinin adı (None: score_backend() seçimi).
+    """
+    (ref_factors, act_factors, dir_factors, spacing_factors,
+     element_count, wavelength, radius_m, start, stop, max_chunk_points, traced, keep, backend) = task
+    tracer = Tracer() if traced else NULL
+    store = TopKStore(keep) if keep else None
+    shape = (len(ref_factors), len(act_factors), len(dir_factors), len(spacing_factors))
+    per_ref = len(act_factors) * len(dir_factors) * len(spacing_factors)
+    # Bellek sınırı: bir parçada en fazla max_chunk_points nokta (en az bir reflektör satırı)
+    rows = max(1, int(max_chunk_points) // per_ref)
+
+    best_score = None
+    best_flat = None
+    pos = start
+    while pos < stop:
+        row0 = pos // per_ref
+        row1 = min(row0 + rows, -(-stop // per_ref))
+        score = _score_grid(ref_factors[row0:row1], act_factors, dir_factors,
+                            spacing_factors, element_count, wavelength, radius_m, tracer, backend).reshape(-1)
+        lo = pos - row0 * per_ref
+        hi = min(stop, row1 * per_ref) - row0 * per_ref
+        seg = score[lo:hi]
+        if store is not None:
+            with tracer.phase("store"):
+                _push_candidates(store, seg, lo, (ref_factors[row0:row1], act_factors, dir_factors, spacing_factors),
+                                 lambda idx: np.ravel_multi_index((idx[0] + row0,) + idx[1:], shape),
+                                 element_count, wavelength, radius_m)
+
+        with tracer.phase("reduce"):
+            flat = int(np.argmax(seg)) # ilk maksimum = skaler döngüdeki ilk iyileşme
+        tracer.count("points", seg.size)
+        tracer.count("chunks")
+        if best_score is None or seg[flat] > best_score:
+            best_score = seg[flat]
+            best_flat = row0 * per_ref + lo + flat
+            tracer.count("improvements")
+        pos = row0 * per_ref + hi
+    return best_score, best_flat, tracer.to_dict(), None if store is None else store.array
+
+def _timed_best_in_range(task):
+    # _best_in_range + parçanın süresi (işçi süreçte ölçülür)
+    t0 = time.perf_counter()
+    result = _best_in_range(task)
+    return result, time.perf_counter() - t0
+
+def _run_checkpointed(directory, params, total, task, checkpoint_points, workers, executor,
+                      max_seconds, store, tracer):
+    """
+    Grid en fazla checkpoint_points noktalık parçalarla taranır; her parça bittiğinde
+    sonucu (ve store varsa en iyi adayları) directory'deki RunStore'a yazılır. Önceki
+    çağrılarda biten parçalar atlanır ("resumed" sayacı, nokta). Bu çağrı max_seconds'ı
+    aşarsa bir parça sınırında durur ve None döner; aksi halde (skor, düz indeks).
+    """
+    n_shards = max(1, -(-total // int(checkpoint_points)))
+    bounds = np.linspace(0, total, n_shards + 1).astype(np.int64)
+    run = RunStore.open_or_create(directory, params, bounds, store.k if store is not None else 0)
+    pending = run.pending()
+    sizes = run.shards["stop"] - run.shards["start"]
+    tracer.count("resumed", int(total - sizes[pending].sum()))
+    tracer.count("shards", pending.size)
+    t0 = time.perf_counter()
+
+    def finish(i, timed):
+        (score, flat, trace, records), seconds = timed
+        tracer.merge(trace)
+        run.record(i, score, flat, seconds, records)
+        return max_seconds is not None and time.perf_counter() - t0 >= max_seconds
+
+    def shard_task(i):
+        return task(int(run.shards["start"][i]), int(run.shards["stop"][i]))
+
+    if executor is None and (workers is None or workers <= 1):
+        for i in pending:
+            if finish(i, _timed_best_in_range(shard_task(i))):
+                break
+    else:
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {pool.submit(_timed_best_in_range, shard_task(i)): i for i in pending}
+            for fut in as_completed(futures):
+                if finish(futures[fut], fut.result()):
+                    for other in futures:
+                        other.cancel()
+                    break
+        finally:
+            if executor is None:
+                pool.shutdown(cancel_futures=True)
+
+    if not run.complete:
+        return None
+    if run.meta["status"] != "done":
+        run.finish()
+    if store is not None:
+        for i in range(run.shards.size):
+            store.push_array(run.shard_records(i))
+    return run.best()
+
+def _reduce_shards(results, tracer=NULL, store=None):
+    # Parça sonuçlarını birleştir: en yüksek skor, eşitlikte en küçük düz indeks
+    best = None
+    for score, flat, trace, records in results:
+        tracer.merge(trace)
+        if store is not None and records is not None:
+            store.push_array(records)
+        if score is None:
+            continue
+        if best is None or score > best[0] or (score == best[0] and flat < best[1]):
+            best = (score, flat)
+    return best
+
 # Optimizasyon fonksiyonu (element_cap_m parametresi eklendi)
-def optimize_yagi(target_freq_mhz, element_count, step, element_cap_m):
+def optimize_yagi(target_freq_mhz, element_count, step, element_cap_m,
+                  vectorized=True, max_chunk_points=1_000_000,
+                  workers=None, executor=None, shards_per_worker=4, prune=True,
+                  ranges=None, store=None, checkpoint=None, checkpoint_points=2_000_000,
+                  max_seconds=None, backend=None, tracer=None):
+    """
+    Reflektör x aktif x direktör x aralık gridini tarar ve en yüksek skorlu noktayı döndürür.
+    vectorized=True iken grid, en fazla max_chunk_points noktalık parçalar halinde NumPy
+    ile puanlanır; False iken eski skaler döngü kullanılır.
+    workers > 1 (veya bir executor) verilirse grid, düz indeks aralıklarına bölünüp bir
+    süreç havuzunda taranır; her işçi yalnızca kendi en iyisini döndürür.
+    Eşit skorlarda tüm yollar döngü sırasındaki ilk noktayı seçer, yani paralel sonuç
+    seri sonuçla birebir aynıdır.
+    prune=True iken skorun bağlı olmadığı eksenler (bkz. _score_dependencies) tek değere
+    indirgenir ve seri yolda kazanç üst sınırıyla dal-sınır uygulanır (_branch_and_bound);
+    sonuç budamasız taramayla birebir aynıdır.
+    ranges ({"reflector": (lo, hi), ...}, bkz. DEFAULT_RANGES) verilirse sabit merkezli
+    ±2*step grid yerine bu aralıklar step ile tam gridlenir.
+    store (sonuc_deposu.TopKStore) verilirse taranan adayların en iyi store.k tanesi ona
+    eklenir; kayıtların index alanı (budama açıksa indirgenmiş) grid düz indeksidir.
+    checkpoint bir dizin ise tarama checkpoint_points noktalık parçalarla yapılır ve her
+    parça bitince diske yazılır (bkz. _run_checkpointed, calisma_kaydi.RunStore); aynı
+    parametrelerle yeniden çağrıldığında biten parçalar atlanır. Bu yolda dal-sınır
+    uygulanmaz (eksen indirgeme uygulanır). max_seconds aşılırsa çağrı bir parça sınırında
+    durur ve None döner; tarama aynı dizinle yeniden çağrılarak tamamlanır.
+    backend skor çekirdeğini seçer ("numba", "numpy", "python"; None: score_backend());
+    işçi süreçlere adıyla iletilir. Tüm çekirdekler aynı skorları verdiğinden sonuç değişmez.
+    tracer verilirse sayaçlar (points, chunks, shards, improvements, collapsed, pruned) ve
+    aşama süreleri (grid, gain, impedance, score, bound, reduce, result) ona eklenir; işçi
+    süreçlerin izleri ana izde birleştirilir (bu durumda aşama süreleri işçilerin toplam
+    süresidir). points / (points + collapsed + pruned) budamanın kazancını gösterir.
+    """
+    tracer = tracer or NULL
+    if not vectorized:
+        return _optimize_yagi_scalar(target_freq_mhz, element_count, step, element_cap_m, tracer)
+
+    freq_hz = target_freq_mhz * 1e6
+    wavelength = C / freq_hz
+
+    num_directors = element_count - 2
+    if num_directors < 0:
+        return None
+
+    radius_m = element_cap_m / 2.0 # Çapı yarıçapa çevir
+    backend = score_backend(backend)
+    if ranges is None:
+        axes = _search_factors(step)
+    else:
+        axes = [_range_axis(min(lo, hi), max(lo, hi), step)
+                for lo, hi in (ranges[name] for name in ("reflector", "active", "director", "spacing"))]
+    if min(ax.size for ax in axes) == 0:
+        return None
+    if prune:
+        gain_dims, score_dims = _score_dependencies(axes, element_count, wavelength, radius_m)
+        full = int(np.prod([ax.size for ax in axes]))
+        axes = _collapse_axes(axes, score_dims)
+    ref_factors, act_factors, dir_factors, spacing_factors = axes
+    shape = (len(ref_factors), len(act_factors), len(dir_factors), len(spacing_factors))
+    total = int(np.prod(shape))
+    if prune:
+        tracer.count("collapsed", full - total)
+    if store is not None:
+        store.meta.update(wavelength=wavelength)
+
+    def task(start, stop):
+        return (ref_factors, act_factors, dir_factors, spacing_factors,
+                element_count, wavelength, radius_m, start, stop, max_chunk_points, tracer.enabled,
+                store.k if store is not None else 0, backend)
+
+    if checkpoint is not None:
+        params = {"target_freq_mhz": target_freq_mhz, "element_count": element_count, "step": step,
+                  "element_cap_m": element_cap_m, "ranges": ranges, "prune": prune,
+                  "checkpoint_points": checkpoint_points, "keep": store.k if store is not None else 0,
+                  "version": source_version(sys.modules[__name__])}
+        best = _run_checkpointed(checkpoint, params, total, task, checkpoint_points, workers, executor,
+                                 max_seconds, store, tracer)
+        if best is None:
+            return None
+    elif executor is None and (workers is None or workers <= 1):
+        if prune:
+            best = _branch_and_bound(axes, element_count, wavelength, radius_m, gain_dims,
+                                     max_chunk_points, tracer, store, backend)
+        else:
+            best = _reduce_shards([_best_in_range(task(0, total))], tracer, store)
+    else:
+        n_workers = workers or os.cpu_count() or 1
+        n_shards = max(1, min(total, n_workers * shards_per_worker))
+        bounds = np.linspace(0, total, n_shards + 1).astype(np.int64)
+        tasks = [task(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+        tracer.count("shards", len(tasks))
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                best = _reduce_shards(pool.map(_best_in_range, tasks), tracer, store)
+        else:
+            best = _reduce_shards(executor.map(_best_in_range, tasks), tracer, store)
+
+    best_score, best_flat = best
+    i, j, k, l = np.unravel_index(best_flat, shape)
+    with tracer.phase("result"):
+        return _result_from_factors(ref_factors[i], act_factors[j], dir_factors[k], spacing_factors[l],
+                                    element_count, wavelength, radius_m, best_score)
+
+# Varsayılan arama aralıkları (lambda çarpanı) - kaba-ince arama için
+DEFAULT_RANGES = {
+    "reflector": (0.49, 0.55),
+    "active": (0.46, 0.52),
+    "director": (0.40, 0.50),
+    "spacing": (0.10, 0.30),
+}
+
+def _top_k_indices(score, k):
+    # En yüksek k skorun düz indeksleri; eşitlikte küçük indeks önce gelir
+    flat = np.ascontiguousarray(score).ravel()
+    k = min(k, flat.size)
+    idx = np.argpartition(-flat, k - 1)[:k] if k < flat.size else np.arange(flat.size)
+    # argpartition eşit skorlar arasında rastgele seçebilir; eşik skorundaki tüm noktaları ekle
+    threshold = flat[idx].min()
+    idx = np.union1d(idx[flat[idx] > threshold], np.flatnonzero(flat == threshold))
+    order = np.lexsort((idx, -flat[idx]))
+    return idx[order][:k]
+
+def _local_axis(center, step, half_points, lo, hi):
+    axis = center + step * np.arange(-half_points, half_points + 1)
+    axis = axis[(axis >= lo - 1e-12) & (axis <= hi + 1e-12)]
+    return axis if axis.size else np.array([min(max(center, lo), hi)])
+
+def _progress(done, total, best, finished=False):
+    # İlerleme kaydı (*_iter üreteçleri tarafından üretilir)
+    return {"done": done, "total": max(total, done), "best": best, "finished": finished}
+
+def _drain(iterator):
+    # Bir *_iter üretecini sonuna kadar çalıştırıp son en iyi sonucu döndür
+    last = None
+    for last in iterator:
+        pass
+    return last["best"] if last else None
+
+def optimize_yagi_adaptive(target_freq_mhz, element_count, element_cap_m,
+                           ref_range=None, act_range=None, dir_range=None, spacing_range=None,
+                           final_step=0.001, coarse_points=9, top_k=4, refine=4, tracer=None):
+    """
+    Kaba-ince (çok çözünürlüklü) grid araması.
+    Önce her eksen kendi aralığında coarse_points noktayla taranır, en iyi top_k hücre
+    tutulur ve yalnızca onların çevresi her seviyede refine kat daha ince adımla yeniden
+    gridlenir. Son seviye final_step katlarına oturtulur. Sonuç optimize_yagi ile aynı
+    sözlüktür; ek olarak "evaluations" (puanlanan nokta sayısı) anahtarı içerir.
+    """
+    return _drain(optimize_yagi_adaptive_iter(
+        target_freq_mhz, element_count, element_cap_m, ref_range, act_range, dir_range,
+        spacing_range, final_step, coarse_points, top_k, refine, tracer))
+
+def optimize_yagi_adaptive_iter(target_freq_mhz, element_count, element_cap_m,
+                                ref_range=None, act_range=None, dir_range=None, spacing_range=None,
+                                final_step=0.001, coarse_points=9, top_k=4, refine=4, tracer=None):
+    """
+    optimize_yagi_adaptive'in artımlı sürümü. Her alt grid puanlandıktan sonra
+    {"done", "total", "best", "finished"} sözlüğü üretir; "best" o ana kadarki en iyi
+    sonuçtur, "total" üst sınır tahminidir. Üreteç bırakılarak arama iptal edilebilir.
+    tracer: points, levels, subgrids, improvements ve pruned (final_step ile düz gridde
+    olup puanlanmayan nokta) sayaçları; grid/gain/impedance/score/select/result aşamaları.
+    coarse_points < 2 veya refine < 2 ise (tek noktalı kaba grid, adımı küçülmeyen
+    seviyeler) çağrı anında ValueError yükseltilir.
+    """
+    if coarse_points < 2:
+        raise ValueError(f"coarse_points en az 2 olmalı: {coarse_points}")
+    if refine < 2:
+        raise ValueError(f"refine en az 2 olmalı: {refine}")
+    return _adaptive_iter(target_freq_mhz, element_count, element_cap_m, ref_range, act_range, dir_range,
+                          spacing_range, final_step, coarse_points, top_k, refine, tracer)
+
+def _adaptive_iter(target_freq_mhz, element_count, element_cap_m, ref_range, act_range, dir_range,
+                   spacing_range, final_step, coarse_points, top_k, refine, tracer):
+    # optimize_yagi_adaptive_iter'in üreteç gövdesi (argümanlar doğrulanmış)
+    tracer = tracer or NULL
+    freq_hz = target_freq_mhz * 1e6
+    wavelength = C / freq_hz
+
+    if element_count - 2 < 0:
+        return
+
+    radius_m = element_cap_m / 2.0
+    ranges = [ref_range or DEFAULT_RANGES["reflector"],
+              act_range or DEFAULT_RANGES["active"],
+              dir_range or DEFAULT_RANGES["director"],
+              spacing_range or DEFAULT_RANGES["spacing"]]
+    ranges = [(min(lo, hi), max(lo, hi)) for lo, hi in ranges]
+
+    # Seviye 0: kaba grid
+    axes = [np.linspace(lo, hi, coarse_points) if hi > lo else np.array([lo]) for lo, hi in ranges]
+    steps = [(hi - lo) / (coarse_points - 1) if hi > lo else 0.0 for lo, hi in ranges]
+
+    def next_steps(steps):
+        new_steps = [s / refine for s in steps]
+        final = max(new_steps) <= final_step
+        if final:
+            new_steps = [final_step if s > 0 else 0.0 for s in steps]
+        return new_steps, final
+
+    # İlerleme için toplam nokta sayısının üst sınırı
+    total = int(np.prod([ax.size for ax in axes]))
+    sim = steps
+    while max(sim) > final_step:
+        new, _ = next_steps(sim)
+        total += top_k * int(np.prod([2 * math.ceil(so / sn) + 1 if sn > 0 else 1
+                                      for so, sn in zip(sim, new)]))
+        sim = new
+
+    def result(best, evaluations):
+        sc, (rf, af, df, sf) = best
+        with tracer.phase("result"):
+            res = _result_from_factors(rf, af, df, sf, element_count, wavelength, radius_m, sc)
+        res["evaluations"] = evaluations
+        return res
+
+    evaluations = 0
+    best = None # (score, faktörler)
+    candidates = [axes]
+    while True:
+        level_points = []
+        tracer.count("levels")
+        for cand_axes in candidates:
+            score = _score_grid(*cand_axes, element_count, wavelength, radius_m, tracer)
+            evaluations += score.size
+            tracer.count("points", score.size)
+            tracer.count("subgrids")
+            cand_points = []
+            with tracer.phase("select"):
+                for flat in _top_k_indices(score, top_k):
+                    idx = np.unravel_index(flat, score.shape)
+                    factors = tuple(float(ax[i]) for ax, i in zip(cand_axes, idx))
+                    cand_points.append((float(score.flat[flat]), factors))
+            level_points.extend(cand_points)
+
+            # En iyi nokta (eşitlikte önce bulunan)
+            if cand_points and (best is None or cand_points[0][0] > best[0]):
+                best = cand_points[0]
+                tracer.count("improvements")
+            yield _progress(evaluations, total, result(best, evaluations))
+
+        level_points.sort(key=lambda p: -p[0])
+
+        if max(steps) <= final_step:
+            break
+
+        # Sonraki seviye: adımları incelt, son seviyede final_step'e oturt
+        new_steps, final = next_steps(steps)
+
+        seen = set()
+        candidates = []
+        for sc, factors in level_points:
+            if len(candidates) >= top_k:
+                break
+            cand_axes = []
+            for c, s_old, s_new, (lo, hi) in zip(factors, steps, new_steps, ranges):
+                if s_new == 0.0:
+                    cand_axes.append(np.array([c]))
+                    continue
+                if final:
+                    c = round(c / final_step) * final_step
+                half = int(math.ceil(s_old / s_new))
+                cand_axes.append(_local_axis(c, s_new, half, lo, hi))
+            key = tuple((round(ax[0], 12), ax.size) for ax in cand_axes)
+            if key in seen:
+                continue
+            seen.add(key)
+            candidates.append(cand_axes)
+        steps = new_steps
+
+    if tracer:
+        flat_points = int(np.prod([int(round((hi - lo) / final_step)) + 1 for lo, hi in ranges]))
+        tracer.count("pruned", max(0, flat_points - evaluations))
+    yield _progress(evaluations, evaluations, result(best, evaluations), finished=True)
+
+# --- Çok amaçlı (Pareto) arama: kazanç ↑, SWR ↓, boom uzunluğu ↓ ---
+PARETO_OBJECTIVES = ("gain", "swr", "boom")
+
+def non_dominated(costs):
+    """
+    Küçültme yönlü amaç matrisi costs (N, M) içinde baskın olunmayan satırların indeksleri.
+    Aynı amaç vektörüne sahip satırlardan yalnızca ilki (en küçük indeks) tutulur; dönüş
+    satırların sözlük sırasındadır. Sıralı dizide baştaki aday her zaman cephededir ve
+    baskın olduğu tüm satırlar tek bir vektörel karşılaştırmayla atılır: N × cephe boyu
+    işlem, O(N·M) bellek.
+    """
+    costs = np.asarray(costs, dtype=float)
+    n = costs.shape[0]
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    order = np.lexsort((np.arange(n),) + tuple(costs.T[::-1]))
+    c = costs[order]
+    unique = np.ones(n, dtype=bool)
+    unique[1:] = np.any(c[1:] != c[:-1], axis=1)
+    idx, c = order[unique], c[unique]
+    front = []
+    while idx.size:
+        front.append(idx[0])
+        rest = np.any(c[1:] < c[0], axis=1)
+        idx, c = idx[1:][rest], c[1:][rest]
+    return np.asarray(front, dtype=np.intp)
+
+def _range_axis(lo, hi, step):
+    # [lo, hi] aralığında step katları (uçlar dahil)
+    return lo + step * np.arange(int(round((hi - lo) / step)) + 1)
+
+def optimize_yagi_pareto(target_freq_mhz, element_count, element_cap_m, step=0.005,
+                         ref_range=None, act_range=None, dir_range=None, spacing_range=None,
+                         max_chunk_points=1_000_000, prune=True, tracer=None):
+    """
+    Kazanç, SWR ve boom uzunluğu için baskın olunmayan noktalar kümesi (Pareto cephesi).
+    Dönüş: en yüksek skorlu cephe noktası (optimize_yagi ile aynı anahtarlar + "boom"),
+    ek olarak "front" (tüm cephe noktaları, kazanca göre azalan) ve "evaluations".
+    """
+    return _drain(optimize_yagi_pareto_iter(
+        target_freq_mhz, element_count, element_cap_m, step, ref_range, act_range, dir_range,
+        spacing_range, max_chunk_points, prune, tracer))
+
+def optimize_yagi_pareto_iter(target_freq_mhz, element_count, element_cap_m, step=0.005,
+                              ref_range=None, act_range=None, dir_range=None, spacing_range=None,
+                              max_chunk_points=1_000_000, prune=True, tracer=None):
+    """
+    optimize_yagi_pareto'nun artımlı sürümü; her parçadan sonra _progress kaydı üretir
+    ("best" o ana kadarki cephenin en yüksek skorlu noktasıdır, "front" yalnızca son kayıtta).
+    Aralıklar (varsayılan DEFAULT_RANGES) step ile tam gridlenir ve reflektör satırları
+    halinde en fazla max_chunk_points noktalık parçalarla taranır. Her parçada önce mevcut
+    cepheye baskın olunan noktalar elenir, kalanlar cepheyle birleştirilip yeniden süzülür;
+    bellek gridin değil parça ve cephe boyunun katıdır. Boom = (eleman sayısı - 1) × aralık.
+    prune=True iken amaçların bağlı olmadığı eksenler tek değere indirgenir (cephe aynıdır,
+    "evaluations" puanlanan nokta sayısıdır).
+    tracer: points, chunks, front, collapsed sayaçları; grid/gain/impedance/score/front/result
+    aşamaları.
+    """
+    tracer = tracer or NULL
+    wavelength = C / (target_freq_mhz * 1e6)
+
+    if element_count - 2 < 0:
+        return
+
+    radius_m = element_cap_m / 2.0
+    ranges = [ref_range or DEFAULT_RANGES["reflector"],
+              act_range or DEFAULT_RANGES["active"],
+              dir_range or DEFAULT_RANGES["director"],
+              spacing_range or DEFAULT_RANGES["spacing"]]
+    axes = [_range_axis(min(lo, hi), max(lo, hi), step) for lo, hi in ranges]
+    if prune:
+        full = int(np.prod([ax.size for ax in axes]))
+        _, score_dims = _score_dependencies(axes, element_count, wavelength, radius_m)
+        axes = _collapse_axes(axes, score_dims[:3] + (True,)) # boom aralığa bağlı
+    ref_factors, act_factors, dir_factors, spacing_factors = axes
+    shape = tuple(ax.size for ax in axes)
+    per_ref = shape[1] * shape[2] * shape[3]
+    total = shape[0] * per_ref
+    rows = max(1, int(max_chunk_points) // per_ref)
+    if prune:
+        tracer.count("collapsed", full - total)
+    boom = (element_count - 1) * spacing_factors * wavelength
+
+    # Cephe: küçültme yönlü amaçlar (-kazanç, swr, boom), düz indeksler ve skorlar
+    front_costs = np.empty((0, 3))
+    front_flat = np.empty(0, dtype=np.int64)
+    front_score = np.empty(0)
+
+    def member(pos):
+        i, j, k, l = np.unravel_index(int(front_flat[pos]), shape)
+        with tracer.phase("result"):
+            res = _result_from_factors(ref_factors[i], act_factors[j], dir_factors[k], spacing_factors[l],
+                                       element_count, wavelength, radius_m, front_score[pos])
+        res["boom"] = float(front_costs[pos, 2])
+        return res
+
+    def best_pos():
+        # En yüksek skor; eşitlikte küçük düz indeks
+        return int(np.lexsort((front_flat, -front_score))[0])
+
+    for row0 in range(0, shape[0], rows):
+        row1 = min(row0 + rows, shape[0])
+        gain, imp = _metrics_grid(ref_factors[row0:row1], act_factors, dir_factors, spacing_factors,
+                                  element_count, wavelength, radius_m, tracer)
+        with tracer.phase("score"):
+            swr = estimate_swr_np(imp)
+            score = _score_np(gain, swr)
+        with tracer.phase("front"):
+            chunk = (row1 - row0,) + shape[1:]
+            cols = [np.broadcast_to(-gain, chunk).reshape(-1),
+                    np.broadcast_to(swr, chunk).reshape(-1),
+                    np.broadcast_to(boom, chunk).reshape(-1)]
+            # Mevcut cepheye eşit ya da baskın olunan noktalar aday olamaz
+            alive = np.ones(cols[0].size, dtype=bool)
+            for f in front_costs:
+                alive &= (cols[0] < f[0]) | (cols[1] < f[1]) | (cols[2] < f[2])
+            cand = np.flatnonzero(alive)
+            costs = np.concatenate([front_costs, np.column_stack([c[cand] for c in cols])])
+            flat = np.concatenate([front_flat, row0 * per_ref + cand])
+            scores = np.concatenate([front_score, np.broadcast_to(score, chunk).reshape(-1)[cand]])
+            # Önceki parçaların indeksleri küçüktür; non_dominated eşitlikte ilkini tutar
+            keep = non_dominated(costs)
+            front_costs, front_flat, front_score = costs[keep], flat[keep], scores[keep]
+        done = row1 * per_ref
+        tracer.count("points", done - row0 * per_ref)
+        tracer.count("chunks")
+        if row1 < shape[0]:
+            yield _progress(done, total, member(best_pos()))
+
+    tracer.count("front", front_flat.size)
+    res = member(best_pos())
+    res["front"] = [member(p) for p in range(front_flat.size)]
+    res["evaluations"] = total
+    yield _progress(total, total, res, finished=True)
+
+# --- Eleman bazlı model ve diferansiyel evrim ---
+# Her direktörün kendi uzunluğu ve kendinden önceki elemana olan aralığı serbesttir.
+# Tüm aralıklar ve direktörler eşitken (ve taper varsayılan değerdeyken) tahminler
+# estimate_gain / estimate_impedance ile aynı modele indirgenir.
+
+def _ideal_director_factors(num_directors):
+    # yagi_uda_hesapla'daki %1.5'lik direktör kısalması (0.46 taban)
+    return 0.46 * (1.0 - 0.015 * np.arange(1, num_directors + 1))
+
+def estimate_gain_elements_np(num_elements, spacing_factors, director_factors):
+    # spacing_factors: (..., n+1) [ref-aktif, aktif-D1, D1-D2, ...]
+    # director_factors: (..., n)
+    spacing_factors = np.asarray(spacing_factors, dtype=float)
+    director_factors = np.asarray(director_factors, dtype=float)
+    base_gain = 2.15
+    gain_increase = 0.8 * (num_elements - 1)
+    spacing_penalty = 10 * np.mean((spacing_factors - 0.18)**2, axis=-1)
+    if director_factors.shape[-1]:
+        ideal = _ideal_director_factors(director_factors.shape[-1])
+        taper_penalty = 10 * np.mean((director_factors - ideal)**2, axis=-1)
+    else:
+        taper_penalty = 0.0
+    gain = base_gain + gain_increase - spacing_penalty - taper_penalty
+    return np.maximum(3.0, gain)
+
+def estimate_impedance_elements_np(act_factors, spacing_factors, wavelength, radius_m):
+    # Besleme empedansını aktif elemana komşu iki aralığın ortalaması belirler
+    spacing_factors = np.asarray(spacing_factors, dtype=float)
+    feed_spacing = spacing_factors[..., :2].mean(axis=-1)
+    return estimate_impedance_np(None, np.asarray(act_factors) * wavelength, None,
+                                 feed_spacing * wavelength, wavelength, radius_m)
+
+DEFAULT_ELEMENT_BOUNDS = {
+    "reflector": (0.49, 0.55),
+    "active": (0.46, 0.52),
+    "director": (0.38, 0.50),
+    "spacing": (0.10, 0.40),
+}
+
+def _element_bounds(num_directors, bounds):
+    # Parametre vektörü: [rf, af, s_ref, d_1..d_n, s_1..s_n]
+    b = dict(DEFAULT_ELEMENT_BOUNDS)
+    b.update(bounds or {})
+    lo = [b["reflector"][0], b["active"][0], b["spacing"][0]] \
+        + [b["director"][0]] * num_directors + [b["spacing"][0]] * num_directors
+    hi = [b["reflector"][1], b["active"][1], b["spacing"][1]] \
+        + [b["director"][1]] * num_directors + [b["spacing"][1]] * num_directors
+    return np.array(lo), np.array(hi)
+
+def _score_elements(params, element_count, wavelength, radius_m):
+    # params: (P, 3 + 2n) -> (gain, imp, swr, score), her biri (P,)
+    n = element_count - 2
+    act = params[:, 1]
+    spacings = np.concatenate([params[:, 2:3], params[:, 3 + n:3 + 2 * n]], axis=1)
+    directors = params[:, 3:3 + n]
+    gain = estimate_gain_elements_np(element_count, spacings, directors)
+    imp = estimate_impedance_elements_np(act, spacings, wavelength, radius_m)
+    swr = estimate_swr_np(imp)
+    return gain, imp, swr, _score_np(gain, swr)
+
+def optimize_yagi_de(target_freq_mhz, element_count, element_cap_m,
+                     popsize=None, generations=300, mutation=0.7, crossover=0.9,
+                     seed=0, patience=40, tol=1e-10, bounds=None, tracer=None):
+    """
+    Eleman bazlı Yagi optimizasyonu (diferansiyel evrim, rand/1/bin).
+    Her direktör uzunluğu ve her aralık ayrı parametredir (3 + 2*(N-2) serbest parametre);
+    her nesilde tüm popülasyon tek bir NumPy çağrısıyla puanlanır.
+    Dönen sözlükte "directors" ve "director_spacings" metre cinsinden listelerdir;
+    yagi_uda_hesapla'nın direktor_uzunluklari / direktor_mesafeleri parametrelerine
+    doğrudan verilebilir.
+    """
+    return _drain(optimize_yagi_de_iter(
+        target_freq_mhz, element_count, element_cap_m, popsize, generations, mutation,
+        crossover, seed, patience, tol, bounds, tracer))
+
+def de_design_args(result):
+    """
+    optimize_yagi_de sonucunu yagi_uda_hesapla anahtar argümanlarına çevirir.
+    Tüm boylar optimizasyonda kullanılan fiziksel boylardır (kısaltma faktörü uygulanmaz),
+    böylece kurulan tasarım MoM'da optimize edilen yapının aynısıdır.
+    """
+    return {"aktif_uzunluk": result["active"],
+            "reflektor_uzunluk": result["reflector"],
+            "ref_aktif_factor": result["ref_spacing"] / result["wavelength"],
+            "direktor_uzunluklari": result["directors"],
+            "direktor_mesafeleri": result["director_spacings"]}
+
+def optimize_yagi_de_iter(target_freq_mhz, element_count, element_cap_m,
+                          popsize=None, generations=300, mutation=0.7, crossover=0.9,
+                          seed=0, patience=40, tol=1e-10, bounds=None, tracer=None):
+    """
+    optimize_yagi_de'nin artımlı sürümü; her nesilden sonra bir ilerleme sözlüğü üretir
+    (bkz. optimize_yagi_adaptive_iter).
+    tracer: points, generations, improvements (iyileşen birey) sayaçları;
+    mutation/score/selection/result aşamaları.
+    """
+    tracer = tracer or NULL
+    freq_hz = target_freq_mhz * 1e6
+    wavelength = C / freq_hz
+
+    num_directors = element_count - 2
+    if num_directors < 0:
+        return
+
+    radius_m = element_cap_m / 2.0
+    lo, hi = _element_bounds(num_directors, bounds)
+    dim = lo.size
+    if popsize is None:
+        popsize = max(20, 8 * dim)
+    total = popsize * (generations + 1)
+
+    def result(best, evaluations):
+        with tracer.phase("result"):
+            gain, imp, swr, sc = (float(v[0]) for v in _score_elements(best[None, :], element_count, wavelength, radius_m))
+            n = num_directors
+            return {
+                "reflector": float(best[0] * wavelength),
+                "active": float(best[1] * wavelength),
+                "ref_spacing": float(best[2] * wavelength),
+                "directors": [float(v) for v in best[3:3 + n] * wavelength],
+                "director_spacings": [float(v) for v in best[3 + n:3 + 2 * n] * wavelength],
+                "gain": gain,
+                "impedance": imp,
+                "swr": swr,
+                "score": sc,
+                "wavelength": wavelength,
+                "evaluations": evaluations,
+            }
+
+    rng = np.random.default_rng(seed)
+    pop = lo + rng.random((popsize, dim)) * (hi - lo)
+    with tracer.phase("score"):
+        score = _score_elements(pop, element_count, wavelength, radius_m)[3]
+    evaluations = popsize
+    tracer.count("points", popsize)
+
+    best_idx = int(np.argmax(score))
+    best_score = score[best_idx]
+    yield _progress(evaluations, total, result(pop[best_idx], evaluations))
+
+    stall = 0
+    rows = np.arange(popsize)
+    for _ in range(generations):
+        # Her birey için kendisinden farklı üç rastgele birey (r1, r2, r3)
+        with tracer.phase("mutation"):
+            r = np.argsort(rng.random((popsize, popsize - 1)), axis=1)[:, :3]
+            r = r + (r >= rows[:, None])
+            mutant = pop[r[:, 0]] + mutation * (pop[r[:, 1]] - pop[r[:, 2]])
+            mutant = np.clip(mutant, lo, hi)
+
+            cross = rng.random((popsize, dim)) < crossover
+            cross[rows, rng.integers(0, dim, popsize)] = True
+            trial = np.where(cross, mutant, pop)
+
+        with tracer.phase("score"):
+            trial_score = _score_elements(trial, element_count, wavelength, radius_m)[3]
+        evaluations += popsize
+        with tracer.phase("selection"):
+            better = trial_score >= score
+            if tracer:
+                tracer.count("improvements", int(np.count_nonzero(trial_score > score)))
+            pop[better] = trial[better]
+            score[better] = trial_score[better]
+        tracer.count("points", popsize)
+        tracer.count("generations")
+
+        best_idx = int(np.argmax(score))
+        if score[best_idx] > best_score + tol:
+            stall = 0
+        else:
+            stall += 1
+        best_score = max(best_score, score[best_idx])
+        if stall >= patience:
+            break
+        yield _progress(evaluations, total, result(pop[best_idx], evaluations))
+
+    yield _progress(evaluations, evaluations, result(pop[best_idx], evaluations), finished=True)
+
+# Eski skaler döngü (referans yol; parite kontrolü için saklanır)
+def _optimize_yagi_scalar(target_freq_mhz, element_count, step, element_cap_m, tracer=NULL):
     
     freq_hz = target_freq_mhz * 1e6
     wavelength = C / freq_hz
@@ -70,11 +1131,14 @@ def optimize_yagi(target_freq_mhz, element_count, step, element_cap_m):
     best = None
     radius_m = element_cap_m / 2.0 # Çapı yarıçapa çevir
     
-    # Eleman uzunlukları için arama faktörleri (step ile belirlenen hassasiyet)
-    ref_factors = np.arange(0.50 * 1.03 - 2*step, 0.50 * 1.03 + 2*step + step, step)
-    act_factors = np.arange(0.50 - 2*step, 0.50 + 2*step + step, step)
-    dir_factors = np.arange(0.46 - 2*step, 0.46 + 2*step + step, step)
-    spacing_factors = np.arange(0.18 - 2*step, 0.18 + 2*step + step, step)
+    ref_factors, act_factors, dir_factors, spacing_factors = _search_factors(step)
+    improvements = 0 # sayaçlar döngü içinde değil sonda izleyiciye eklenir
+    # İzleme açıkken tahminciler çağrı başına ölçülür (ad başına süre ve çağrı sayısı);
+    # kapalıyken NULL.wrap fonksiyonu olduğu gibi döndürür
+    impedance_fn = tracer.wrap(estimate_impedance)
+    swr_fn = tracer.wrap(estimate_swr)
+    gain_fn = tracer.wrap(estimate_gain)
+    t0 = time.perf_counter()
 
     for rf in ref_factors:
         # Kısaltma faktörünü eleman kalınlığına göre burada hesaplayabiliriz
@@ -88,32 +1152,126 @@ def optimize_yagi(target_freq_mhz, element_count, step, element_cap_m):
                     spacing = sf * wavelength
                     
                     # Empedans tahmini (radius_m kullanıldı)
-                    imp = estimate_impedance(ref_len, act_len, dir_len, spacing, wavelength, radius_m) 
-                    swr = estimate_swr(imp)
+                    imp = impedance_fn(ref_len, act_len, dir_len, spacing, wavelength, radius_m)
+                    swr = swr_fn(imp)
                     
                     # Kazanç tahmini
-                    gain = estimate_gain(element_count, sf) 
+                    gain = gain_fn(element_count, sf)
                     
                     # SWR ceza puanı
                     swr_penalty = 10 * max(0, swr - 1.5) + (swr - 1.0) * 0.5
                     score = gain - swr_penalty
 
                     if (best is None) or (score > best["score"]):
-                        best = {
-                            "reflector": ref_len,
-                            "active": act_len,
-                            "director": dir_len,
-                            "spacing": spacing,
-                            "gain": gain,
-                            "impedance": imp,
-                            "swr": swr,
-                            "score": score,
-                            "wavelength": wavelength
-                        }
+                        best = _best_dict(ref_len, act_len, dir_len, spacing, gain, imp, swr, score, wavelength)
+                        improvements += 1
 
+    tracer.add_time("scalar_loop", time.perf_counter() - t0)
+    tracer.count("points", len(ref_factors) * len(act_factors) * len(dir_factors) * len(spacing_factors))
+    tracer.count("improvements", improvements)
     return best
 
 if __name__ == "__main__":
     # Test çağrısı (2m bandı, 4mm çap)
     result = optimize_yagi(target_freq_mhz=145.0, element_count=3, step=0.005, element_cap_m=0.004) 
-    print("Optimizasyon Sonucu:\n", result)
\ No newline at end of file
+    print("Optimizasyon Sonucu:\n", result)
+
+    # Parite kontrolü: vektörel yol skaler yolla aynı sonucu vermeli
+    ref_result = optimize_yagi(145.0, 6, 0.005, 0.004, vectorized=False)
+    for freq, n, step, cap in [(145.0, 3, 0.005, 0.004), (14.175, 6, 0.002, 0.02),
+                               (435.0, 10, 0.001, 0.003), (1270.0, 2, 0.01, 0.1)]:
+        vec = optimize_yagi(freq, n, step, cap)
+        ref = optimize_yagi(freq, n, step, cap, vectorized=False)
+        assert vec == ref, (freq, n, step, cap, vec, ref)
+        chunked = optimize_yagi(freq, n, step, cap, max_chunk_points=1)
+        assert chunked == ref, (freq, n, step, cap, chunked, ref)
+        parallel = optimize_yagi(freq, n, step, cap, workers=3, max_chunk_points=7)
+        assert parallel == ref, (freq, n, step, cap, parallel, ref)
+    print("Parite kontrolü: OK")
+
+    # Skor çekirdekleri: hepsi referans çekirdekle aynı skorları ve aynı sonucu vermeli
+    tested = check_score_backends()
+    for name in tested:
+        assert optimize_yagi(145.0, 6, 0.005, 0.004, backend=name) == ref_result
+        assert optimize_yagi(145.0, 6, 0.005, 0.004, backend=name, prune=False, max_chunk_points=7) == ref_result
+    print(f"Çekirdek uygunluğu: {', '.join(tested)} OK (otomatik seçim: {score_backend()})")
+
+    # Zamanlama karşılaştırması (step=0.001)
+    for vectorized in (False, True):
+        t0 = time.perf_counter()
+        optimize_yagi(145.0, 5, 0.001, 0.004, vectorized=vectorized)
+        dt = time.perf_counter() - t0
+        print(f"{'vektörel' if vectorized else 'skaler':8s} step=0.001: {dt*1000:.2f} ms")
+
+    # Kaba-ince arama: geniş aralıkta 0.001 çözünürlük, düz gride göre çok daha az nokta
+    t0 = time.perf_counter()
+    adaptive = optimize_yagi_adaptive(145.0, 5, 0.004, dir_range=(0.40, 0.50), final_step=0.001)
+    dt = time.perf_counter() - t0
+    flat_points = 1
+    for lo, hi in DEFAULT_RANGES.values():
+        flat_points *= int(round((hi - lo) / 0.001)) + 1
+    print(f"kaba-ince: skor={adaptive['score']:.4f}, {adaptive['evaluations']} nokta "
+          f"(düz grid: {flat_points}), {dt*1000:.1f} ms")
+    for bad in ({"refine": 0}, {"refine": 1}, {"coarse_points": 1}):
+        try:
+            optimize_yagi_adaptive_iter(145.0, 5, 0.004, **bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(bad)
+
+    # Eleman bazlı diferansiyel evrim (12 eleman: 23 serbest parametre)
+    t0 = time.perf_counter()
+    de = optimize_yagi_de(145.0, 12, 0.004)
+    dt = time.perf_counter() - t0
+    print(f"DE (12 eleman): skor={de['score']:.4f}, SWR={de['swr']:.3f}, "
+          f"{de['evaluations']} değerlendirme, {dt*1000:.1f} ms")
+
+    # DE tasarımı gidiş-dönüş: arayüzün kurduğu tasarım, optimize edilen yapıyla aynı MoM kazancını vermeli
+    from anten_cekirdek import yagi_uda_hesapla
+    from mom_cozucu import evaluate_yagi, solve_design
+    tasarim = yagi_uda_hesapla(145.0, 12, cap_m=0.004, **de_design_args(de))
+    assert tasarim["elemanlar"]["aktif"] == de["active"] and tasarim["elemanlar"]["reflektör"] == de["reflector"]
+    assert tasarim["elemanlar"]["direktörler"] == de["directors"]
+    mom_de = evaluate_yagi(de["reflector"], de["active"], de["directors"],
+                           [de["ref_spacing"]] + list(de["director_spacings"]), 0.002, 145e6)
+    mom_tasarim = solve_design(tasarim)
+    assert abs(mom_tasarim["gain"] - mom_de["gain"]) < 1e-6, (mom_tasarim["gain"], mom_de["gain"])
+    print(f"DE gidiş-dönüş: MoM kazancı {mom_de['gain']:.2f} dBi OK")
+
+    # Pareto cephesi: parçalı tarama, tüm grid üzerinde kaba kuvvet baskınlık testiyle aynı olmalı
+    pr = optimize_yagi_pareto(145.0, 6, 0.004, step=0.01)
+    small = optimize_yagi_pareto(145.0, 6, 0.004, step=0.01, max_chunk_points=1, prune=False)
+    assert [(p["gain"], p["swr"], p["boom"]) for p in small["front"]] == \
+        [(p["gain"], p["swr"], p["boom"]) for p in pr["front"]]
+    axes = [_range_axis(lo, hi, 0.01) for lo, hi in DEFAULT_RANGES.values()]
+    lam = C / 145e6
+    g, z = _metrics_grid(*axes, 6, lam, 0.002)
+    shape = tuple(ax.size for ax in axes)
+    costs = np.column_stack([np.broadcast_to(-g, shape).ravel(), np.broadcast_to(estimate_swr_np(z), shape).ravel(),
+                             np.broadcast_to(5 * axes[3] * lam, shape).ravel()])
+    _, first = np.unique(costs, axis=0, return_index=True)
+    u = costs[np.sort(first)]
+    brute = [i for i in range(len(u)) if not np.any(np.all(u <= u[i], axis=1) & np.any(u < u[i], axis=1))]
+    assert sorted(map(tuple, u[brute])) == sorted((-p["gain"], p["swr"], p["boom"]) for p in pr["front"])
+    score = _score_grid(*axes, 6, lam, 0.002)
+    assert pr["score"] == score.max()
+    t0 = time.perf_counter()
+    big = optimize_yagi_pareto(145.0, 6, 0.004, step=0.002)
+    dt = time.perf_counter() - t0
+    print(f"Pareto: {len(pr['front'])} nokta (step=0.01); step=0.002: "
+          f"{len(big['front'])} nokta / {big['evaluations']:,} puanlanan nokta, {dt*1000:.1f} ms")
+
+    # Dal-sınır: ayrışabilir skor yapısı - budamasız sonuçla aynı, sayaçlar kazancı gösterir
+    lam = C / 145e6
+    axes = [_range_axis(lo, hi, 0.0005) for lo, hi in DEFAULT_RANGES.values()]
+    gain_dims, score_dims = _score_dependencies(axes, 6, lam, 0.002)
+    assert gain_dims == (False, False, False, True) and score_dims == (False, True, False, True)
+    reduced = _collapse_axes(axes, score_dims)
+    n_full = int(np.prod([ax.size for ax in axes]))
+    n_reduced = int(np.prod([ax.size for ax in reduced]))
+    bb_tr = Tracer()
+    bb = _branch_and_bound(reduced, 6, lam, 0.002, gain_dims, tracer=bb_tr)
+    assert bb == _best_in_range((*reduced, 6, lam, 0.002, 0, n_reduced, 1_000_000, False, 0, None))[:2]
+    print(f"dal-sınır (step=0.0005): {n_full:,} nokta -> indirgenmiş {n_reduced:,} -> "
+          f"puanlanan {bb_tr.counters['points']:,} (budanan {bb_tr.counters['pruned']:,})")